@@ -145,6 +145,23 @@ def get_appointment_repo(
     return AppointmentRepository(client=client)
 
 
+_openai_provider: OpenAIProvider | None = None
+
+
+def _get_openai_provider() -> OpenAIProvider:
+    """Return the process-wide OpenAIProvider, creating it on first use.
+
+    Sharing one AsyncOpenAI client keeps its keep-alive connection pool warm
+    across requests instead of paying a new TCP/TLS handshake per request.
+    """
+    global _openai_provider
+    if _openai_provider is None:
+        _openai_provider = OpenAIProvider(
+            api_key=settings.OPENAI_API_KEY, timeout=settings.HTTP_TIMEOUT_SECONDS
+        )
+    return _openai_provider
+
+
 def get_llm_service() -> LLMService:
     """Dependency for LLMService.
 
@@ -163,7 +180,7 @@ def get_llm_service() -> LLMService:
     """
     provider: LLMProvider
     if settings.LLM_PROVIDER == "openai":
-        provider = OpenAIProvider(api_key=settings.OPENAI_API_KEY)
+        provider = _get_openai_provider()
     elif settings.LLM_PROVIDER == "anthropic":
         # Future: import AnthropicProvider when implemented
         # provider = AnthropicProvider(api_key=settings.ANTHROPIC_API_KEY)
@@ -21,6 +21,14 @@ class Settings(BaseSettings):
     # LLM Provider selection (openai or anthropic)
     LLM_PROVIDER: str = "openai"
 
+    # RAG embedding backend (openai, or local for offline dev — see app/rag/local_embeddings.py)
+    EMBEDDING_BACKEND: str = "openai"
+
+    # Outbound HTTP timeout in seconds for the Supabase and OpenAI clients.
+    # Unset keeps each SDK's own default; tests set it low so a call that
+    # escapes its mock fails fast instead of hanging.
+    HTTP_TIMEOUT_SECONDS: float | None = None
+
     # CORS
     ALLOWED_ORIGINS: List[str] = ["*"]
 
@@ -1,4 +1,4 @@
-from supabase import AsyncClient, acreate_client
+from supabase import AsyncClient, AsyncClientOptions, acreate_client
 
 from app.core.config import settings
 
@@ -8,10 +8,19 @@ _client: AsyncClient | None = None
 async def get_client() -> AsyncClient:
     global _client
     if _client is None:
+        options = None
+        if settings.HTTP_TIMEOUT_SECONDS is not None:
+            timeout = settings.HTTP_TIMEOUT_SECONDS
+            options = AsyncClientOptions(
+                postgrest_client_timeout=timeout,
+                storage_client_timeout=timeout,
+                function_client_timeout=timeout,
+            )
         # Service role key bypasses RLS; endpoints enforce user isolation
         # by always filtering queries on the authenticated user_id.
         _client = await acreate_client(
             settings.SUPABASE_URL,
             settings.SUPABASE_SERVICE_KEY,
+            options=options,
         )
     return _client
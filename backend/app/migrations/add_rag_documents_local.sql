@@ -0,0 +1,62 @@
+-- Migration: Add rag_documents_local for offline dev embeddings
+-- Created: 2026-10-16
+-- Purpose: EMBEDDING_BACKEND=local embeds with bge-small-en-v1.5 (384 dims),
+-- which cannot share the 1536-dim rag_documents column. Dev-only: production
+-- never writes to or reads from this table.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS rag_documents_local (
+  id               UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  source_url       TEXT NOT NULL,
+  title            TEXT NOT NULL,
+  source_type      TEXT,
+  publication_date DATE,
+  section_name     TEXT,
+  content          TEXT NOT NULL,
+  embedding        halfvec(384),
+  pmc_id           TEXT NULL,
+  created_at       TIMESTAMPTZ DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_rag_documents_local_embedding
+  ON rag_documents_local USING hnsw (embedding halfvec_cosine_ops);
+
+CREATE INDEX IF NOT EXISTS idx_rag_documents_local_pmc_id
+  ON rag_documents_local(pmc_id) WHERE pmc_id IS NOT NULL;
+
+-- Mirrors match_rag_documents, against the local table and dimension
+CREATE OR REPLACE FUNCTION match_rag_documents_local(
+    query_embedding text,
+    match_count int DEFAULT 5
+)
+RETURNS TABLE (
+    id uuid,
+    content text,
+    title text,
+    source_url text,
+    source_type text,
+    section_name text,
+    similarity float
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    RETURN QUERY
+    SELECT
+        rd.id,
+        rd.content,
+        rd.title,
+        rd.source_url,
+        rd.source_type,
+        rd.section_name,
+        1 - (rd.embedding <=> query_embedding::halfvec(384)) AS similarity
+    FROM rag_documents_local rd
+    ORDER BY rd.embedding <=> query_embedding::halfvec(384)
+    LIMIT match_count;
+END;
+$$;
+
+COMMENT ON TABLE rag_documents_local IS 'Dev-only RAG chunks embedded locally (EMBEDDING_BACKEND=local, bge-small-en-v1.5, 384 dims).';
+
+COMMIT;
@@ -0,0 +1,73 @@
+-- Migration: Store rag_documents embeddings as half-precision vectors
+-- Created: 2026-10-16
+-- Purpose: Halve per-row embedding storage (6 KB -> 3 KB for 1536 dims) and the
+-- bytes the HNSW index touches per similarity comparison. text-embedding-3-small
+-- retrieval quality is unaffected at fp16 precision.
+--
+-- Requires pgvector >= 0.7.0 (halfvec type + halfvec_cosine_ops).
+-- Before rolling out, run scripts/test_rag.py and confirm SAMPLE_QUERY still
+-- returns the same top results with similar scores.
+
+BEGIN;
+
+-- Drop every existing index on the embedding column; they are bound to the old
+-- column type. The original index predates these migrations, so look it up in
+-- pg_indexes rather than guessing its name.
+DO $$
+DECLARE
+    idx record;
+BEGIN
+    FOR idx IN
+        SELECT schemaname, indexname
+        FROM pg_indexes
+        WHERE schemaname = current_schema()
+          AND tablename = 'rag_documents'
+          AND indexdef ~ '\(embedding[\s)]'
+    LOOP
+        EXECUTE format('DROP INDEX %I.%I', idx.schemaname, idx.indexname);
+    END LOOP;
+END;
+$$;
+
+ALTER TABLE rag_documents
+  ALTER COLUMN embedding TYPE halfvec(1536) USING embedding::halfvec(1536);
+
+CREATE INDEX idx_rag_documents_embedding
+  ON rag_documents USING hnsw (embedding halfvec_cosine_ops);
+
+-- Same signature as before (query stays text to avoid PostgREST vector
+-- conversion issues); only the internal cast changes so the HNSW index is used.
+CREATE OR REPLACE FUNCTION match_rag_documents(
+    query_embedding text,
+    match_count int DEFAULT 5
+)
+RETURNS TABLE (
+    id uuid,
+    content text,
+    title text,
+    source_url text,
+    source_type text,
+    section_name text,
+    similarity float
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    RETURN QUERY
+    SELECT
+        rd.id,
+        rd.content,
+        rd.title,
+        rd.source_url,
+        rd.source_type,
+        rd.section_name,
+        1 - (rd.embedding <=> query_embedding::halfvec(1536)) AS similarity
+    FROM rag_documents rd
+    ORDER BY rd.embedding <=> query_embedding::halfvec(1536)
+    LIMIT match_count;
+END;
+$$;
+
+COMMENT ON COLUMN rag_documents.embedding IS 'text-embedding-3-small vector stored at half precision (halfvec).';
+
+COMMIT;
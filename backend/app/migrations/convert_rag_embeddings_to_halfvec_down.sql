@@ -0,0 +1,63 @@
+-- Rollback: restore full-precision vector embeddings on rag_documents
+-- Reverses convert_rag_embeddings_to_halfvec.sql. Values keep their fp16
+-- precision; re-run ingestion if full-precision embeddings are required.
+
+BEGIN;
+
+-- Drop every index on the embedding column; they are bound to the halfvec type.
+DO $$
+DECLARE
+    idx record;
+BEGIN
+    FOR idx IN
+        SELECT schemaname, indexname
+        FROM pg_indexes
+        WHERE schemaname = current_schema()
+          AND tablename = 'rag_documents'
+          AND indexdef ~ '\(embedding[\s)]'
+    LOOP
+        EXECUTE format('DROP INDEX %I.%I', idx.schemaname, idx.indexname);
+    END LOOP;
+END;
+$$;
+
+ALTER TABLE rag_documents
+  ALTER COLUMN embedding TYPE vector(1536) USING embedding::vector(1536);
+
+CREATE INDEX idx_rag_documents_embedding
+  ON rag_documents USING hnsw (embedding vector_cosine_ops);
+
+CREATE OR REPLACE FUNCTION match_rag_documents(
+    query_embedding text,
+    match_count int DEFAULT 5
+)
+RETURNS TABLE (
+    id uuid,
+    content text,
+    title text,
+    source_url text,
+    source_type text,
+    section_name text,
+    similarity float
+)
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    RETURN QUERY
+    SELECT
+        rd.id,
+        rd.content,
+        rd.title,
+        rd.source_url,
+        rd.source_type,
+        rd.section_name,
+        1 - (rd.embedding <=> query_embedding::vector) AS similarity
+    FROM rag_documents rd
+    ORDER BY rd.embedding <=> query_embedding::vector
+    LIMIT match_count;
+END;
+$$;
+
+COMMENT ON COLUMN rag_documents.embedding IS NULL;
+
+COMMIT;
@@ -1,7 +1,8 @@
 """RAG document ingestion pipeline.
 
 Handles chunking source documents, generating OpenAI embeddings,
-and storing them in the pgvector-enabled rag_documents table in Supabase.
+and storing them in the pgvector-enabled rag_documents table in Supabase
+(embedding column is halfvec(1536), i.e. half precision).
 
 Supports both insert (for new documents) and upsert (for updates/deduplication
 based on source-specific identifiers like pmc_id).
@@ -12,12 +13,19 @@ Cost reference: text-embedding-3-small is $0.02 per 1M tokens (~$0.00002 per 1K
 import asyncio
 import logging
 import re
+from collections.abc import Iterator
 from datetime import date
 
-from openai import AsyncOpenAI
+from openai import NOT_GIVEN, AsyncOpenAI
 
 from app.core.config import settings
 from app.core.supabase import get_client
+from app.rag.local_embeddings import (
+    LOCAL_DOCUMENTS_TABLE,
+    LOCAL_EMBEDDING_MODEL,
+    embed_local,
+    use_local_embeddings,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -25,21 +33,30 @@ _EMBEDDING_MODEL = "text-embedding-3-small"
 _EMBEDDING_DIMENSIONS = 1536
 _MAX_BATCH_SIZE = 100
 _COST_PER_1K_TOKENS = 0.00002  # text-embedding-3-small pricing
+# rag_documents.embedding is halfvec (fp16, ~3.3 significant digits), so
+# sending more digits than this only inflates the insert payload.
+_HALFVEC_LITERAL_FORMAT = ".5g"
 
 
 def _openai_client() -> AsyncOpenAI:
-    return AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    return AsyncOpenAI(
+        api_key=settings.OPENAI_API_KEY,
+        timeout=settings.HTTP_TIMEOUT_SECONDS or NOT_GIVEN,
+    )
 
 
-def chunk_document(
+def iter_chunks(
     text: str,
     title: str,
     source_url: str,
     chunk_size: int = 500,
     overlap: int = 50,
     section_name: str | None = None,
-) -> list[dict]:
-    """Split a document into overlapping chunks for embedding.
+) -> Iterator[dict]:
+    """Yield overlapping chunks of a document as soon as each one is complete.
+
+    Generator form of chunk_document(), so callers can start embedding the
+    first chunks while later ones are still being produced.
 
     Uses approximate token counting (1 token ≈ 4 chars) with a sliding window
     and tries to break on sentence boundaries to preserve coherent context.
@@ -52,9 +69,9 @@ def chunk_document(
         overlap: Overlap between adjacent chunks in approximate tokens (default 50).
         section_name: Optional section name within the document.
 
-    Returns:
-        List of chunk dicts with keys: content, title, source_url,
-        section_name, chunk_index.
+    Yields:
+        Chunk dicts with keys: content, title, source_url, section_name,
+        chunk_index.
     """
     chunk_chars = chunk_size * 4
     overlap_chars = overlap * 4
@@ -63,7 +80,7 @@ def chunk_document(
     sentences = re.split(r"(?<=[.!?])\s+", text.strip())
     sentences = [s.strip() for s in sentences if s.strip()]
 
-    chunks: list[dict] = []
+    chunk_index = 0
     current: list[str] = []
     current_len = 0
 
@@ -72,27 +89,27 @@ def chunk_document(
 
         if current_len + s_len > chunk_chars and current:
             # Emit the current chunk
-            chunks.append(
-                {
-                    "content": " ".join(current),
-                    "title": title,
-                    "source_url": source_url,
-                    "section_name": section_name,
-                    "chunk_index": len(chunks),
-                }
-            )
+            yield {
+                "content": " ".join(current),
+                "title": title,
+                "source_url": source_url,
+                "section_name": section_name,
+                "chunk_index": chunk_index,
+            }
+            chunk_index += 1
 
-            # Carry over trailing sentences that fit within the overlap window
-            overlap_carry: list[str] = []
+            # Carry over trailing sentences that fit within the overlap window:
+            # walk back to the first sentence that fits, then slice once
+            carry_start = len(current)
             carry_len = 0
-            for s in reversed(current):
-                if carry_len + len(s) + 1 <= overlap_chars:
-                    overlap_carry.insert(0, s)
-                    carry_len += len(s) + 1
-                else:
+            while carry_start > 0:
+                prev_len = len(current[carry_start - 1]) + 1
+                if carry_len + prev_len > overlap_chars:
                     break
+                carry_start -= 1
+                carry_len += prev_len
 
-            current = overlap_carry
+            current = current[carry_start:]
             current_len = carry_len
 
         current.append(sentence)
@@ -100,15 +117,49 @@ def chunk_document(
 
     # Flush any remaining content as the final chunk
     if current:
-        chunks.append(
-            {
-                "content": " ".join(current),
-                "title": title,
-                "source_url": source_url,
-                "section_name": section_name,
-                "chunk_index": len(chunks),
-            }
+        yield {
+            "content": " ".join(current),
+            "title": title,
+            "source_url": source_url,
+            "section_name": section_name,
+            "chunk_index": chunk_index,
+        }
+
+
+def chunk_document(
+    text: str,
+    title: str,
+    source_url: str,
+    chunk_size: int = 500,
+    overlap: int = 50,
+    section_name: str | None = None,
+) -> list[dict]:
+    """Split a document into overlapping chunks for embedding.
+
+    Collects iter_chunks() into a list; see it for the chunking strategy.
+
+    Args:
+        text: Full document text to chunk.
+        title: Document title stored as metadata on each chunk.
+        source_url: Source URL stored as metadata on each chunk.
+        chunk_size: Target chunk size in approximate tokens (default 500).
+        overlap: Overlap between adjacent chunks in approximate tokens (default 50).
+        section_name: Optional section name within the document.
+
+    Returns:
+        List of chunk dicts with keys: content, title, source_url,
+        section_name, chunk_index.
+    """
+    chunks = list(
+        iter_chunks(
+            text=text,
+            title=title,
+            source_url=source_url,
+            chunk_size=chunk_size,
+            overlap=overlap,
+            section_name=section_name,
         )
+    )
 
     logger.info(
         "Chunked '%s' into %d chunks (size=%d tokens, overlap=%d tokens)",
@@ -124,7 +175,8 @@ async def generate_embeddings(texts: list[str]) -> list[list[float]]:
     """Generate embeddings for a list of texts using text-embedding-3-small.
 
     Batches requests in groups of up to 100 and retries with exponential backoff
-    on transient API failures.
+    on transient API failures. With EMBEDDING_BACKEND=local, embeds on-device
+    instead (384 dims; see app/rag/local_embeddings.py).
 
     Args:
         texts: List of text strings to embed.
@@ -137,6 +189,15 @@ async def generate_embeddings(texts: list[str]) -> list[list[float]]:
     if not texts:
         return []
 
+    if use_local_embeddings():
+        embeddings = await embed_local(texts)
+        logger.info(
+            "Generated %d local embeddings (model=%s)",
+            len(embeddings),
+            LOCAL_EMBEDDING_MODEL,
+        )
+        return embeddings
+
     client = _openai_client()
     all_embeddings: list[list[float]] = []
     total_tokens = 0
@@ -237,7 +298,9 @@ async def store_chunks(
     rows = []
     for chunk, embedding in zip(chunks, embeddings):
         # pgvector expects a text literal in the form "[x1,x2,...,xN]"
-        vector_str = "[" + ",".join(str(x) for x in embedding) + "]"
+        vector_str = (
+            "[" + ",".join(format(x, _HALFVEC_LITERAL_FORMAT) for x in embedding) + "]"
+        )
         row: dict = {
             "source_url": chunk["source_url"],
             "title": chunk["title"],
@@ -259,22 +322,20 @@ async def store_chunks(
             row["publication_date"] = publication_date.isoformat()
         rows.append(row)
 
+    # Local dev embeddings have a different dimension and live in their own table
+    table = LOCAL_DOCUMENTS_TABLE if use_local_embeddings() else "rag_documents"
+
     client = await get_client()
     try:
         if source_id is not None and source_id_field is not None:
             # For source-based deduplication, delete old chunks first then insert new ones.
             # This avoids "ON CONFLICT DO UPDATE command cannot affect row a second time"
             # error when upserting multiple chunks from the same source.
-            await (
-                client.from_("rag_documents")
-                .delete()
-                .eq(source_id_field, source_id)
-                .execute()
-            )
+            await client.from_(table).delete().eq(source_id_field, source_id).execute()
             logger.info("Deleted old chunks with %s=%s", source_id_field, source_id)
 
             # Now insert new chunks
-            await client.from_("rag_documents").insert(rows).execute()
+            await client.from_(table).insert(rows).execute()
             logger.info(
                 "Inserted %d chunks from '%s' (source_type=%s, %s=%s)",
                 len(rows),
@@ -285,7 +346,7 @@ async def store_chunks(
             )
         else:
             # Use INSERT for new documents (no deduplication)
-            await client.from_("rag_documents").insert(rows).execute()
+            await client.from_(table).insert(rows).execute()
             logger.info(
                 "Stored %d chunks from '%s' (source_type=%s)",
                 len(rows),
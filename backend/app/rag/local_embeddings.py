@@ -0,0 +1,76 @@
+"""Local sentence-transformers embeddings for offline RAG development.
+
+Enabled with EMBEDDING_BACKEND=local. Embeds on-device with bge-small-en-v1.5
+instead of calling OpenAI, so scripts/test_rag.py and ingestion runs need no
+OPENAI_API_KEY and skip the network round-trip per batch.
+
+The model produces 384-dim vectors, which cannot share the 1536-dim
+rag_documents column. Local vectors are stored in rag_documents_local and
+searched with match_rag_documents_local
+(see migrations/add_rag_documents_local.sql). Never mix the two: a
+production deployment must keep EMBEDDING_BACKEND=openai.
+"""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+logger = logging.getLogger(__name__)
+
+LOCAL_EMBEDDING_MODEL = "BAAI/bge-small-en-v1.5"
+LOCAL_EMBEDDING_DIMENSIONS = 384
+LOCAL_DOCUMENTS_TABLE = "rag_documents_local"
+LOCAL_MATCH_FUNCTION = "match_rag_documents_local"
+
+_model: "SentenceTransformer | None" = None
+
+
+def use_local_embeddings() -> bool:
+    """Return True when the dev-only local embedding backend is selected."""
+    return settings.EMBEDDING_BACKEND == "local"
+
+
+def _get_model() -> "SentenceTransformer":
+    global _model
+    if _model is None:
+        # Imported lazily: sentence-transformers pulls in torch, which the API
+        # process never needs when embeddings come from OpenAI.
+        from sentence_transformers import SentenceTransformer
+
+        logger.info("Loading local embedding model %s", LOCAL_EMBEDDING_MODEL)
+        _model = SentenceTransformer(LOCAL_EMBEDDING_MODEL)
+    return _model
+
+
+async def embed_local(texts: list[str]) -> list[list[float]]:
+    """Embed texts on-device with the local model.
+
+    Encoding is CPU-bound, so it runs in a worker thread to keep the event
+    loop responsive.
+
+    Args:
+        texts: Text strings to embed.
+
+    Returns:
+        List of 384-dimensional, L2-normalized embedding vectors.
+
+    Raises:
+        ValueError: If the model returns vectors of another dimension, which
+            rag_documents_local could not store.
+    """
+    if not texts:
+        return []
+    model = _get_model()
+    vectors = await asyncio.to_thread(model.encode, texts, normalize_embeddings=True)
+    embeddings = vectors.tolist()
+    if embeddings and len(embeddings[0]) != LOCAL_EMBEDDING_DIMENSIONS:
+        raise ValueError(
+            f"{LOCAL_EMBEDDING_MODEL} returned {len(embeddings[0])}-dim vectors, "
+            f"expected {LOCAL_EMBEDDING_DIMENSIONS}"
+        )
+    return embeddings
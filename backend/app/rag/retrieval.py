@@ -3,7 +3,8 @@
 Retrieves relevant document chunks using pgvector semantic search via the
 match_rag_documents Supabase RPC function. The function accepts the query
 embedding as text (to avoid PostgREST vector type-conversion issues) and
-casts to vector internally.
+casts to halfvec internally, matching the half-precision embedding column
+(see migrations/convert_rag_embeddings_to_halfvec.sql).
 
     CREATE OR REPLACE FUNCTION match_rag_documents(
         query_embedding text,
@@ -29,9 +30,9 @@ casts to vector internally.
             rd.source_url,
             rd.source_type,
             rd.section_name,
-            1 - (rd.embedding <=> query_embedding::vector) AS similarity
+            1 - (rd.embedding <=> query_embedding::halfvec(1536)) AS similarity
         FROM rag_documents rd
-        ORDER BY rd.embedding <=> query_embedding::vector
+        ORDER BY rd.embedding <=> query_embedding::halfvec(1536)
         LIMIT match_count;
     END;
     $$;
@@ -39,10 +40,16 @@ casts to vector internally.
 
 import logging
 
-from openai import AsyncOpenAI
+from openai import NOT_GIVEN, AsyncOpenAI
 
 from app.core.config import settings
 from app.core.supabase import get_client
+from app.rag.local_embeddings import (
+    LOCAL_EMBEDDING_MODEL,
+    LOCAL_MATCH_FUNCTION,
+    embed_local,
+    use_local_embeddings,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -65,8 +72,19 @@ _EMBEDDING_MODEL = "text-embedding-3-small"
 _MIN_SIMILARITY = 0.25
 
 
+_openai: AsyncOpenAI | None = None
+
+
 def _openai_client() -> AsyncOpenAI:
-    return AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    # Reuse one client per process so query embeddings ride on pooled
+    # keep-alive connections rather than a fresh TLS handshake per request.
+    global _openai
+    if _openai is None:
+        _openai = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            timeout=settings.HTTP_TIMEOUT_SECONDS or NOT_GIVEN,
+        )
+    return _openai
 
 
 def _normalize_query(query: str) -> str:
@@ -88,7 +106,9 @@ async def retrieve_relevant_chunks(
     """Find the most relevant knowledge base chunks for a user query.
 
     Embeds the query with OpenAI, then calls the match_rag_documents pgvector
-    function via Supabase RPC to find the top-k most similar chunks.
+    function via Supabase RPC to find the top-k most similar chunks. With
+    EMBEDDING_BACKEND=local, embeds on-device and searches the local dev table
+    via match_rag_documents_local instead.
 
     Chunks with a semantic similarity below min_similarity are excluded to
     prevent marginally related documents from being cited by the LLM.
@@ -103,35 +123,49 @@ async def retrieve_relevant_chunks(
         section_name, similarity. Empty list if no documents meet the relevance
         threshold.
     """
-    openai = _openai_client()
     query = _normalize_query(query)
 
-    logger.info("RAG: Embedding query (model=%s): '%s'", _EMBEDDING_MODEL, query[:100])
-    try:
-        response = await openai.embeddings.create(model=_EMBEDDING_MODEL, input=query)
-    except Exception:
-        logger.exception(
-            "RAG: OpenAI embedding call failed for query: '%s'", query[:100]
+    if use_local_embeddings():
+        logger.info(
+            "RAG: Embedding query locally (model=%s): '%s'",
+            LOCAL_EMBEDDING_MODEL,
+            query[:100],
         )
-        raise
-    query_embedding: list[float] = response.data[0].embedding
+        [query_embedding] = await embed_local([query])
+        match_function = LOCAL_MATCH_FUNCTION
+    else:
+        openai = _openai_client()
+        logger.info(
+            "RAG: Embedding query (model=%s): '%s'", _EMBEDDING_MODEL, query[:100]
+        )
+        try:
+            response = await openai.embeddings.create(
+                model=_EMBEDDING_MODEL, input=query
+            )
+        except Exception:
+            logger.exception(
+                "RAG: OpenAI embedding call failed for query: '%s'", query[:100]
+            )
+            raise
+        query_embedding = response.data[0].embedding
+        match_function = "match_rag_documents"
     logger.debug("RAG: Embedding generated, dimensions=%d", len(query_embedding))
 
     # Call pgvector similarity search via Supabase RPC
     # The function accepts text and casts to vector internally to avoid
     # PostgREST type-conversion issues with the vector type.
-    logger.info("RAG: Calling match_rag_documents RPC (top_k=%d)", top_k)
+    logger.info("RAG: Calling %s RPC (top_k=%d)", match_function, top_k)
     supabase = await get_client()
     try:
         result = await supabase.rpc(
-            "match_rag_documents",
+            match_function,
             {
                 "query_embedding": str(query_embedding),
                 "match_count": top_k,
             },
         ).execute()
     except Exception:
-        logger.exception("RAG: Supabase RPC match_rag_documents failed")
+        logger.exception("RAG: Supabase RPC %s failed", match_function)
         raise
 
     chunks: list[dict] = result.data or []
@@ -153,7 +187,9 @@ async def retrieve_relevant_chunks(
             c.get("similarity", 0.0),
         )
 
-    # Filter by minimum semantic similarity
+    # Filter by minimum semantic similarity. Scoring and ranking already happen
+    # in pgvector (HNSW search, ORDER BY distance), so candidates arrive sorted
+    # and at most top_k long; no embeddings are fetched or re-scored here.
     before_count = len(chunks)
     chunks = [c for c in chunks if c.get("similarity", 0.0) >= min_similarity]
 
@@ -126,6 +126,7 @@ class ProvidersRepository:
             zip_code,
             nams_only,
             provider_type,
+            insurance,
             page,
             page_size,
         )
@@ -89,14 +89,15 @@ class AskMenoService:
         """Process an Ask Meno question with RAG grounding.
 
         Orchestrates:
-        1. Fetch user context and symptom summary
-        2. Load existing conversation for storage continuity
-        3. Retrieve and deduplicate RAG chunks
-        4. Build LLM prompt with context
-        5. Call LLM
-        6. Sanitize and extract citations
-        7. Persist updated conversation
-        8. Return typed response
+        1. Start RAG retrieval in the background
+        2. Fetch user context, symptom summary, and optional enrichment data
+        3. Load existing conversation for storage continuity
+        4. Await and deduplicate RAG chunks
+        5. Build LLM prompt with context
+        6. Call LLM
+        7. Sanitize and extract citations
+        8. Persist updated conversation
+        9. Return typed response
 
         Args:
             user_id: Authenticated user ID.
@@ -109,110 +110,31 @@ class AskMenoService:
         Raises:
             DatabaseError: User context, symptom summary, conversation load, or save fails.
         """
-        # Fetch user context and symptom summary
+        # RAG retrieval only needs the message, so its embedding + pgvector
+        # round-trips run alongside every DB read below and are awaited last.
+        retrieval = asyncio.create_task(self._retrieve_chunks(user_id, message))
         try:
-            journey_stage, age = await self.user_repo.get_context(user_id)
-        except Exception as exc:
-            logger.error(
-                "Failed to fetch user context: user=%s error=%s",
-                hash_user_id(user_id),
-                exc,
-                exc_info=True,
+            journey_stage, age, symptom_summary = await self._fetch_required_context(
+                user_id
             )
-            raise DatabaseError("Failed to fetch user context") from exc
-
-        try:
-            symptom_summary = await self.symptoms_repo.get_summary(user_id)
-        except Exception as exc:
-            logger.error(
-                "Failed to fetch symptom summary: user=%s error=%s",
-                hash_user_id(user_id),
-                exc,
-                exc_info=True,
-            )
-            raise DatabaseError("Failed to fetch symptom summary") from exc
-
-        # Fetch optional enrichment data concurrently — all are supplementary
-        cycle_context: dict | None = None
-        has_uterus: bool | None = None
-        medication_context: MedicationContext | None = None
-
-        gather_coros = []
-        gather_keys = []
-
-        if self.period_repo is not None:
-            gather_coros.append(self.period_repo.get_cycle_analysis(user_id))
-            gather_keys.append("analysis")
-            gather_coros.append(self.user_repo.get_settings(user_id))
-            gather_keys.append("settings")
-
-        if self.medication_service is not None:
-            gather_coros.append(self.medication_service.get_context_if_enabled(user_id))
-            gather_keys.append("medications")
-
-        if gather_coros:
-            try:
-                results = await asyncio.gather(*gather_coros, return_exceptions=True)
-                result_map = dict(zip(gather_keys, results))
-
-                settings_result = result_map.get("settings")
-                if settings_result is not None and not isinstance(
-                    settings_result, Exception
-                ):
-                    has_uterus = settings_result.has_uterus
-
-                analysis_result = result_map.get("analysis")
-                if analysis_result is not None and not isinstance(
-                    analysis_result, Exception
-                ):
-                    cycle_context = {
-                        "average_cycle_length": analysis_result.average_cycle_length,
-                        "months_since_last_period": analysis_result.months_since_last_period,
-                        "inferred_stage": analysis_result.inferred_stage,
-                    }
-
-                med_result = result_map.get("medications")
-                if med_result is not None and not isinstance(med_result, Exception):
-                    medication_context = med_result
-            except Exception:
-                pass  # Supplementary data — degrade gracefully
-
-        # Load existing conversation messages (for storage continuity — not sent to LLM)
-        existing_messages: list[dict] = []
-        if conversation_id is not None:
-            existing_messages = await self.conversation_repo.load(
-                conversation_id, user_id
-            )
-
-        # RAG retrieval
-        logger.info(
-            "RAG: Starting retrieval for user=%s query_len=%d",
-            hash_user_id(user_id),
-            safe_len(message),
-        )
-        try:
-            chunks = await self.rag_retriever(message, top_k=5)
-            if chunks:
-                logger.info(
-                    "RAG: Success — %d chunks retrieved for user=%s",
-                    len(chunks),
-                    hash_user_id(user_id),
-                )
-            else:
-                logger.warning(
-                    "RAG: Empty result for user=%s query_len=%d — response will have no source grounding",
-                    hash_user_id(user_id),
-                    safe_len(message),
+            (
+                cycle_context,
+                has_uterus,
+                medication_context,
+            ) = await self._fetch_enrichment(user_id)
+
+            # Load existing conversation messages (for storage continuity — not sent to LLM)
+            existing_messages: list[dict] = []
+            if conversation_id is not None:
+                existing_messages = await self.conversation_repo.load(
+                    conversation_id, user_id
                 )
-        except Exception as exc:
-            logger.error(
-                "RAG: Retrieval failed for user=%s query_len=%d: %s",
-                hash_user_id(user_id),
-                safe_len(message),
-                exc,
-                exc_info=True,
-            )
-            chunks = []  # Degrade gracefully — answer without sources
+        except BaseException:
+            # The request is failing; don't leave an embedding call running.
+            retrieval.cancel()
+            raise
+
+        chunks = await retrieval
 
         # Deduplicate chunks by URL+section (keep first occurrence of each unique pair)
         seen_url_sections: set[tuple[str, str]] = set()
@@ -334,6 +256,121 @@ class AskMenoService:
             conversation_id=saved_conversation_id,
         )
 
+    async def _fetch_required_context(
+        self, user_id: str
+    ) -> tuple[str, int | None, str]:
+        """Fetch the user context and symptom summary the prompt cannot do without.
+
+        Raises:
+            DatabaseError: Either fetch fails.
+        """
+        context_result, summary_result = await asyncio.gather(
+            self.user_repo.get_context(user_id),
+            self.symptoms_repo.get_summary(user_id),
+            return_exceptions=True,
+        )
+
+        if isinstance(context_result, BaseException):
+            logger.error(
+                "Failed to fetch user context: user=%s error=%s",
+                hash_user_id(user_id),
+                context_result,
+                exc_info=context_result,
+            )
+            raise DatabaseError("Failed to fetch user context") from context_result
+        journey_stage, age = context_result
+
+        if isinstance(summary_result, BaseException):
+            logger.error(
+                "Failed to fetch symptom summary: user=%s error=%s",
+                hash_user_id(user_id),
+                summary_result,
+                exc_info=summary_result,
+            )
+            raise DatabaseError("Failed to fetch symptom summary") from summary_result
+        return journey_stage, age, summary_result
+
+    async def _fetch_enrichment(
+        self, user_id: str
+    ) -> tuple[dict | None, bool | None, MedicationContext | None]:
+        """Fetch optional cycle, settings, and medication context, degrading to None."""
+        cycle_context: dict | None = None
+        has_uterus: bool | None = None
+        medication_context: MedicationContext | None = None
+
+        gather_coros = []
+        gather_keys = []
+
+        if self.period_repo is not None:
+            gather_coros.append(self.period_repo.get_cycle_analysis(user_id))
+            gather_keys.append("analysis")
+            gather_coros.append(self.user_repo.get_settings(user_id))
+            gather_keys.append("settings")
+
+        if self.medication_service is not None:
+            gather_coros.append(self.medication_service.get_context_if_enabled(user_id))
+            gather_keys.append("medications")
+
+        if gather_coros:
+            try:
+                results = await asyncio.gather(*gather_coros, return_exceptions=True)
+                result_map = dict(zip(gather_keys, results))
+
+                settings_result = result_map.get("settings")
+                if settings_result is not None and not isinstance(
+                    settings_result, Exception
+                ):
+                    has_uterus = settings_result.has_uterus
+
+                analysis_result = result_map.get("analysis")
+                if analysis_result is not None and not isinstance(
+                    analysis_result, Exception
+                ):
+                    cycle_context = {
+                        "average_cycle_length": analysis_result.average_cycle_length,
+                        "months_since_last_period": analysis_result.months_since_last_period,
+                        "inferred_stage": analysis_result.inferred_stage,
+                    }
+
+                med_result = result_map.get("medications")
+                if med_result is not None and not isinstance(med_result, Exception):
+                    medication_context = med_result
+            except Exception:
+                pass  # Supplementary data — degrade gracefully
+        return cycle_context, has_uterus, medication_context
+
+    async def _retrieve_chunks(self, user_id: str, message: str) -> list[dict]:
+        """Retrieve RAG chunks for a question, degrading to [] on failure."""
+        logger.info(
+            "RAG: Starting retrieval for user=%s query_len=%d",
+            hash_user_id(user_id),
+            safe_len(message),
+        )
+        try:
+            chunks = await self.rag_retriever(message, top_k=5)
+            if chunks:
+                logger.info(
+                    "RAG: Success — %d chunks retrieved for user=%s",
+                    len(chunks),
+                    hash_user_id(user_id),
+                )
+            else:
+                logger.warning(
+                    "RAG: Empty result for user=%s query_len=%d — response will have no source grounding",
+                    hash_user_id(user_id),
+                    safe_len(message),
+                )
+        except Exception as exc:
+            logger.error(
+                "RAG: Retrieval failed for user=%s query_len=%d: %s",
+                hash_user_id(user_id),
+                safe_len(message),
+                exc,
+                exc_info=True,
+            )
+            return []  # Degrade gracefully — answer without sources
+        return chunks
+
     # ---------------------------------------------------------------------------
     # get_suggested_prompts()
     # ---------------------------------------------------------------------------
@@ -8,6 +8,7 @@ Handles PDF and CSV export flows:
 Routes become thin wrappers that call one method and return the result.
 """
 
+import asyncio
 import csv
 import logging
 from datetime import date, datetime
@@ -65,7 +66,8 @@ class ExportService:
         1. Validate date range
         2. Fetch symptom logs
         3. Calculate statistics
-        4. Call LLM for summary and provider questions
+        4. Call LLM for summary and provider questions (concurrently with
+           the medication lookup)
         5. Build PDF via PdfService
         6. Upload to Supabase Storage
         7. Record export (non-critical)
@@ -108,39 +110,32 @@ class ExportService:
             len(coocc_pairs),
         )
 
-        try:
-            ai_summary = await self.llm_service.generate_symptom_summary(
+        # The two LLM calls and the medication lookup are independent, so run
+        # them concurrently instead of paying each round-trip in turn
+        summary_result, questions_result, current_medications = await asyncio.gather(
+            self.llm_service.generate_symptom_summary(
                 freq_stats,
                 coocc_pairs,
                 (export_params.date_range_start, export_params.date_range_end),
-            )
-            questions = await self.llm_service.generate_provider_questions(
-                freq_stats, coocc_pairs
-            )
-        except Exception as exc:
-            logger.error(
-                "LLM call failed for PDF export: user=%s error=%s",
-                hash_user_id(user_id),
-                exc,
-                exc_info=True,
-            )
-            raise DatabaseError("Failed to generate AI content for the report") from exc
-
-        # Fetch medications active during the export range — supplementary, degrade gracefully
-        current_medications: list = []
-        if self.medication_service is not None:
-            try:
-                current_medications = await self.medication_service.list_active_during(
-                    user_id,
-                    export_params.date_range_start,
-                    export_params.date_range_end,
-                )
-            except Exception as exc:
-                logger.warning(
-                    "Failed to fetch medications for PDF export: user=%s error=%s",
+            ),
+            self.llm_service.generate_provider_questions(freq_stats, coocc_pairs),
+            self._list_medications_safe(user_id, export_params),
+            return_exceptions=True,
+        )
+
+        for llm_result in (summary_result, questions_result):
+            if isinstance(llm_result, Exception):
+                logger.error(
+                    "LLM call failed for PDF export: user=%s error=%s",
                     hash_user_id(user_id),
-                    exc,
+                    llm_result,
+                    exc_info=llm_result,
                 )
+                raise DatabaseError(
+                    "Failed to generate AI content for the report"
+                ) from llm_result
+        ai_summary = summary_result
+        questions = questions_result
 
         try:
             pdf_bytes = self.pdf_service.build_export_pdf(
@@ -346,6 +341,28 @@ class ExportService:
         except Exception:
             return logged_at[:10]
 
+    async def _list_medications_safe(
+        self,
+        user_id: str,
+        export_params: ExportRequest,
+    ) -> list:
+        """Fetch medications active during the export range, [] on failure (supplementary)."""
+        if self.medication_service is None:
+            return []
+        try:
+            return await self.medication_service.list_active_during(
+                user_id,
+                export_params.date_range_start,
+                export_params.date_range_end,
+            )
+        except Exception as exc:
+            logger.warning(
+                "Failed to fetch medications for PDF export: user=%s error=%s",
+                hash_user_id(user_id),
+                exc,
+            )
+            return []
+
     async def _record_export_safe(
         self,
         user_id: str,
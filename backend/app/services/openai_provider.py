@@ -6,7 +6,7 @@ without changing calling code.
 """
 
 import logging
-from openai import AsyncOpenAI
+from openai import NOT_GIVEN, AsyncOpenAI
 
 from app.services.llm_base import LLMProvider
 from app.utils.retry import retry_transient
@@ -24,14 +24,15 @@ class OpenAIProvider(LLMProvider):
     is cost-effective. For production with higher accuracy needs, switch to gpt-4o.
     """
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, timeout: float | None = None):
         """Initialize with OpenAI API key.
 
         Args:
             api_key: OpenAI API key (e.g., sk-...). Should be kept secret.
                 Load from environment variables (OPENAI_API_KEY).
+            timeout: Request timeout in seconds. None keeps the SDK default.
         """
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = AsyncOpenAI(api_key=api_key, timeout=timeout or NOT_GIVEN)
         self.model = "gpt-4o"  # Cost-effective for development
 
     @retry_transient(max_attempts=3, initial_wait=1, max_wait=10)
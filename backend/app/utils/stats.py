@@ -5,9 +5,11 @@ are responsible for fetching raw logs and the symptoms_reference lookup before
 calling these functions.
 """
 
+import heapq
 import itertools
 import logging
 from collections import Counter
+from operator import itemgetter
 
 from app.models.symptoms import SymptomFrequency, SymptomPair
 
@@ -41,28 +43,28 @@ def calculate_frequency_stats(
         List of :class:`SymptomFrequency` objects sorted by count descending.
     """
     counts: Counter[str] = Counter(
-        sid for row in logs for sid in (row.get("symptoms") or [])
+        itertools.chain.from_iterable(row.get("symptoms") or () for row in logs)
     )
 
-    stats: list[SymptomFrequency] = []
-    for symptom_id, count in counts.most_common():
-        ref = symptoms_reference.get(symptom_id)
-        if ref:
-            stats.append(
-                SymptomFrequency(
-                    symptom_id=symptom_id,
-                    symptom_name=ref["name"],
-                    category=ref["category"],
-                    count=count,
-                )
-            )
-        else:
+    ranked = counts.most_common()
+    for symptom_id, _ in ranked:
+        if symptom_id not in symptoms_reference:
             logger.warning(
                 "Symptom ID %s not found in symptoms_reference (data integrity issue)",
                 symptom_id,
             )
 
-    return stats
+    # Fields are DB strings and counts computed here, so skip re-validation
+    return [
+        SymptomFrequency.model_construct(
+            symptom_id=symptom_id,
+            symptom_name=symptoms_reference[symptom_id]["name"],
+            category=symptoms_reference[symptom_id]["category"],
+            count=count,
+        )
+        for symptom_id, count in ranked
+        if symptom_id in symptoms_reference
+    ]
 
 
 def calculate_cooccurrence_stats(
@@ -80,8 +82,9 @@ def calculate_cooccurrence_stats(
     single-symptom logs are ignored. Returns at most ``MAX_COOCCURRENCE_PAIRS``
     pairs (highest rate first).
 
-    Pairs with symptom IDs missing from symptoms_reference are silently skipped
-    (data-integrity anomalies logged as warnings).
+    Symptom IDs missing from symptoms_reference are dropped from each log
+    before pairing, so no pair involving them is counted (data-integrity
+    anomalies, logged once as a warning).
 
     Args:
         logs: Raw symptom log rows from the database. Each row must have a
@@ -98,43 +101,45 @@ def calculate_cooccurrence_stats(
     symptom_counts: Counter[str] = Counter()
     pair_counts: Counter[tuple[str, str]] = Counter()
 
+    unknown_ids: set[str] = set()
+    is_known = symptoms_reference.__contains__
+
     for row in logs:
-        symptoms = list(
-            dict.fromkeys(row.get("symptoms") or [])
-        )  # deduplicate, preserve order
-        for sid in symptoms:
-            symptom_counts[sid] += 1
-        if len(symptoms) >= 2:
-            for a, b in itertools.combinations(sorted(symptoms), 2):
-                pair_counts[(a, b)] += 1
-
-    pairs: list[SymptomPair] = []
-    for (id_a, id_b), co_count in pair_counts.items():
-        if co_count < min_threshold:
-            continue
-        ref_a = symptoms_reference.get(id_a)
-        ref_b = symptoms_reference.get(id_b)
-        if not ref_a or not ref_b:
-            logger.warning(
-                "Co-occurrence: symptom ID(s) missing from symptoms_reference "
-                "(%s, %s) — skipping pair",
-                id_a,
-                id_b,
-            )
-            continue
-        total_a = symptom_counts[id_a]
-        rate = co_count / total_a if total_a else 0.0
-        pairs.append(
-            SymptomPair(
-                symptom1_id=id_a,
-                symptom1_name=ref_a["name"],
-                symptom2_id=id_b,
-                symptom2_name=ref_b["name"],
-                cooccurrence_count=co_count,
-                cooccurrence_rate=round(rate, 4),
-                total_occurrences_symptom1=total_a,
-            )
+        symptoms = set(row.get("symptoms") or ())
+        # Deduplicated and sorted, so combinations() yields each pair as (A, B)
+        # with A < B; logs with fewer than two known symptoms yield no pairs.
+        known = sorted(filter(is_known, symptoms))
+        if len(known) < len(symptoms):
+            unknown_ids.update(symptoms.difference(known))
+        symptom_counts.update(known)
+        if len(known) >= 2:
+            pair_counts.update(itertools.combinations(known, 2))
+
+    if unknown_ids:
+        logger.warning(
+            "Co-occurrence: symptom ID(s) missing from symptoms_reference "
+            "(%s) — skipping their pairs",
+            ", ".join(sorted(unknown_ids)),
         )
 
-    pairs.sort(key=lambda p: p.cooccurrence_rate, reverse=True)
-    return pairs[:MAX_COOCCURRENCE_PAIRS]
+    # Score every qualifying pair, then build models only for the top few.
+    # nlargest keeps first-seen order among equal rates, like a stable sort.
+    scored = (
+        (round(co_count / symptom_counts[id_a], 4), id_a, id_b, co_count)
+        for (id_a, id_b), co_count in pair_counts.items()
+        if co_count >= min_threshold
+    )
+    top = heapq.nlargest(MAX_COOCCURRENCE_PAIRS, scored, key=itemgetter(0))
+
+    return [
+        SymptomPair.model_construct(
+            symptom1_id=id_a,
+            symptom1_name=symptoms_reference[id_a]["name"],
+            symptom2_id=id_b,
+            symptom2_name=symptoms_reference[id_b]["name"],
+            cooccurrence_count=co_count,
+            cooccurrence_rate=rate,
+            total_occurrences_symptom1=symptom_counts[id_a],
+        )
+        for rate, id_a, id_b, co_count in top
+    ]
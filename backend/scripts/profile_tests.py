@@ -0,0 +1,69 @@
+"""Profile a pytest run with pyinstrument and write an HTML flame report.
+
+Use it to see where a slow test module actually spends its time (TestClient
+startup, dependency resolution, mock machinery, Pydantic validation) before
+optimizing it.
+
+pyinstrument is not a project dependency; pull it in for the one run:
+    cd backend
+    uv run --with pyinstrument python scripts/profile_tests.py
+
+By default this profiles the provider route tests. Pass other pytest
+arguments to profile something else, and --output to change the report path:
+    uv run --with pyinstrument python scripts/profile_tests.py tests/api/routes/test_chat.py
+    uv run --with pyinstrument python scripts/profile_tests.py -k citations --output chat.html
+
+Runs in-process without xdist (-p no:xdist), so the whole run lands in one profile.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import pytest
+
+DEFAULT_TARGETS = ["tests/api/routes/test_providers_*.py"]
+DEFAULT_OUTPUT = Path("profile_tests.html")
+
+
+def main() -> int:
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        print(
+            "pyinstrument is not installed; run with "
+            "`uv run --with pyinstrument python scripts/profile_tests.py`",
+            file=sys.stderr,
+        )
+        return 1
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=DEFAULT_OUTPUT,
+        help=f"HTML report path (default: {DEFAULT_OUTPUT})",
+    )
+    args, pytest_args = parser.parse_known_args()
+
+    # pytest does not expand globs itself; the shell would, but the default
+    # targets never pass through one.
+    if not pytest_args:
+        pytest_args = [
+            str(path)
+            for pattern in DEFAULT_TARGETS
+            for path in sorted(Path().glob(pattern))
+        ]
+
+    profiler = Profiler()
+    profiler.start()
+    exit_code = pytest.main(["-q", "-p", "no:xdist", "-x", *pytest_args])
+    profiler.stop()
+
+    args.output.write_text(profiler.output_html())
+    print(f"Profile written to {args.output}")
+    return int(exit_code)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
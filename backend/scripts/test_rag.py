@@ -13,11 +13,17 @@ Prerequisites:
 Run from the backend directory:
     cd backend
     uv run python scripts/test_rag.py
+
+For a fast offline dev loop, embed locally instead of calling OpenAI
+(prerequisite 1 is then not needed; run app/migrations/add_rag_documents_local.sql
+once to create the 384-dim dev table):
+    EMBEDDING_BACKEND=local uv run python scripts/test_rag.py
 """
 
 import asyncio
 import logging
 import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 
 # Ensure 'app.*' imports resolve when running as a script
@@ -28,7 +34,7 @@ logging.basicConfig(
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
 )
 
-from app.rag.ingest import chunk_document, generate_embeddings, store_chunks  # noqa: E402
+from app.rag.ingest import generate_embeddings, iter_chunks, store_chunks  # noqa: E402
 from app.rag.retrieval import retrieve_relevant_chunks  # noqa: E402
 
 # ---------------------------------------------------------------------------
@@ -70,15 +76,39 @@ SAMPLE_QUERY = "What causes hot flashes?"
 TEST_CHUNK_SIZE = 80  # tokens (~320 chars)
 TEST_OVERLAP = 15  # tokens (~60 chars)
 
+# Chunks per embed+store task; matches the embedding API batch limit
+EMBED_BATCH_SIZE = 100
+
+
+def _batched(chunks: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    batch: list[dict] = []
+    for chunk in chunks:
+        batch.append(chunk)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def _embed_and_store(batch: list[dict]) -> int:
+    embeddings = await generate_embeddings([c["content"] for c in batch])
+    await store_chunks(batch, embeddings, source_type="wiki")
+    return len(batch)
+
 
 async def main() -> None:
     print("\n=== RAG Pipeline Test ===\n")
 
     # ------------------------------------------------------------------
-    # Step 1: Chunk
+    # Steps 1-3: Chunk, embed, store
+    #
+    # Each batch is embedded and stored in its own task as soon as it is
+    # chunked, so embedding/insert round-trips overlap with chunking of
+    # the rest of the document instead of running strictly in sequence.
     # ------------------------------------------------------------------
-    print("Step 1: Chunking document...")
-    chunks = chunk_document(
+    print("Steps 1-3: Chunking, embedding and storing document...")
+    chunks = iter_chunks(
         text=SAMPLE_TEXT,
         title=SAMPLE_TITLE,
         source_url=SAMPLE_URL,
@@ -86,25 +116,20 @@ async def main() -> None:
         overlap=TEST_OVERLAP,
         section_name="Vasomotor Symptoms",
     )
-    print(f"  → {len(chunks)} chunks created\n")
-    for i, c in enumerate(chunks):
-        preview = c["content"][:90].replace("\n", " ")
-        print(f"  Chunk {i} ({len(c['content'])} chars): {preview}...")
-
-    # ------------------------------------------------------------------
-    # Step 2: Generate embeddings
-    # ------------------------------------------------------------------
-    print(f"\nStep 2: Generating embeddings for {len(chunks)} chunks...")
-    texts = [c["content"] for c in chunks]
-    embeddings = await generate_embeddings(texts)
-    print(f"  → {len(embeddings)} embeddings generated (dim={len(embeddings[0])})")
-
-    # ------------------------------------------------------------------
-    # Step 3: Store in Supabase
-    # ------------------------------------------------------------------
-    print("\nStep 3: Storing chunks in rag_documents table...")
-    await store_chunks(chunks, embeddings, source_type="wiki")
-    print("  → Stored successfully")
+    tasks: list[asyncio.Task[int]] = []
+    for batch in _batched(chunks, EMBED_BATCH_SIZE):
+        for c in batch:
+            preview = c["content"][:90].replace("\n", " ")
+            print(
+                f"  Chunk {c['chunk_index']} ({len(c['content'])} chars): {preview}..."
+            )
+        tasks.append(asyncio.create_task(_embed_and_store(batch)))
+        # Yield so the new task sends its embedding request before the next
+        # batch is chunked; otherwise nothing would start until gather().
+        await asyncio.sleep(0)
+
+    stored = await asyncio.gather(*tasks)
+    print(f"  → {sum(stored)} chunks embedded and stored in {len(tasks)} batch(es)")
 
     # ------------------------------------------------------------------
     # Step 4: Retrieve
@@ -0,0 +1,64 @@
+"""Shared fixtures for route tests."""
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient (and app startup/shutdown) shared by all route tests.
+
+    Tests swap dependencies through app.dependency_overrides, which the shared
+    client picks up per request.
+
+    Fetching /openapi.json once up front builds the app's schema graph here
+    rather than inside whichever test happens to run first on this worker, so
+    per-test durations stay comparable.
+    """
+    with TestClient(app) as c:
+        c.get("/openapi.json")
+        yield c
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def aclient():
+    """Async client that drives the app in-process over httpx's ASGI transport.
+
+    For async tests: requests run on the test's own event loop instead of
+    TestClient's portal thread, so they can be awaited alongside other
+    coroutines. The app has no lifespan handlers, so none are run.
+
+    The client and its event loop are shared by the whole session, so tests
+    using it must run on the session loop:
+    ``pytest.mark.asyncio(loop_scope="session")``.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest.fixture(autouse=True)
+def clear_dependency_overrides():
+    """Clear dependency overrides after every test, even one that fails early.
+
+    The client is shared, so an override left behind would leak into the next
+    test that runs on this worker.
+    """
+    yield
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_openai_clients(monkeypatch):
+    """Drop process-wide OpenAI clients cached by earlier tests.
+
+    Without this, a provider cached by one test would shadow the
+    OpenAIProvider/AsyncOpenAI patches applied by the next. Routes reach both
+    the LLM provider singleton and the RAG retrieval client.
+    """
+    monkeypatch.setattr("app.api.dependencies._openai_provider", None)
+    monkeypatch.setattr("app.rag.retrieval._openai", None)
@@ -6,8 +6,6 @@ real network connections are made.
 
 from unittest.mock import AsyncMock, MagicMock
 
-from fastapi.testclient import TestClient
-
 from app.core.supabase import get_client
 from app.main import app
 from tests.fixtures.supabase import setup_supabase_response
@@ -117,8 +115,8 @@ CONTEXT_ID = "550e8400-e29b-41d4-a716-446655440000"
 
 
 def override(mock_client):
+    """Override the DB client; the route conftest clears it after each test."""
     app.dependency_overrides[get_client] = lambda: mock_client
-    return lambda: app.dependency_overrides.clear()
 
 
 # ---------------------------------------------------------------------------
@@ -127,182 +125,146 @@ def override(mock_client):
 
 
 class TestCreateAppointmentContext:
-    def test_create_context_success(self):
+    def test_create_context_success(self, client):
         """Test creating appointment context successfully."""
         mock = make_mock_client(created_context_id=CONTEXT_ID)
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/appointment-prep/context",
-                    json=VALID_PAYLOAD,
-                    headers=AUTH_HEADER,
-                )
+        override(mock)
+        response = client.post(
+            "/api/appointment-prep/context",
+            json=VALID_PAYLOAD,
+            headers=AUTH_HEADER,
+        )
 
-            assert response.status_code == 201
-            data = response.json()
-            assert data["appointment_id"] == CONTEXT_ID
-            assert data["next_step"] == "narrative"
-        finally:
-            cleanup()
+        assert response.status_code == 201
+        data = response.json()
+        assert data["appointment_id"] == CONTEXT_ID
+        assert data["next_step"] == "narrative"
 
-    def test_create_context_invalid_appointment_type(self):
+    def test_create_context_invalid_appointment_type(self, client):
         """Test creating context with invalid appointment_type enum."""
         mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                payload = {
-                    "appointment_type": "invalid_type",
-                    "goal": "explore_hrt",
-                    "dismissed_before": "once_or_twice",
-                }
-                response = client.post(
-                    "/api/appointment-prep/context",
-                    json=payload,
-                    headers=AUTH_HEADER,
-                )
+        override(mock)
+        payload = {
+            "appointment_type": "invalid_type",
+            "goal": "explore_hrt",
+            "dismissed_before": "once_or_twice",
+        }
+        response = client.post(
+            "/api/appointment-prep/context",
+            json=payload,
+            headers=AUTH_HEADER,
+        )
 
-            # Pydantic validation error
-            assert response.status_code == 422
-        finally:
-            cleanup()
+        # Pydantic validation error
+        assert response.status_code == 422
 
-    def test_create_context_invalid_goal(self):
+    def test_create_context_invalid_goal(self, client):
         """Test creating context with invalid goal enum."""
         mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                payload = {
-                    "appointment_type": "new_provider",
-                    "goal": "invalid_goal",
-                    "dismissed_before": "once_or_twice",
-                }
-                response = client.post(
-                    "/api/appointment-prep/context",
-                    json=payload,
-                    headers=AUTH_HEADER,
-                )
+        override(mock)
+        payload = {
+            "appointment_type": "new_provider",
+            "goal": "invalid_goal",
+            "dismissed_before": "once_or_twice",
+        }
+        response = client.post(
+            "/api/appointment-prep/context",
+            json=payload,
+            headers=AUTH_HEADER,
+        )
 
-            assert response.status_code == 422
-        finally:
-            cleanup()
+        assert response.status_code == 422
 
-    def test_create_context_invalid_dismissed_before(self):
+    def test_create_context_invalid_dismissed_before(self, client):
         """Test creating context with invalid dismissed_before enum."""
         mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                payload = {
-                    "appointment_type": "new_provider",
-                    "goal": "explore_hrt",
-                    "dismissed_before": "invalid",
-                }
-                response = client.post(
-                    "/api/appointment-prep/context",
-                    json=payload,
-                    headers=AUTH_HEADER,
-                )
+        override(mock)
+        payload = {
+            "appointment_type": "new_provider",
+            "goal": "explore_hrt",
+            "dismissed_before": "invalid",
+        }
+        response = client.post(
+            "/api/appointment-prep/context",
+            json=payload,
+            headers=AUTH_HEADER,
+        )
 
-            assert response.status_code == 422
-        finally:
-            cleanup()
+        assert response.status_code == 422
 
-    def test_create_context_missing_auth_header(self):
+    def test_create_context_missing_auth_header(self, client):
         """Test creating context without authentication header."""
         mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/appointment-prep/context",
-                    json=VALID_PAYLOAD,
-                    # No auth header
-                )
+        override(mock)
+        response = client.post(
+            "/api/appointment-prep/context",
+            json=VALID_PAYLOAD,
+            # No auth header
+        )
 
-            assert response.status_code == 401
-            assert "Missing authorization header" in response.json()["detail"]
-        finally:
-            cleanup()
+        assert response.status_code == 401
+        assert "Missing authorization header" in response.json()["detail"]
 
-    def test_create_context_invalid_auth_header_format(self):
+    def test_create_context_invalid_auth_header_format(self, client):
         """Test creating context with malformed authorization header."""
         mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/appointment-prep/context",
-                    json=VALID_PAYLOAD,
-                    headers={"Authorization": "InvalidFormat token"},
-                )
+        override(mock)
+        response = client.post(
+            "/api/appointment-prep/context",
+            json=VALID_PAYLOAD,
+            headers={"Authorization": "InvalidFormat token"},
+        )
 
-            assert response.status_code == 401
-            assert "Invalid authorization header format" in response.json()["detail"]
-        finally:
-            cleanup()
+        assert response.status_code == 401
+        assert "Invalid authorization header format" in response.json()["detail"]
 
-    def test_create_context_invalid_token(self):
+    def test_create_context_invalid_token(self, client):
         """Test creating context with invalid JWT token."""
         mock = make_mock_client(auth_error=Exception("Invalid token"))
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/appointment-prep/context",
-                    json=VALID_PAYLOAD,
-                    headers={"Authorization": "Bearer invalid-token"},
-                )
+        override(mock)
+        response = client.post(
+            "/api/appointment-prep/context",
+            json=VALID_PAYLOAD,
+            headers={"Authorization": "Bearer invalid-token"},
+        )
 
-            assert response.status_code == 401
-            assert "Invalid or expired token" in response.json()["detail"]
-        finally:
-            cleanup()
+        assert response.status_code == 401
+        assert "Invalid or expired token" in response.json()["detail"]
 
-    def test_create_context_db_error(self):
+    def test_create_context_db_error(self, client):
         """Test creating context when database operation fails."""
         mock = make_mock_client(insert_error=Exception("DB connection error"))
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/appointment-prep/context",
-                    json=VALID_PAYLOAD,
-                    headers=AUTH_HEADER,
-                )
+        override(mock)
+        response = client.post(
+            "/api/appointment-prep/context",
+            json=VALID_PAYLOAD,
+            headers=AUTH_HEADER,
+        )
 
-            assert response.status_code == 500
-            assert "Database error occurred" in response.json()["detail"]
-        finally:
-            cleanup()
+        assert response.status_code == 500
+        assert "Database error occurred" in response.json()["detail"]
 
-    def test_create_context_all_appointment_types(self):
+    def test_create_context_all_appointment_types(self, client):
         """Test creating context with each valid appointment_type."""
         types = ["new_provider", "established_relationship"]
         for appt_type in types:
             mock = make_mock_client()
-            cleanup = override(mock)
-            try:
-                with TestClient(app) as client:
-                    payload = {
-                        "appointment_type": appt_type,
-                        "goal": "explore_hrt",
-                        "dismissed_before": "once_or_twice",
-                    }
-                    response = client.post(
-                        "/api/appointment-prep/context",
-                        json=payload,
-                        headers=AUTH_HEADER,
-                    )
+            override(mock)
+            payload = {
+                "appointment_type": appt_type,
+                "goal": "explore_hrt",
+                "dismissed_before": "once_or_twice",
+            }
+            response = client.post(
+                "/api/appointment-prep/context",
+                json=payload,
+                headers=AUTH_HEADER,
+            )
 
-                assert response.status_code == 201
-                assert response.json()["appointment_id"] == CONTEXT_ID
-            finally:
-                cleanup()
+            assert response.status_code == 201
+            assert response.json()["appointment_id"] == CONTEXT_ID
 
-    def test_create_context_all_goals(self):
+    def test_create_context_all_goals(self, client):
         """Test creating context with each valid goal."""
         goals = [
             "assess_status",
@@ -312,92 +274,76 @@ class TestCreateAppointmentContext:
         ]
         for goal in goals:
             mock = make_mock_client()
-            cleanup = override(mock)
-            try:
-                with TestClient(app) as client:
-                    payload = {
-                        "appointment_type": "new_provider",
-                        "goal": goal,
-                        "dismissed_before": "once_or_twice",
-                    }
-                    response = client.post(
-                        "/api/appointment-prep/context",
-                        json=payload,
-                        headers=AUTH_HEADER,
-                    )
+            override(mock)
+            payload = {
+                "appointment_type": "new_provider",
+                "goal": goal,
+                "dismissed_before": "once_or_twice",
+            }
+            response = client.post(
+                "/api/appointment-prep/context",
+                json=payload,
+                headers=AUTH_HEADER,
+            )
 
-                assert response.status_code == 201
-            finally:
-                cleanup()
+            assert response.status_code == 201
 
-    def test_create_context_all_dismissal_experiences(self):
+    def test_create_context_all_dismissal_experiences(self, client):
         """Test creating context with each valid dismissal_experience."""
         experiences = ["no", "once_or_twice", "multiple_times"]
         for experience in experiences:
             mock = make_mock_client()
-            cleanup = override(mock)
-            try:
-                with TestClient(app) as client:
-                    payload = {
-                        "appointment_type": "new_provider",
-                        "goal": "explore_hrt",
-                        "dismissed_before": experience,
-                    }
-                    response = client.post(
-                        "/api/appointment-prep/context",
-                        json=payload,
-                        headers=AUTH_HEADER,
-                    )
+            override(mock)
+            payload = {
+                "appointment_type": "new_provider",
+                "goal": "explore_hrt",
+                "dismissed_before": experience,
+            }
+            response = client.post(
+                "/api/appointment-prep/context",
+                json=payload,
+                headers=AUTH_HEADER,
+            )
 
-                assert response.status_code == 201
-            finally:
-                cleanup()
+            assert response.status_code == 201
 
-    def test_create_context_missing_required_fields(self):
+    def test_create_context_missing_required_fields(self, client):
         """Test creating context without required fields."""
         mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                # Missing dismissed_before
-                payload = {
-                    "appointment_type": "new_provider",
-                    "goal": "explore_hrt",
-                }
-                response = client.post(
-                    "/api/appointment-prep/context",
-                    json=payload,
-                    headers=AUTH_HEADER,
-                )
+        override(mock)
+        # Missing dismissed_before
+        payload = {
+            "appointment_type": "new_provider",
+            "goal": "explore_hrt",
+        }
+        response = client.post(
+            "/api/appointment-prep/context",
+            json=payload,
+            headers=AUTH_HEADER,
+        )
 
-            assert response.status_code == 422
-        finally:
-            cleanup()
+        assert response.status_code == 422
 
-    def test_create_context_response_format(self):
+    def test_create_context_response_format(self, client):
         """Test that response has correct format and fields."""
         mock = make_mock_client(created_context_id=CONTEXT_ID)
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/appointment-prep/context",
-                    json=VALID_PAYLOAD,
-                    headers=AUTH_HEADER,
-                )
+        override(mock)
+        response = client.post(
+            "/api/appointment-prep/context",
+            json=VALID_PAYLOAD,
+            headers=AUTH_HEADER,
+        )
 
-            assert response.status_code == 201
-            data = response.json()
+        assert response.status_code == 201
+        data = response.json()
 
-            # Verify response structure
-            assert "appointment_id" in data
-            assert "next_step" in data
-            assert isinstance(data["appointment_id"], str)
-            assert isinstance(data["next_step"], str)
-            assert len(data["appointment_id"]) > 0
-            assert data["next_step"] == "narrative"
-        finally:
-            cleanup()
+        # Verify response structure
+        assert "appointment_id" in data
+        assert "next_step" in data
+        assert isinstance(data["appointment_id"], str)
+        assert isinstance(data["next_step"], str)
+        assert len(data["appointment_id"]) > 0
+        assert data["next_step"] == "narrative"
 
 
 # ============================================================================
@@ -408,7 +354,7 @@ class TestCreateAppointmentContext:
 class TestGenerateAppointmentNarrative:
     """Tests for POST /api/appointment-prep/{id}/narrative endpoint."""
 
-    def test_generate_narrative_no_logs(self):
+    def test_generate_narrative_no_logs(self, client):
         """Test generating narrative when user has no symptom logs."""
         mock = MagicMock()
         mock.auth.get_user = AsyncMock(
@@ -464,40 +410,32 @@ class TestGenerateAppointmentNarrative:
 
         mock.table.side_effect = table_side_effect
 
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    f"/api/appointment-prep/{CONTEXT_ID}/narrative",
-                    json={"days_back": 60},
-                    headers=AUTH_HEADER,
-                )
+        override(mock)
+        response = client.post(
+            f"/api/appointment-prep/{CONTEXT_ID}/narrative",
+            json={"days_back": 60},
+            headers=AUTH_HEADER,
+        )
 
-            assert response.status_code == 200
-            data = response.json()
-            assert "No symptom logs found" in data["narrative"]
-            assert data["next_step"] == "prioritize"
-        finally:
-            cleanup()
+        assert response.status_code == 200
+        data = response.json()
+        assert "No symptom logs found" in data["narrative"]
+        assert data["next_step"] == "prioritize"
 
-    def test_generate_narrative_invalid_days_back(self):
+    def test_generate_narrative_invalid_days_back(self, client):
         """Test generating narrative with invalid days_back (> 365)."""
         mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    f"/api/appointment-prep/{CONTEXT_ID}/narrative",
-                    json={"days_back": 400},  # Invalid: > 365
-                    headers=AUTH_HEADER,
-                )
+        override(mock)
+        response = client.post(
+            f"/api/appointment-prep/{CONTEXT_ID}/narrative",
+            json={"days_back": 400},  # Invalid: > 365
+            headers=AUTH_HEADER,
+        )
 
-            # Pydantic validation should reject days_back > 365
-            assert response.status_code == 422
-        finally:
-            cleanup()
+        # Pydantic validation should reject days_back > 365
+        assert response.status_code == 422
 
-    def test_generate_narrative_appointment_not_found(self):
+    def test_generate_narrative_appointment_not_found(self, client):
         """Test generating narrative for non-existent appointment."""
         # Create a mock that returns empty data for get_context query
         mock = make_mock_client()
@@ -518,35 +456,27 @@ class TestGenerateAppointmentNarrative:
 
         mock.table = custom_table
 
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/appointment-prep/nonexistent-id/narrative",
-                    json={"days_back": 60},
-                    headers=AUTH_HEADER,
-                )
+        override(mock)
+        response = client.post(
+            "/api/appointment-prep/nonexistent-id/narrative",
+            json={"days_back": 60},
+            headers=AUTH_HEADER,
+        )
 
-            assert response.status_code == 404
-        finally:
-            cleanup()
+        assert response.status_code == 404
 
-    def test_generate_narrative_missing_auth(self):
+    def test_generate_narrative_missing_auth(self, client):
         """Test generating narrative without authentication header."""
         mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    f"/api/appointment-prep/{CONTEXT_ID}/narrative",
-                    json={"days_back": 60},
-                    # No auth header
-                )
+        override(mock)
+        response = client.post(
+            f"/api/appointment-prep/{CONTEXT_ID}/narrative",
+            json={"days_back": 60},
+            # No auth header
+        )
 
-            assert response.status_code == 401
-            assert "Missing authorization header" in response.json()["detail"]
-        finally:
-            cleanup()
+        assert response.status_code == 401
+        assert "Missing authorization header" in response.json()["detail"]
 
 
 # ============================================================================
@@ -581,67 +511,51 @@ class TestSaveNarrative:
         setup_supabase_response(mock, data=context_data)
         return mock
 
-    def test_save_narrative_success(self):
+    def test_save_narrative_success(self, client):
         # CATCHES: PUT narrative endpoint missing — frontend edit cannot persist
         # user changes, narrative reverts to LLM-generated on next reload
         mock = self._make_update_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.put(
-                    f"/api/appointment-prep/{CONTEXT_ID}/narrative",
-                    json={"narrative": "My edited narrative text."},
-                    headers=AUTH_HEADER,
-                )
-            assert response.status_code == 200
-            data = response.json()
-            assert "narrative" in data
-            assert data["appointment_id"] == CONTEXT_ID
-        finally:
-            cleanup()
-
-    def test_save_narrative_missing_auth(self):
+        override(mock)
+        response = client.put(
+            f"/api/appointment-prep/{CONTEXT_ID}/narrative",
+            json={"narrative": "My edited narrative text."},
+            headers=AUTH_HEADER,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert "narrative" in data
+        assert data["appointment_id"] == CONTEXT_ID
+
+    def test_save_narrative_missing_auth(self, client):
         # CATCHES: auth not enforced on PUT narrative — anyone could overwrite
         # another user's narrative without a valid JWT
         mock = self._make_update_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.put(
-                    f"/api/appointment-prep/{CONTEXT_ID}/narrative",
-                    json={"narrative": "Edited text."},
-                )
-            assert response.status_code == 401
-        finally:
-            cleanup()
+        override(mock)
+        response = client.put(
+            f"/api/appointment-prep/{CONTEXT_ID}/narrative",
+            json={"narrative": "Edited text."},
+        )
+        assert response.status_code == 401
 
-    def test_save_narrative_not_found(self):
+    def test_save_narrative_not_found(self, client):
         # CATCHES: 404 not returned for non-existent appointment — service raises
         # EntityNotFoundError but route returns 500 if not mapped correctly
         mock = self._make_update_client(empty_context=True)
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.put(
-                    f"/api/appointment-prep/{CONTEXT_ID}/narrative",
-                    json={"narrative": "Edited text."},
-                    headers=AUTH_HEADER,
-                )
-            assert response.status_code == 404
-        finally:
-            cleanup()
+        override(mock)
+        response = client.put(
+            f"/api/appointment-prep/{CONTEXT_ID}/narrative",
+            json={"narrative": "Edited text."},
+            headers=AUTH_HEADER,
+        )
+        assert response.status_code == 404
 
-    def test_save_narrative_empty_body_rejected(self):
+    def test_save_narrative_empty_body_rejected(self, client):
         # CATCHES: empty narrative accepted — PDF would render blank Symptom Summary
         mock = self._make_update_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.put(
-                    f"/api/appointment-prep/{CONTEXT_ID}/narrative",
-                    json={"narrative": ""},
-                    headers=AUTH_HEADER,
-                )
-            assert response.status_code == 422
-        finally:
-            cleanup()
+        override(mock)
+        response = client.put(
+            f"/api/appointment-prep/{CONTEXT_ID}/narrative",
+            json={"narrative": ""},
+            headers=AUTH_HEADER,
+        )
+        assert response.status_code == 422
@@ -1,17 +1,25 @@
 """Tests for POST /api/chat.
 
 Supabase is mocked via FastAPI dependency_overrides (same pattern as test_symptoms.py).
-OpenAI and RAG retrieval are patched so no real network calls are made.
+RAG retrieval is patched and OpenAI is served from an httpx.MockTransport
+(see OpenAIStub), so no real network calls are made.
 """
 
+import asyncio
 import json
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
-from fastapi.testclient import TestClient
+from openai import AsyncOpenAI
 
 from app.core.supabase import get_client
 from app.main import app
+from app.services.openai_provider import OpenAIProvider
+
+# Keep the chat suite on one xdist worker (run with --dist=loadgroup) so it
+# shares that worker's imported app and warmed-up ASGI stack.
+pytestmark = pytest.mark.xdist_group("chat_suite")
 
 # ---------------------------------------------------------------------------
 # Constants & fixture data
@@ -151,7 +159,7 @@ V2_PHANTOM_SOURCE_RESPONSE = json.dumps(
 
 
 # ---------------------------------------------------------------------------
-# Mock helpers (follows the same MagicMock-based pattern as test_symptoms.py)
+# Mock helpers
 # ---------------------------------------------------------------------------
 
 
@@ -237,36 +245,79 @@ def make_mock_client(
 
 
 def override(mock_client):
+    """Override the DB client; the route conftest clears it after each test."""
     app.dependency_overrides[get_client] = lambda: mock_client
-    return lambda: app.dependency_overrides.clear()
-
 
-def _make_openai_response(text: str):
-    """Create a mock OpenAI response object."""
-    usage = MagicMock()
-    usage.prompt_tokens = 300
-    usage.completion_tokens = 120
-    choice = MagicMock()
-    choice.message.content = text
-    response = MagicMock()
-    response.choices = [choice]
-    response.usage = usage
-    return response
 
+class OpenAIStub:
+    """Serve canned chat completions to a real OpenAIProvider via httpx.MockTransport.
+
+    The real AsyncOpenAI client parses the response, so tests exercise the same
+    path as production. Request bodies are recorded for prompt assertions.
+    """
+
+    def __init__(self, content: str | None = None, status_code: int = 200):
+        self.content = content
+        self.status_code = status_code
+        self.requests: list[dict] = []
+        self.provider = OpenAIProvider(api_key="sk-test")
+        # Close the client the provider built before swapping in the mock one
+        asyncio.run(self.provider.client.close())
+        self.provider.client = AsyncOpenAI(
+            api_key="sk-test",
+            max_retries=0,
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(self._handle)),
+        )
 
-def _make_provider_response(text: str) -> tuple[str, int, int]:
-    """Create a mock OpenAIProvider response tuple."""
-    return text, 300, 120
-
+    def _handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(json.loads(request.content))
+        if self.status_code != 200:
+            return httpx.Response(
+                self.status_code,
+                json={"error": {"message": "OpenAI API error", "type": "server_error"}},
+            )
+        return httpx.Response(
+            200,
+            json={
+                "id": "chatcmpl-test",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "gpt-4o",
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": self.content},
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 300,
+                    "completion_tokens": 120,
+                    "total_tokens": 420,
+                },
+            },
+        )
 
-# ---------------------------------------------------------------------------
-# Fixtures
-# ---------------------------------------------------------------------------
+    @property
+    def system_prompt(self) -> str:
+        return self.requests[-1]["messages"][0]["content"]
 
 
 @pytest.fixture
-def client():
-    return TestClient(app)
+def openai_stub(monkeypatch):
+    """Route chat through an OpenAIStub, with RAG retrieval returning SAMPLE_CHUNKS.
+
+    Tests set ``content`` or ``status_code`` on the yielded stub before posting,
+    and re-patch retrieve_relevant_chunks when they need different chunks.
+    """
+    stub = OpenAIStub(V2_OPENAI_RESPONSE)
+    monkeypatch.setattr(
+        "app.api.dependencies.retrieve_relevant_chunks",
+        AsyncMock(return_value=SAMPLE_CHUNKS),
+    )
+    monkeypatch.setattr("app.api.dependencies._openai_provider", stub.provider)
+    yield stub
+    asyncio.run(stub.provider.client.close())
 
 
 # ---------------------------------------------------------------------------
@@ -281,30 +332,22 @@ def test_chat_requires_auth(client):
     # missing header, so without an override the real Supabase client raises
     # SupabaseException before the 401 can be returned.
     mock_client = make_mock_client()
-    clear = override(mock_client)
-    try:
-        response = client.post(
-            "/api/chat", json={"message": "What causes hot flashes?"}
-        )
-        assert response.status_code == 401
-    finally:
-        clear()
+    override(mock_client)
+    response = client.post("/api/chat", json={"message": "What causes hot flashes?"})
+    assert response.status_code == 401
 
 
 def test_chat_rejects_invalid_token(client):
     # CATCHES: Token validation is skipped or swallows auth exceptions, allowing
     # requests with invalid JWTs to pass through and impersonate any user.
     mock_client = make_mock_client(auth_error=Exception("Invalid token"))
-    clear = override(mock_client)
-    try:
-        response = client.post(
-            "/api/chat",
-            json={"message": "What causes hot flashes?"},
-            headers=AUTH_HEADER,
-        )
-        assert response.status_code == 401
-    finally:
-        clear()
+    override(mock_client)
+    response = client.post(
+        "/api/chat",
+        json={"message": "What causes hot flashes?"},
+        headers=AUTH_HEADER,
+    )
+    assert response.status_code == 401
 
 
 # ---------------------------------------------------------------------------
@@ -312,44 +355,28 @@ def test_chat_rejects_invalid_token(client):
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.usefixtures("openai_stub")
 def test_chat_rejects_empty_message(client):
     # CATCHES: Whitespace-only messages bypass validation and are forwarded to the LLM,
     # wasting tokens and returning a nonsensical response instead of a 400 error.
     mock_client = make_mock_client()
-    clear = override(mock_client)
-    try:
-        with (
-            patch(
-                "app.api.dependencies.retrieve_relevant_chunks",
-                new=AsyncMock(return_value=SAMPLE_CHUNKS),
-            ),
-            patch("app.api.dependencies.OpenAIProvider") as MockProvider,
-        ):
-            mock_instance = AsyncMock()
-            mock_instance.chat_completion.return_value = V2_OPENAI_RESPONSE
-            MockProvider.return_value = mock_instance
-
-            response = client.post(
-                "/api/chat",
-                json={"message": "   "},
-                headers=AUTH_HEADER,
-            )
-        assert response.status_code == 400
-        assert "empty" in response.json()["detail"].lower()
-    finally:
-        clear()
+    override(mock_client)
+    response = client.post(
+        "/api/chat",
+        json={"message": "   "},
+        headers=AUTH_HEADER,
+    )
+    assert response.status_code == 400
+    assert "empty" in response.json()["detail"].lower()
 
 
 def test_chat_rejects_missing_message_field(client):
     # CATCHES: Payload missing the required 'message' field returns 200 or 500
     # instead of a 422 Pydantic validation error.
     mock_client = make_mock_client()
-    clear = override(mock_client)
-    try:
-        response = client.post("/api/chat", json={}, headers=AUTH_HEADER)
-        assert response.status_code == 422
-    finally:
-        clear()
+    override(mock_client)
+    response = client.post("/api/chat", json={}, headers=AUTH_HEADER)
+    assert response.status_code == 422
 
 
 # ---------------------------------------------------------------------------
@@ -357,137 +384,85 @@ def test_chat_rejects_missing_message_field(client):
 # ---------------------------------------------------------------------------
 
 
-def test_chat_success_returns_message_and_citations(client):
+def test_chat_success_returns_message_and_citations(client, openai_stub):
     # CATCHES: Structured LLM response is not rendered correctly, or citations are
     # dropped from the response body so callers receive an empty citations list.
     mock_client = make_mock_client()
-    clear = override(mock_client)
-    try:
-        with (
-            patch(
-                "app.api.dependencies.retrieve_relevant_chunks",
-                new=AsyncMock(return_value=SAMPLE_CHUNKS),
-            ),
-            patch("app.api.dependencies.OpenAIProvider") as MockProvider,
-        ):
-            mock_instance = AsyncMock()
-            mock_instance.chat_completion.return_value = V2_TWO_SOURCE_RESPONSE
-            MockProvider.return_value = mock_instance
-
-            response = client.post(
-                "/api/chat",
-                json={"message": "What causes hot flashes?"},
-                headers=AUTH_HEADER,
-            )
+    override(mock_client)
+    openai_stub.content = V2_TWO_SOURCE_RESPONSE
+    response = client.post(
+        "/api/chat",
+        json={"message": "What causes hot flashes?"},
+        headers=AUTH_HEADER,
+    )
 
-        assert response.status_code == 200
-        body = response.json()
-        assert "hot flashes" in body["message"].lower()
-        assert len(body["citations"]) == 2
-        assert body["citations"][0]["url"] == "https://menopausewiki.ca/hot-flashes"
-        assert body["citations"][0]["title"] == "Perimenopause Overview"
-        assert body["citations"][1]["url"] == "https://menopause.org/hrt-guidelines"
-        assert "conversation_id" in body
-    finally:
-        clear()
+    assert response.status_code == 200
+    body = response.json()
+    assert "hot flashes" in body["message"].lower()
+    assert len(body["citations"]) == 2
+    assert body["citations"][0]["url"] == "https://menopausewiki.ca/hot-flashes"
+    assert body["citations"][0]["title"] == "Perimenopause Overview"
+    assert body["citations"][1]["url"] == "https://menopause.org/hrt-guidelines"
+    assert "conversation_id" in body
 
 
-def test_chat_deduplicates_citations(client):
+def test_chat_deduplicates_citations(client, openai_stub):
     # CATCHES: Multiple sections citing the same source_index produce duplicate citation
     # entries instead of being collapsed into one.
     mock_client = make_mock_client()
-    clear = override(mock_client)
-    try:
-        with (
-            patch(
-                "app.api.dependencies.retrieve_relevant_chunks",
-                new=AsyncMock(return_value=SAMPLE_CHUNKS),
-            ),
-            patch("app.api.dependencies.OpenAIProvider") as MockProvider,
-        ):
-            mock_instance = AsyncMock()
-            mock_instance.chat_completion.return_value = V2_DUPLICATE_SOURCE_RESPONSE
-            MockProvider.return_value = mock_instance
-
-            response = client.post(
-                "/api/chat",
-                json={"message": "Tell me about hot flashes"},
-                headers=AUTH_HEADER,
-            )
+    override(mock_client)
+    openai_stub.content = V2_DUPLICATE_SOURCE_RESPONSE
+    response = client.post(
+        "/api/chat",
+        json={"message": "Tell me about hot flashes"},
+        headers=AUTH_HEADER,
+    )
 
-        assert response.status_code == 200
-        body = response.json()
-        assert len(body["citations"]) == 1
-        assert body["citations"][0]["url"] == "https://menopausewiki.ca/hot-flashes"
-    finally:
-        clear()
+    assert response.status_code == 200
+    body = response.json()
+    assert len(body["citations"]) == 1
+    assert body["citations"][0]["url"] == "https://menopausewiki.ca/hot-flashes"
 
 
-def test_chat_returns_empty_citations_when_no_sources_cited(client):
+def test_chat_returns_empty_citations_when_no_sources_cited(client, openai_stub):
     # CATCHES: Sections with source_index=None produce spurious citation entries in
     # the response instead of an empty list.
     mock_client = make_mock_client()
-    clear = override(mock_client)
-    try:
-        with (
-            patch(
-                "app.api.dependencies.retrieve_relevant_chunks",
-                new=AsyncMock(return_value=SAMPLE_CHUNKS),
-            ),
-            patch("app.api.dependencies.OpenAIProvider") as MockProvider,
-        ):
-            mock_instance = AsyncMock()
-            mock_instance.chat_completion.return_value = V2_NO_CITATIONS_RESPONSE
-            MockProvider.return_value = mock_instance
-
-            response = client.post(
-                "/api/chat",
-                json={"message": "What's the weather today?"},
-                headers=AUTH_HEADER,
-            )
+    override(mock_client)
+    openai_stub.content = V2_NO_CITATIONS_RESPONSE
+    response = client.post(
+        "/api/chat",
+        json={"message": "What's the weather today?"},
+        headers=AUTH_HEADER,
+    )
 
-        assert response.status_code == 200
-        body = response.json()
-        assert body["citations"] == []
-    finally:
-        clear()
+    assert response.status_code == 200
+    body = response.json()
+    assert body["citations"] == []
 
 
+@pytest.mark.usefixtures("openai_stub")
 def test_chat_when_llm_returns_v2_json_then_structured_path_exercised(client):
     # CATCHES: Valid v2 JSON bypasses render_structured_response and falls through to a
     # different code path, so body text and citations are not rendered from the structure.
     mock_client = make_mock_client()
-    clear = override(mock_client)
-    try:
-        with (
-            patch(
-                "app.api.dependencies.retrieve_relevant_chunks",
-                new=AsyncMock(return_value=SAMPLE_CHUNKS),
-            ),
-            patch("app.api.dependencies.OpenAIProvider") as MockProvider,
-        ):
-            mock_instance = AsyncMock()
-            mock_instance.chat_completion.return_value = V2_OPENAI_RESPONSE
-            MockProvider.return_value = mock_instance
-
-            response = client.post(
-                "/api/chat",
-                json={"message": "What causes hot flashes?"},
-                headers=AUTH_HEADER,
-            )
+    override(mock_client)
+    response = client.post(
+        "/api/chat",
+        json={"message": "What causes hot flashes?"},
+        headers=AUTH_HEADER,
+    )
 
-        assert response.status_code == 200
-        body = response.json()
-        # The structured body text should appear in the rendered prose paragraph
-        assert (
-            "Hot flashes are one of the most common symptoms of perimenopause."
-            in body["message"]
-        )
-        # source_index=1 resolves to SAMPLE_CHUNKS[0], so citations must be non-empty
-        assert len(body["citations"]) >= 1
-        assert body["citations"][0]["url"] == "https://menopausewiki.ca/hot-flashes"
-    finally:
-        clear()
+    assert response.status_code == 200
+    body = response.json()
+    # The structured body text should appear in the rendered prose paragraph
+    assert (
+        "Hot flashes are one of the most common symptoms of perimenopause."
+        in body["message"]
+    )
+    # source_index=1 resolves to SAMPLE_CHUNKS[0], so citations must be non-empty
+    assert len(body["citations"]) >= 1
+    assert body["citations"][0]["url"] == "https://menopausewiki.ca/hot-flashes"
 
 
 # ---------------------------------------------------------------------------
@@ -495,63 +470,49 @@ def test_chat_when_llm_returns_v2_json_then_structured_path_exercised(client):
 # ---------------------------------------------------------------------------
 
 
-def test_chat_creates_new_conversation_when_no_id_provided(client):
+@pytest.mark.usefixtures("openai_stub")
+def test_chat_creates_new_conversation_when_no_id_provided(client, monkeypatch):
     # CATCHES: Missing conversation_id fails to create a new conversation, or the
     # returned conversation_id does not match what was persisted.
     mock_client = make_mock_client(
         conversation_save_data=[{"id": CONVERSATION_UUID, "messages": "[]"}]
     )
-    clear = override(mock_client)
-    try:
-        with (
-            patch(
-                "app.api.dependencies.retrieve_relevant_chunks",
-                new=AsyncMock(return_value=[]),
-            ),
-            patch("app.api.dependencies.OpenAIProvider") as MockProvider,
-        ):
-            mock_instance = AsyncMock()
-            mock_instance.chat_completion.return_value = V2_OPENAI_RESPONSE
-            MockProvider.return_value = mock_instance
-
-            response = client.post(
-                "/api/chat",
-                json={"message": "What is perimenopause?"},
-                headers=AUTH_HEADER,
-            )
+    override(mock_client)
+    monkeypatch.setattr(
+        "app.api.dependencies.retrieve_relevant_chunks",
+        AsyncMock(return_value=[]),
+    )
+    response = client.post(
+        "/api/chat",
+        json={"message": "What is perimenopause?"},
+        headers=AUTH_HEADER,
+    )
 
-        assert response.status_code == 200
-        body = response.json()
-        assert body["conversation_id"] == CONVERSATION_UUID
-    finally:
-        clear()
+    assert response.status_code == 200
+    body = response.json()
+    assert body["conversation_id"] == CONVERSATION_UUID
 
 
-def test_chat_404_for_unknown_conversation_id(client):
+def test_chat_404_for_unknown_conversation_id(client, monkeypatch):
     # CATCHES: An unknown conversation_id silently starts a new conversation and returns
     # 200 instead of raising a 404, mixing message history across conversations.
     # conversations table returns empty for the load query
     mock_client = make_mock_client(conversation_load_data=[])
-    clear = override(mock_client)
-    try:
-        with (
-            patch(
-                "app.api.dependencies.retrieve_relevant_chunks",
-                new=AsyncMock(return_value=[]),
-            ),
-        ):
-            response = client.post(
-                "/api/chat",
-                json={
-                    "message": "What is perimenopause?",
-                    "conversation_id": "aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa",
-                },
-                headers=AUTH_HEADER,
-            )
+    override(mock_client)
+    monkeypatch.setattr(
+        "app.api.dependencies.retrieve_relevant_chunks",
+        AsyncMock(return_value=[]),
+    )
+    response = client.post(
+        "/api/chat",
+        json={
+            "message": "What is perimenopause?",
+            "conversation_id": "aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa",
+        },
+        headers=AUTH_HEADER,
+    )
 
-        assert response.status_code == 404
-    finally:
-        clear()
+    assert response.status_code == 404
 
 
 # ---------------------------------------------------------------------------
@@ -559,67 +520,45 @@ def test_chat_404_for_unknown_conversation_id(client):
 # ---------------------------------------------------------------------------
 
 
-def test_chat_degrades_gracefully_when_rag_fails(client):
+def test_chat_degrades_gracefully_when_rag_fails(client, monkeypatch, openai_stub):
     # CATCHES: A pgvector/RAG exception propagates to the HTTP layer and returns 500
     # instead of degrading to a sourceless LLM response. Also catches the case where
     # the endpoint returns 200 but skips the LLM call entirely, returning an empty body.
     mock_client = make_mock_client()
-    clear = override(mock_client)
-    try:
-        with (
-            patch(
-                "app.api.dependencies.retrieve_relevant_chunks",
-                new=AsyncMock(side_effect=Exception("pgvector unavailable")),
-            ),
-            patch("app.api.dependencies.OpenAIProvider") as MockProvider,
-        ):
-            mock_instance = AsyncMock()
-            mock_instance.chat_completion.return_value = V2_NO_CITATIONS_RESPONSE
-            MockProvider.return_value = mock_instance
-
-            response = client.post(
-                "/api/chat",
-                json={"message": "What is perimenopause?"},
-                headers=AUTH_HEADER,
-            )
+    override(mock_client)
+    openai_stub.content = V2_NO_CITATIONS_RESPONSE
+    monkeypatch.setattr(
+        "app.api.dependencies.retrieve_relevant_chunks",
+        AsyncMock(side_effect=Exception("pgvector unavailable")),
+    )
+    response = client.post(
+        "/api/chat",
+        json={"message": "What is perimenopause?"},
+        headers=AUTH_HEADER,
+    )
 
-        assert response.status_code == 200
-        body = response.json()
-        assert body["message"]
-        assert "citations" in body
-        assert "conversation_id" in body
-        mock_instance.chat_completion.assert_called_once()
-    finally:
-        clear()
+    assert response.status_code == 200
+    body = response.json()
+    assert body["message"]
+    assert "citations" in body
+    assert "conversation_id" in body
+    assert len(openai_stub.requests) == 1
 
 
-def test_chat_500_when_openai_fails(client):
+def test_chat_500_when_openai_fails(client, openai_stub):
     # CATCHES: LLM exception is swallowed and the endpoint returns 200 with an empty or
     # corrupt response body instead of propagating a 500.
     mock_client = make_mock_client()
-    clear = override(mock_client)
-    try:
-        with (
-            patch(
-                "app.api.dependencies.retrieve_relevant_chunks",
-                new=AsyncMock(return_value=SAMPLE_CHUNKS),
-            ),
-            patch("app.api.dependencies.OpenAIProvider") as MockProvider,
-        ):
-            mock_instance = AsyncMock()
-            mock_instance.chat_completion.side_effect = Exception("OpenAI API error")
-            MockProvider.return_value = mock_instance
-
-            response = client.post(
-                "/api/chat",
-                json={"message": "What is perimenopause?"},
-                headers=AUTH_HEADER,
-            )
+    override(mock_client)
+    openai_stub.status_code = 500
+    response = client.post(
+        "/api/chat",
+        json={"message": "What is perimenopause?"},
+        headers=AUTH_HEADER,
+    )
 
-        assert response.status_code == 500
-        assert "temporarily unavailable" in response.json()["detail"]
-    finally:
-        clear()
+    assert response.status_code == 500
+    assert "temporarily unavailable" in response.json()["detail"]
 
 
 # ---------------------------------------------------------------------------
@@ -627,74 +566,46 @@ def test_chat_500_when_openai_fails(client):
 # ---------------------------------------------------------------------------
 
 
-def test_chat_uses_defaults_when_user_profile_missing(client):
+def test_chat_uses_defaults_when_user_profile_missing(client, openai_stub):
     # CATCHES: Missing user profile row raises KeyError or 500 instead of defaulting to
     # journey_stage='unsure' and age=None. Also catches a regression where the LLM is
     # never called (early exit) when defaults are substituted for missing profile data.
     mock_client = make_mock_client(user_data=[])  # no profile row
-    clear = override(mock_client)
-    try:
-        with (
-            patch(
-                "app.api.dependencies.retrieve_relevant_chunks",
-                new=AsyncMock(return_value=SAMPLE_CHUNKS),
-            ),
-            patch("app.api.dependencies.OpenAIProvider") as MockProvider,
-        ):
-            mock_instance = AsyncMock()
-            mock_instance.chat_completion.return_value = V2_OPENAI_RESPONSE
-            MockProvider.return_value = mock_instance
-
-            response = client.post(
-                "/api/chat",
-                json={"message": "What causes brain fog?"},
-                headers=AUTH_HEADER,
-            )
+    override(mock_client)
+    response = client.post(
+        "/api/chat",
+        json={"message": "What causes brain fog?"},
+        headers=AUTH_HEADER,
+    )
 
-        assert response.status_code == 200
-        body = response.json()
-        assert body["message"]
-        assert "citations" in body
-        assert "conversation_id" in body
-        mock_instance.chat_completion.assert_called_once()
-        system_prompt = mock_instance.chat_completion.call_args[1]["system_prompt"]
-        assert "unsure" in system_prompt
-    finally:
-        clear()
+    assert response.status_code == 200
+    body = response.json()
+    assert body["message"]
+    assert "citations" in body
+    assert "conversation_id" in body
+    assert len(openai_stub.requests) == 1
+    system_prompt = openai_stub.system_prompt
+    assert "unsure" in system_prompt
 
 
-def test_chat_uses_default_summary_when_cache_missing(client):
+def test_chat_uses_default_summary_when_cache_missing(client, openai_stub):
     # CATCHES: Missing symptom summary cache row raises an exception instead of
     # defaulting to a safe fallback string. Also catches the case where the fallback
     # string is not forwarded into the LLM system prompt, silently omitting it.
     mock_client = make_mock_client(summary_data=[])  # no cache row
-    clear = override(mock_client)
-    try:
-        with (
-            patch(
-                "app.api.dependencies.retrieve_relevant_chunks",
-                new=AsyncMock(return_value=SAMPLE_CHUNKS),
-            ),
-            patch("app.api.dependencies.OpenAIProvider") as MockProvider,
-        ):
-            mock_instance = AsyncMock()
-            mock_instance.chat_completion.return_value = V2_OPENAI_RESPONSE
-            MockProvider.return_value = mock_instance
-
-            response = client.post(
-                "/api/chat",
-                json={"message": "What causes brain fog?"},
-                headers=AUTH_HEADER,
-            )
+    override(mock_client)
+    response = client.post(
+        "/api/chat",
+        json={"message": "What causes brain fog?"},
+        headers=AUTH_HEADER,
+    )
 
-        assert response.status_code == 200
-        body = response.json()
-        assert body["message"]
-        mock_instance.chat_completion.assert_called_once()
-        system_prompt = mock_instance.chat_completion.call_args[1]["system_prompt"]
-        assert "No symptom data logged yet." in system_prompt
-    finally:
-        clear()
+    assert response.status_code == 200
+    body = response.json()
+    assert body["message"]
+    assert len(openai_stub.requests) == 1
+    system_prompt = openai_stub.system_prompt
+    assert "No symptom data logged yet." in system_prompt
 
 
 # ---------------------------------------------------------------------------
@@ -702,79 +613,53 @@ def test_chat_uses_default_summary_when_cache_missing(client):
 # ---------------------------------------------------------------------------
 
 
-def test_chat_sanitizes_phantom_citations(client):
+def test_chat_sanitizes_phantom_citations(client, openai_stub):
     # CATCHES: An out-of-range source_index produces a [Source N] marker in the rendered
     # text with no matching citation entry, leaving the user a dangling reference.
     # V2_PHANTOM_SOURCE_RESPONSE has source_index: 3 but only 2 chunks available
     mock_client = make_mock_client()
-    clear = override(mock_client)
-    try:
-        with (
-            patch(
-                "app.api.dependencies.retrieve_relevant_chunks",
-                new=AsyncMock(return_value=SAMPLE_CHUNKS),
-            ),
-            patch("app.api.dependencies.OpenAIProvider") as MockProvider,
-        ):
-            mock_instance = AsyncMock()
-            mock_instance.chat_completion.return_value = V2_PHANTOM_SOURCE_RESPONSE
-            MockProvider.return_value = mock_instance
-
-            response = client.post(
-                "/api/chat",
-                json={"message": "What are my options for managing symptoms?"},
-                headers=AUTH_HEADER,
-            )
+    override(mock_client)
+    openai_stub.content = V2_PHANTOM_SOURCE_RESPONSE
+    response = client.post(
+        "/api/chat",
+        json={"message": "What are my options for managing symptoms?"},
+        headers=AUTH_HEADER,
+    )
 
-        assert response.status_code == 200
-        body = response.json()
-        # out-of-range source_index (3) produces no [Source 3] marker in rendered text
-        assert "[Source 3]" not in body["message"]
-        # Valid source_index values produce markers
-        assert "[Source 1]" in body["message"]
-        assert "[Source 2]" in body["message"]
-        # Citations should only include 2 entries (source_index 3 is out of range)
-        assert len(body["citations"]) == 2
-    finally:
-        clear()
+    assert response.status_code == 200
+    body = response.json()
+    # out-of-range source_index (3) produces no [Source 3] marker in rendered text
+    assert "[Source 3]" not in body["message"]
+    # Valid source_index values produce markers
+    assert "[Source 1]" in body["message"]
+    assert "[Source 2]" in body["message"]
+    # Citations should only include 2 entries (source_index 3 is out of range)
+    assert len(body["citations"]) == 2
 
 
-def test_chat_citations_include_section_names(client):
+def test_chat_citations_include_section_names(client, openai_stub):
     # CATCHES: Section names from chunk metadata are dropped during citation assembly,
     # returning null section fields that break the frontend citation display.
     mock_client = make_mock_client()
-    clear = override(mock_client)
-    try:
-        with (
-            patch(
-                "app.api.dependencies.retrieve_relevant_chunks",
-                new=AsyncMock(return_value=SAMPLE_CHUNKS),
-            ),
-            patch("app.api.dependencies.OpenAIProvider") as MockProvider,
-        ):
-            mock_instance = AsyncMock()
-            mock_instance.chat_completion.return_value = V2_TWO_SOURCE_RESPONSE
-            MockProvider.return_value = mock_instance
-
-            response = client.post(
-                "/api/chat",
-                json={"message": "What causes hot flashes and what about HRT?"},
-                headers=AUTH_HEADER,
-            )
+    override(mock_client)
+    openai_stub.content = V2_TWO_SOURCE_RESPONSE
+    response = client.post(
+        "/api/chat",
+        json={"message": "What causes hot flashes and what about HRT?"},
+        headers=AUTH_HEADER,
+    )
 
-        assert response.status_code == 200
-        body = response.json()
-        citations = body["citations"]
+    assert response.status_code == 200
+    body = response.json()
+    citations = body["citations"]
 
-        # Check that section names are present in citations
-        assert len(citations) == 2
-        assert citations[0]["section"] == "Vasomotor Symptoms"
-        assert citations[1]["section"] == "HRT Safety"
-    finally:
-        clear()
+    # Check that section names are present in citations
+    assert len(citations) == 2
+    assert citations[0]["section"] == "Vasomotor Symptoms"
+    assert citations[1]["section"] == "HRT Safety"
 
 
-def test_chat_handles_multiple_phantom_citations(client):
+def test_chat_handles_multiple_phantom_citations(client, openai_stub):
     # CATCHES: Only the first out-of-range source_index is dropped; subsequent ones still
     # produce [Source N] markers or citation entries in the response.
     response_json = json.dumps(
@@ -794,62 +679,36 @@ def test_chat_handles_multiple_phantom_citations(client):
         }
     )
     mock_client = make_mock_client()
-    clear = override(mock_client)
-    try:
-        with (
-            patch(
-                "app.api.dependencies.retrieve_relevant_chunks",
-                new=AsyncMock(return_value=SAMPLE_CHUNKS),
-            ),
-            patch("app.api.dependencies.OpenAIProvider") as MockProvider,
-        ):
-            mock_instance = AsyncMock()
-            mock_instance.chat_completion.return_value = response_json
-            MockProvider.return_value = mock_instance
-
-            response = client.post(
-                "/api/chat",
-                json={"message": "Tell me about symptoms"},
-                headers=AUTH_HEADER,
-            )
+    override(mock_client)
+    openai_stub.content = response_json
+    response = client.post(
+        "/api/chat",
+        json={"message": "Tell me about symptoms"},
+        headers=AUTH_HEADER,
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    # Out-of-range source indices (4 and 5) produce no markers
+    assert "[Source 4]" not in body["message"]
+    assert "[Source 5]" not in body["message"]
+    # Valid source indices produce markers
+    assert "[Source 1]" in body["message"]
+    assert "[Source 2]" in body["message"]
+    # Only 2 valid citations
+    assert len(body["citations"]) == 2
 
-        assert response.status_code == 200
-        body = response.json()
-        # Out-of-range source indices (4 and 5) produce no markers
-        assert "[Source 4]" not in body["message"]
-        assert "[Source 5]" not in body["message"]
-        # Valid source indices produce markers
-        assert "[Source 1]" in body["message"]
-        assert "[Source 2]" in body["message"]
-        # Only 2 valid citations
-        assert len(body["citations"]) == 2
-    finally:
-        clear()
-
-
-def test_chat_malformed_json_from_llm_returns_500(client):
+
+def test_chat_malformed_json_from_llm_returns_500(client, openai_stub):
     # CATCHES: Malformed JSON from the LLM is silently swallowed and the endpoint
     # returns 200 with an empty message rather than surfacing a 500 error.
     mock_client = make_mock_client()
-    clear = override(mock_client)
-    try:
-        with (
-            patch(
-                "app.api.dependencies.retrieve_relevant_chunks",
-                new=AsyncMock(return_value=SAMPLE_CHUNKS),
-            ),
-            patch("app.api.dependencies.OpenAIProvider") as MockProvider,
-        ):
-            mock_instance = AsyncMock()
-            mock_instance.chat_completion.return_value = "not valid json {{"
-            MockProvider.return_value = mock_instance
-
-            response = client.post(
-                "/api/chat",
-                json={"message": "Tell me about symptoms"},
-                headers=AUTH_HEADER,
-            )
+    override(mock_client)
+    openai_stub.content = "not valid json {{"
+    response = client.post(
+        "/api/chat",
+        json={"message": "Tell me about symptoms"},
+        headers=AUTH_HEADER,
+    )
 
-        assert response.status_code == 500
-    finally:
-        clear()
+    assert response.status_code == 500
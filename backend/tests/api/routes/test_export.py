@@ -5,9 +5,10 @@ called correctly. Business logic (CSV content, PDF bytes) is tested in
 test_export_service.py.
 """
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
-from fastapi.testclient import TestClient
+import pytest
 
 from app.api.dependencies import get_export_service
 from app.core.supabase import get_client
@@ -32,20 +33,6 @@ SAMPLE_REF = [
     {"id": "uuid-fatigue", "name": "Fatigue", "category": "energy"},
 ]
 
-MOCK_SUMMARY = (
-    "Logs show a pattern of vasomotor symptoms throughout the tracked period. "
-    "Data indicates that hot flashes and fatigue appeared together frequently. "
-    "These patterns may be worth discussing with your healthcare provider."
-)
-
-MOCK_QUESTIONS = [
-    "Could you help me understand why hot flashes and fatigue might occur together?",
-    "What might explain the frequency of vasomotor symptoms I've been logging?",
-    "How might sleep quality relate to the energy-related symptoms in my logs?",
-    "Could you help me understand what the co-occurrence of these symptoms indicates?",
-    "What might explain the pattern of symptoms logged during this period?",
-]
-
 VALID_PAYLOAD = {
     "date_range_start": "2024-03-01",
     "date_range_end": "2024-03-31",
@@ -84,10 +71,7 @@ class MockQueryBuilder:
         return self
 
     async def execute(self):
-        result = MagicMock()
-        result.data = self._data
-        result.error = self._error
-        return result
+        return SimpleNamespace(data=self._data, error=self._error)
 
 
 def make_mock_client(
@@ -102,7 +86,7 @@ def make_mock_client(
         mock.auth.get_user = AsyncMock(side_effect=auth_error)
     else:
         mock.auth.get_user = AsyncMock(
-            return_value=MagicMock(user=MagicMock(id=user_id))
+            return_value=SimpleNamespace(user=SimpleNamespace(id=user_id))
         )
 
     def table_side_effect(table_name):
@@ -122,9 +106,26 @@ def make_mock_client(
     return mock
 
 
-def override(mock_client):
+@pytest.fixture(scope="module")
+def default_mock_client():
+    """Supabase mock returning the default SAMPLE_LOG/SAMPLE_REF data.
+
+    Read-only, so tests that don't customise the data can share one. Tests
+    needing other data or an auth failure call make_mock_client() directly.
+    Validation-failure tests use it too: get_current_user_id authenticates
+    through client.auth.get_user before the request body is checked.
+    """
+    return make_mock_client()
+
+
+def override(mock_client, export_service=None):
+    """Override the DB client (and optionally the export service).
+
+    The route conftest clears the overrides after each test.
+    """
     app.dependency_overrides[get_client] = lambda: mock_client
-    return lambda: app.dependency_overrides.clear()
+    if export_service is not None:
+        app.dependency_overrides[get_export_service] = lambda: export_service
 
 
 # ---------------------------------------------------------------------------
@@ -162,22 +163,15 @@ def _mock_export_service(
 
 
 class TestPdfExport:
-    def test_pdf_export_success(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
+    def test_pdf_export_success(self, client, default_mock_client):
         mock_svc = _mock_export_service()
-        app.dependency_overrides[get_export_service] = lambda: mock_svc
-
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/export/pdf",
-                    json=VALID_PAYLOAD,
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
-            app.dependency_overrides.clear()
+
+        override(default_mock_client, mock_svc)
+        response = client.post(
+            "/api/export/pdf",
+            json=VALID_PAYLOAD,
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 200
         body = response.json()
@@ -186,104 +180,76 @@ class TestPdfExport:
         assert "filename" in body
         mock_svc.export_as_pdf.assert_called_once()
 
-    def test_pdf_export_requires_auth(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post("/api/export/pdf", json=VALID_PAYLOAD)
-        finally:
-            cleanup()
+    def test_pdf_export_requires_auth(self, client, default_mock_client):
+        override(default_mock_client)
+        response = client.post("/api/export/pdf", json=VALID_PAYLOAD)
 
         assert response.status_code == 401
 
-    def test_pdf_export_invalid_date_range_returns_400(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/export/pdf",
-                    json={
-                        "date_range_start": "2024-03-31",
-                        "date_range_end": "2024-03-01",
-                    },
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+    def test_pdf_export_invalid_date_range_returns_400(
+        self, client, default_mock_client
+    ):
+        override(default_mock_client)
+        response = client.post(
+            "/api/export/pdf",
+            json={
+                "date_range_start": "2024-03-31",
+                "date_range_end": "2024-03-01",
+            },
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 400
         assert "date_range_start" in response.json()["detail"]
 
-    def test_pdf_export_future_end_date_returns_400(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/export/pdf",
-                    json={
-                        "date_range_start": "2024-01-01",
-                        "date_range_end": "2099-12-31",
-                    },
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+    def test_pdf_export_future_end_date_returns_400(self, client, default_mock_client):
+        override(default_mock_client)
+        response = client.post(
+            "/api/export/pdf",
+            json={
+                "date_range_start": "2024-01-01",
+                "date_range_end": "2099-12-31",
+            },
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 400
         assert "future" in response.json()["detail"]
 
-    def test_pdf_export_no_data_returns_400(self):
+    def test_pdf_export_no_data_returns_400(self, client):
         mock = make_mock_client(log_data=[])
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/export/pdf",
-                    json=VALID_PAYLOAD,
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = client.post(
+            "/api/export/pdf",
+            json=VALID_PAYLOAD,
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 400
         assert "No symptom logs" in response.json()["detail"]
 
-    def test_pdf_generation_delegates_to_service(self):
+    def test_pdf_generation_delegates_to_service(self, client, default_mock_client):
         """Route delegates to ExportService.export_as_pdf — no direct LLM calls in route."""
-        mock = make_mock_client()
-        cleanup = override(mock)
         mock_svc = _mock_export_service()
-        app.dependency_overrides[get_export_service] = lambda: mock_svc
-
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/export/pdf",
-                    json=VALID_PAYLOAD,
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
-            app.dependency_overrides.clear()
+
+        override(default_mock_client, mock_svc)
+        response = client.post(
+            "/api/export/pdf",
+            json=VALID_PAYLOAD,
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 200
         mock_svc.export_as_pdf.assert_called_once()
 
-    def test_pdf_export_invalid_auth_token_returns_401(self):
+    def test_pdf_export_invalid_auth_token_returns_401(self, client):
         mock = make_mock_client(auth_error=Exception("JWT expired"))
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/export/pdf",
-                    json=VALID_PAYLOAD,
-                    headers={"Authorization": "Bearer bad-token"},
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = client.post(
+            "/api/export/pdf",
+            json=VALID_PAYLOAD,
+            headers={"Authorization": "Bearer bad-token"},
+        )
 
         assert response.status_code == 401
 
@@ -294,22 +260,15 @@ class TestPdfExport:
 
 
 class TestCsvExport:
-    def test_csv_export_success(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
+    def test_csv_export_success(self, client, default_mock_client):
         mock_svc = _mock_export_service()
-        app.dependency_overrides[get_export_service] = lambda: mock_svc
-
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/export/csv",
-                    json=VALID_PAYLOAD,
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
-            app.dependency_overrides.clear()
+
+        override(default_mock_client, mock_svc)
+        response = client.post(
+            "/api/export/csv",
+            json=VALID_PAYLOAD,
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 200
         body = response.json()
@@ -317,87 +276,61 @@ class TestCsvExport:
         assert "signed_url" in body
         mock_svc.export_as_csv.assert_called_once()
 
-    def test_csv_export_requires_auth(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post("/api/export/csv", json=VALID_PAYLOAD)
-        finally:
-            cleanup()
+    def test_csv_export_requires_auth(self, client, default_mock_client):
+        override(default_mock_client)
+        response = client.post("/api/export/csv", json=VALID_PAYLOAD)
 
         assert response.status_code == 401
 
-    def test_csv_export_invalid_date_range_returns_400(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/export/csv",
-                    json={
-                        "date_range_start": "2024-06-01",
-                        "date_range_end": "2024-01-01",
-                    },
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+    def test_csv_export_invalid_date_range_returns_400(
+        self, client, default_mock_client
+    ):
+        override(default_mock_client)
+        response = client.post(
+            "/api/export/csv",
+            json={
+                "date_range_start": "2024-06-01",
+                "date_range_end": "2024-01-01",
+            },
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 400
 
-    def test_csv_export_no_data_returns_400(self):
+    def test_csv_export_no_data_returns_400(self, client):
         mock = make_mock_client(log_data=[])
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/export/csv",
-                    json=VALID_PAYLOAD,
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = client.post(
+            "/api/export/csv",
+            json=VALID_PAYLOAD,
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 400
 
-    def test_csv_export_multiple_logs(self):
+    def test_csv_export_multiple_logs(self, client, default_mock_client):
         """Route delegates CSV logic to ExportService — multiple-log scenarios in service tests."""
-        mock = make_mock_client()
-        cleanup = override(mock)
         mock_svc = _mock_export_service()
-        app.dependency_overrides[get_export_service] = lambda: mock_svc
-
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/export/csv",
-                    json=VALID_PAYLOAD,
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
-            app.dependency_overrides.clear()
+
+        override(default_mock_client, mock_svc)
+        response = client.post(
+            "/api/export/csv",
+            json=VALID_PAYLOAD,
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 200
         assert response.json()["export_type"] == "csv"
 
-    def test_csv_log_with_no_symptoms(self):
+    def test_csv_log_with_no_symptoms(self, client, default_mock_client):
         """Route delegates log rendering to ExportService — content tested in service tests."""
-        mock = make_mock_client()
-        cleanup = override(mock)
         mock_svc = _mock_export_service()
-        app.dependency_overrides[get_export_service] = lambda: mock_svc
-
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/export/csv",
-                    json=VALID_PAYLOAD,
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
-            app.dependency_overrides.clear()
+
+        override(default_mock_client, mock_svc)
+        response = client.post(
+            "/api/export/csv",
+            json=VALID_PAYLOAD,
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 200
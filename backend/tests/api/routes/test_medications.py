@@ -3,8 +3,6 @@
 from datetime import date
 from unittest.mock import AsyncMock, MagicMock
 
-from fastapi.testclient import TestClient
-
 from app.api.dependencies import get_medication_service
 from app.core.supabase import get_client
 from app.main import app
@@ -68,39 +66,29 @@ def override_auth(mock_client):
     app.dependency_overrides[get_client] = lambda: mock_client
 
 
-def clear_overrides():
-    app.dependency_overrides.clear()
-
-
 # ---------------------------------------------------------------------------
 # GET /api/medications/reference
 # ---------------------------------------------------------------------------
 
 
 class TestSearchReference:
-    def test_search_reference_returns_list(self):
+    def test_search_reference_returns_list(self, client):
         mock_service = MagicMock()
         mock_service.search_reference = AsyncMock(return_value=[_REF])
         override_service(mock_service)
         override_auth(make_auth_client())
 
-        with TestClient(app) as client:
-            resp = client.get(
-                "/api/medications/reference?search=estro", headers=AUTH_HEADER
-            )
+        resp = client.get(
+            "/api/medications/reference?search=estro", headers=AUTH_HEADER
+        )
 
-        clear_overrides()
         assert resp.status_code == 200
         assert resp.json()[0]["generic_name"] == "estradiol"
 
-    def test_search_reference_requires_auth(self):
+    def test_search_reference_requires_auth(self, client):
         # Mock needed: prevents SupabaseException during DI before the 401 fires.
         override_auth(make_auth_client())
-        try:
-            with TestClient(app) as client:
-                resp = client.get("/api/medications/reference")
-        finally:
-            clear_overrides()
+        resp = client.get("/api/medications/reference")
         assert resp.status_code == 401
 
 
@@ -110,7 +98,7 @@ class TestSearchReference:
 
 
 class TestCreateReference:
-    def test_create_reference_returns_201(self):
+    def test_create_reference_returns_201(self, client):
         mock_service = MagicMock()
         mock_service.create_reference_entry = AsyncMock(return_value=_REF)
         override_service(mock_service)
@@ -122,12 +110,10 @@ class TestCreateReference:
             "common_forms": [],
             "common_doses": [],
         }
-        with TestClient(app) as client:
-            resp = client.post(
-                "/api/medications/reference", json=payload, headers=AUTH_HEADER
-            )
+        resp = client.post(
+            "/api/medications/reference", json=payload, headers=AUTH_HEADER
+        )
 
-        clear_overrides()
         assert resp.status_code == 201
 
 
@@ -137,40 +123,32 @@ class TestCreateReference:
 
 
 class TestGetCurrentMedications:
-    def test_get_current_returns_active_medications(self):
+    def test_get_current_returns_active_medications(self, client):
         mock_service = MagicMock()
         mock_service.list_current = AsyncMock(return_value=[_MED])
         override_service(mock_service)
         override_auth(make_auth_client())
 
-        with TestClient(app) as client:
-            resp = client.get("/api/medications/current", headers=AUTH_HEADER)
+        resp = client.get("/api/medications/current", headers=AUTH_HEADER)
 
-        clear_overrides()
         assert resp.status_code == 200
         assert resp.json()[0]["medication_name"] == "Estradiol"
 
-    def test_get_current_returns_empty_when_disabled(self):
+    def test_get_current_returns_empty_when_disabled(self, client):
         mock_service = MagicMock()
         mock_service.list_current = AsyncMock(return_value=[])
         override_service(mock_service)
         override_auth(make_auth_client())
 
-        with TestClient(app) as client:
-            resp = client.get("/api/medications/current", headers=AUTH_HEADER)
+        resp = client.get("/api/medications/current", headers=AUTH_HEADER)
 
-        clear_overrides()
         assert resp.status_code == 200
         assert resp.json() == []
 
-    def test_get_current_requires_auth(self):
+    def test_get_current_requires_auth(self, client):
         # Mock needed: prevents SupabaseException during DI before the 401 fires.
         override_auth(make_auth_client())
-        try:
-            with TestClient(app) as client:
-                resp = client.get("/api/medications/current")
-        finally:
-            clear_overrides()
+        resp = client.get("/api/medications/current")
         assert resp.status_code == 401
 
 
@@ -180,16 +158,14 @@ class TestGetCurrentMedications:
 
 
 class TestListMedications:
-    def test_list_all_returns_200(self):
+    def test_list_all_returns_200(self, client):
         mock_service = MagicMock()
         mock_service.list = AsyncMock(return_value=[_MED])
         override_service(mock_service)
         override_auth(make_auth_client())
 
-        with TestClient(app) as client:
-            resp = client.get("/api/medications", headers=AUTH_HEADER)
+        resp = client.get("/api/medications", headers=AUTH_HEADER)
 
-        clear_overrides()
         assert resp.status_code == 200
         assert len(resp.json()) == 1
 
@@ -200,7 +176,7 @@ class TestListMedications:
 
 
 class TestCreateMedication:
-    def test_create_returns_201(self):
+    def test_create_returns_201(self, client):
         mock_service = MagicMock()
         mock_service.create = AsyncMock(return_value=_MED)
         override_service(mock_service)
@@ -212,14 +188,12 @@ class TestCreateMedication:
             "delivery_method": "patch",
             "start_date": "2026-01-01",
         }
-        with TestClient(app) as client:
-            resp = client.post("/api/medications", json=payload, headers=AUTH_HEADER)
+        resp = client.post("/api/medications", json=payload, headers=AUTH_HEADER)
 
-        clear_overrides()
         assert resp.status_code == 201
         assert resp.json()["medication_name"] == "Estradiol"
 
-    def test_create_returns_400_on_validation_error(self):
+    def test_create_returns_400_on_validation_error(self, client):
         from app.exceptions import ValidationError as DomainValidationError
 
         mock_service = MagicMock()
@@ -235,20 +209,14 @@ class TestCreateMedication:
             "delivery_method": "patch",
             "start_date": "2026-01-01",
         }
-        with TestClient(app) as client:
-            resp = client.post("/api/medications", json=payload, headers=AUTH_HEADER)
+        resp = client.post("/api/medications", json=payload, headers=AUTH_HEADER)
 
-        clear_overrides()
         assert resp.status_code == 400
 
-    def test_create_requires_auth(self):
+    def test_create_requires_auth(self, client):
         # Mock needed: prevents SupabaseException during DI before the 401 fires.
         override_auth(make_auth_client())
-        try:
-            with TestClient(app) as client:
-                resp = client.post("/api/medications", json={})
-        finally:
-            clear_overrides()
+        resp = client.post("/api/medications", json={})
         assert resp.status_code == 401
 
 
@@ -258,20 +226,18 @@ class TestCreateMedication:
 
 
 class TestGetMedication:
-    def test_get_returns_medication(self):
+    def test_get_returns_medication(self, client):
         mock_service = MagicMock()
         mock_service.get = AsyncMock(return_value=_MED)
         override_service(mock_service)
         override_auth(make_auth_client())
 
-        with TestClient(app) as client:
-            resp = client.get(f"/api/medications/{MED_ID}", headers=AUTH_HEADER)
+        resp = client.get(f"/api/medications/{MED_ID}", headers=AUTH_HEADER)
 
-        clear_overrides()
         assert resp.status_code == 200
         assert resp.json()["id"] == MED_ID
 
-    def test_get_returns_404_when_not_found(self):
+    def test_get_returns_404_when_not_found(self, client):
         from app.exceptions import EntityNotFoundError
 
         mock_service = MagicMock()
@@ -279,10 +245,8 @@ class TestGetMedication:
         override_service(mock_service)
         override_auth(make_auth_client())
 
-        with TestClient(app) as client:
-            resp = client.get("/api/medications/nonexistent", headers=AUTH_HEADER)
+        resp = client.get("/api/medications/nonexistent", headers=AUTH_HEADER)
 
-        clear_overrides()
         assert resp.status_code == 404
 
 
@@ -292,23 +256,21 @@ class TestGetMedication:
 
 
 class TestUpdateMedication:
-    def test_update_returns_200(self):
+    def test_update_returns_200(self, client):
         mock_service = MagicMock()
         mock_service.update = AsyncMock(return_value=_MED)
         override_service(mock_service)
         override_auth(make_auth_client())
 
-        with TestClient(app) as client:
-            resp = client.put(
-                f"/api/medications/{MED_ID}",
-                json={"notes": "updated"},
-                headers=AUTH_HEADER,
-            )
+        resp = client.put(
+            f"/api/medications/{MED_ID}",
+            json={"notes": "updated"},
+            headers=AUTH_HEADER,
+        )
 
-        clear_overrides()
         assert resp.status_code == 200
 
-    def test_update_returns_400_on_validation_error(self):
+    def test_update_returns_400_on_validation_error(self, client):
         from app.exceptions import ValidationError as DomainValidationError
 
         mock_service = MagicMock()
@@ -318,14 +280,12 @@ class TestUpdateMedication:
         override_service(mock_service)
         override_auth(make_auth_client())
 
-        with TestClient(app) as client:
-            resp = client.put(
-                f"/api/medications/{MED_ID}",
-                json={"end_date": "2025-01-01"},
-                headers=AUTH_HEADER,
-            )
+        resp = client.put(
+            f"/api/medications/{MED_ID}",
+            json={"end_date": "2025-01-01"},
+            headers=AUTH_HEADER,
+        )
 
-        clear_overrides()
         assert resp.status_code == 400
 
 
@@ -335,7 +295,7 @@ class TestUpdateMedication:
 
 
 class TestChangeDose:
-    def test_change_dose_returns_201(self):
+    def test_change_dose_returns_201(self, client):
         mock_service = MagicMock()
         mock_service.change_dose = AsyncMock(
             return_value=MedicationChangeDoseResponse(
@@ -351,18 +311,16 @@ class TestChangeDose:
             "delivery_method": "gel",
             "effective_date": "2026-03-01",
         }
-        with TestClient(app) as client:
-            resp = client.post(
-                f"/api/medications/{MED_ID}/change",
-                json=payload,
-                headers=AUTH_HEADER,
-            )
+        resp = client.post(
+            f"/api/medications/{MED_ID}/change",
+            json=payload,
+            headers=AUTH_HEADER,
+        )
 
-        clear_overrides()
         assert resp.status_code == 201
         assert resp.json()["new_medication_id"] == "new-id"
 
-    def test_change_dose_returns_400_on_validation_error(self):
+    def test_change_dose_returns_400_on_validation_error(self, client):
         from app.exceptions import ValidationError as DomainValidationError
 
         mock_service = MagicMock()
@@ -377,14 +335,12 @@ class TestChangeDose:
             "delivery_method": "gel",
             "effective_date": "2025-01-01",
         }
-        with TestClient(app) as client:
-            resp = client.post(
-                f"/api/medications/{MED_ID}/change",
-                json=payload,
-                headers=AUTH_HEADER,
-            )
+        resp = client.post(
+            f"/api/medications/{MED_ID}/change",
+            json=payload,
+            headers=AUTH_HEADER,
+        )
 
-        clear_overrides()
         assert resp.status_code == 400
 
 
@@ -394,19 +350,17 @@ class TestChangeDose:
 
 
 class TestDeleteMedication:
-    def test_delete_returns_204(self):
+    def test_delete_returns_204(self, client):
         mock_service = MagicMock()
         mock_service.delete = AsyncMock(return_value=None)
         override_service(mock_service)
         override_auth(make_auth_client())
 
-        with TestClient(app) as client:
-            resp = client.delete(f"/api/medications/{MED_ID}", headers=AUTH_HEADER)
+        resp = client.delete(f"/api/medications/{MED_ID}", headers=AUTH_HEADER)
 
-        clear_overrides()
         assert resp.status_code == 204
 
-    def test_delete_returns_404_when_not_found(self):
+    def test_delete_returns_404_when_not_found(self, client):
         from app.exceptions import EntityNotFoundError
 
         mock_service = MagicMock()
@@ -414,10 +368,8 @@ class TestDeleteMedication:
         override_service(mock_service)
         override_auth(make_auth_client())
 
-        with TestClient(app) as client:
-            resp = client.delete("/api/medications/nonexistent", headers=AUTH_HEADER)
+        resp = client.delete("/api/medications/nonexistent", headers=AUTH_HEADER)
 
-        clear_overrides()
         assert resp.status_code == 404
 
 
@@ -427,7 +379,7 @@ class TestDeleteMedication:
 
 
 class TestSymptomComparison:
-    def test_comparison_returns_200(self):
+    def test_comparison_returns_200(self, client):
         mock_service = MagicMock()
         mock_service.get_symptom_comparison = AsyncMock(
             return_value=SymptomComparisonResponse(
@@ -443,17 +395,15 @@ class TestSymptomComparison:
         override_service(mock_service)
         override_auth(make_auth_client())
 
-        with TestClient(app) as client:
-            resp = client.get(
-                f"/api/medications/{MED_ID}/symptom-comparison",
-                headers=AUTH_HEADER,
-            )
+        resp = client.get(
+            f"/api/medications/{MED_ID}/symptom-comparison",
+            headers=AUTH_HEADER,
+        )
 
-        clear_overrides()
         assert resp.status_code == 200
         assert resp.json()["medication_id"] == MED_ID
 
-    def test_comparison_returns_404_when_medication_not_found(self):
+    def test_comparison_returns_404_when_medication_not_found(self, client):
         from app.exceptions import EntityNotFoundError
 
         mock_service = MagicMock()
@@ -463,21 +413,15 @@ class TestSymptomComparison:
         override_service(mock_service)
         override_auth(make_auth_client())
 
-        with TestClient(app) as client:
-            resp = client.get(
-                "/api/medications/nonexistent/symptom-comparison",
-                headers=AUTH_HEADER,
-            )
+        resp = client.get(
+            "/api/medications/nonexistent/symptom-comparison",
+            headers=AUTH_HEADER,
+        )
 
-        clear_overrides()
         assert resp.status_code == 404
 
-    def test_comparison_requires_auth(self):
+    def test_comparison_requires_auth(self, client):
         # Mock needed: prevents SupabaseException during DI before the 401 fires.
         override_auth(make_auth_client())
-        try:
-            with TestClient(app) as client:
-                resp = client.get(f"/api/medications/{MED_ID}/symptom-comparison")
-        finally:
-            clear_overrides()
+        resp = client.get(f"/api/medications/{MED_ID}/symptom-comparison")
         assert resp.status_code == 401
@@ -3,8 +3,6 @@
 from datetime import date, datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 
-from fastapi.testclient import TestClient
-
 from app.api.dependencies import get_period_service
 from app.core.supabase import get_client
 from app.main import app
@@ -63,17 +61,13 @@ def override_auth(mock_client):
     app.dependency_overrides[get_client] = lambda: mock_client
 
 
-def clear_overrides():
-    app.dependency_overrides.clear()
-
-
 # ---------------------------------------------------------------------------
 # POST /api/period/logs
 # ---------------------------------------------------------------------------
 
 
 class TestCreatePeriodLog:
-    def test_create_log_success(self):
+    def test_create_log_success(self, client):
         mock_service = MagicMock()
         mock_service.create_log = AsyncMock(
             return_value=CreatePeriodLogResponse(log=PERIOD_LOG, bleeding_alert=False)
@@ -82,22 +76,18 @@ class TestCreatePeriodLog:
         override_service(mock_service)
         override_auth(auth_client)
 
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/period/logs",
-                    json={"period_start": "2026-03-01", "flow_level": "medium"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            clear_overrides()
+        response = client.post(
+            "/api/period/logs",
+            json={"period_start": "2026-03-01", "flow_level": "medium"},
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 201
         body = response.json()
         assert body["log"]["period_start"] == "2026-03-01"
         assert body["bleeding_alert"] is False
 
-    def test_create_log_returns_bleeding_alert_true(self):
+    def test_create_log_returns_bleeding_alert_true(self, client):
         mock_service = MagicMock()
         mock_service.create_log = AsyncMock(
             return_value=CreatePeriodLogResponse(log=PERIOD_LOG, bleeding_alert=True)
@@ -106,77 +96,61 @@ class TestCreatePeriodLog:
         override_service(mock_service)
         override_auth(auth_client)
 
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/period/logs",
-                    json={"period_start": "2026-03-01"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            clear_overrides()
+        response = client.post(
+            "/api/period/logs",
+            json={"period_start": "2026-03-01"},
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 201
         assert response.json()["bleeding_alert"] is True
 
-    def test_create_log_requires_auth(self):
+    def test_create_log_requires_auth(self, client):
         mock_service = MagicMock()
         auth_client = MagicMock()
         auth_client.auth.get_user = AsyncMock(side_effect=Exception("No token"))
         override_service(mock_service)
         override_auth(auth_client)
 
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/period/logs",
-                    json={"period_start": "2026-03-01"},
-                )
-        finally:
-            clear_overrides()
+        response = client.post(
+            "/api/period/logs",
+            json={"period_start": "2026-03-01"},
+        )
 
         assert response.status_code == 401
 
-    def test_create_log_missing_period_start_returns_422(self):
+    def test_create_log_missing_period_start_returns_422(self, client):
         mock_service = MagicMock()
         auth_client = make_auth_client()
         override_service(mock_service)
         override_auth(auth_client)
 
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/period/logs",
-                    json={"flow_level": "medium"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            clear_overrides()
+        response = client.post(
+            "/api/period/logs",
+            json={"flow_level": "medium"},
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 422
 
-    def test_create_log_validates_date_order(self):
+    def test_create_log_validates_date_order(self, client):
         mock_service = MagicMock()
         auth_client = make_auth_client()
         override_service(mock_service)
         override_auth(auth_client)
 
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/period/logs",
-                    json={
-                        "period_start": "2026-03-10",
-                        "period_end": "2026-03-01",  # before start
-                    },
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            clear_overrides()
+        response = client.post(
+            "/api/period/logs",
+            json={
+                "period_start": "2026-03-10",
+                "period_end": "2026-03-01",  # before start
+            },
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 422
 
-    def test_create_log_with_full_payload(self):
+    def test_create_log_with_full_payload(self, client):
         mock_service = MagicMock()
         mock_service.create_log = AsyncMock(
             return_value=CreatePeriodLogResponse(log=PERIOD_LOG, bleeding_alert=False)
@@ -185,20 +159,16 @@ class TestCreatePeriodLog:
         override_service(mock_service)
         override_auth(auth_client)
 
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/period/logs",
-                    json={
-                        "period_start": "2026-03-01",
-                        "period_end": "2026-03-05",
-                        "flow_level": "heavy",
-                        "notes": "Very heavy this month",
-                    },
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            clear_overrides()
+        response = client.post(
+            "/api/period/logs",
+            json={
+                "period_start": "2026-03-01",
+                "period_end": "2026-03-05",
+                "flow_level": "heavy",
+                "notes": "Very heavy this month",
+            },
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 201
 
@@ -209,23 +179,19 @@ class TestCreatePeriodLog:
 
 
 class TestListPeriodLogs:
-    def test_list_logs_returns_empty_list(self):
+    def test_list_logs_returns_empty_list(self, client):
         mock_service = MagicMock()
         mock_service.get_logs = AsyncMock(return_value=PeriodLogListResponse(logs=[]))
         auth_client = make_auth_client()
         override_service(mock_service)
         override_auth(auth_client)
 
-        try:
-            with TestClient(app) as client:
-                response = client.get("/api/period/logs", headers=AUTH_HEADER)
-        finally:
-            clear_overrides()
+        response = client.get("/api/period/logs", headers=AUTH_HEADER)
 
         assert response.status_code == 200
         assert response.json()["logs"] == []
 
-    def test_list_logs_returns_logs(self):
+    def test_list_logs_returns_logs(self, client):
         mock_service = MagicMock()
         mock_service.get_logs = AsyncMock(
             return_value=PeriodLogListResponse(logs=[PERIOD_LOG])
@@ -234,47 +200,35 @@ class TestListPeriodLogs:
         override_service(mock_service)
         override_auth(auth_client)
 
-        try:
-            with TestClient(app) as client:
-                response = client.get("/api/period/logs", headers=AUTH_HEADER)
-        finally:
-            clear_overrides()
+        response = client.get("/api/period/logs", headers=AUTH_HEADER)
 
         assert response.status_code == 200
         assert len(response.json()["logs"]) == 1
 
-    def test_list_logs_passes_date_params_to_service(self):
+    def test_list_logs_passes_date_params_to_service(self, client):
         mock_service = MagicMock()
         mock_service.get_logs = AsyncMock(return_value=PeriodLogListResponse(logs=[]))
         auth_client = make_auth_client()
         override_service(mock_service)
         override_auth(auth_client)
 
-        try:
-            with TestClient(app) as client:
-                client.get(
-                    "/api/period/logs?start_date=2026-01-01&end_date=2026-03-31",
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            clear_overrides()
+        client.get(
+            "/api/period/logs?start_date=2026-01-01&end_date=2026-03-31",
+            headers=AUTH_HEADER,
+        )
 
         mock_service.get_logs.assert_called_once_with(
             USER_ID, "2026-01-01", "2026-03-31"
         )
 
-    def test_list_logs_requires_auth(self):
+    def test_list_logs_requires_auth(self, client):
         mock_service = MagicMock()
         auth_client = MagicMock()
         auth_client.auth.get_user = AsyncMock(side_effect=Exception("No token"))
         override_service(mock_service)
         override_auth(auth_client)
 
-        try:
-            with TestClient(app) as client:
-                response = client.get("/api/period/logs")
-        finally:
-            clear_overrides()
+        response = client.get("/api/period/logs")
 
         assert response.status_code == 401
 
@@ -285,7 +239,7 @@ class TestListPeriodLogs:
 
 
 class TestUpdatePeriodLog:
-    def test_update_log_success(self):
+    def test_update_log_success(self, client):
         updated = PERIOD_LOG.model_copy(update={"flow_level": "heavy"})
         mock_service = MagicMock()
         mock_service.update_log = AsyncMock(return_value=updated)
@@ -293,34 +247,26 @@ class TestUpdatePeriodLog:
         override_service(mock_service)
         override_auth(auth_client)
 
-        try:
-            with TestClient(app) as client:
-                response = client.patch(
-                    f"/api/period/logs/{LOG_ID}",
-                    json={"flow_level": "heavy"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            clear_overrides()
+        response = client.patch(
+            f"/api/period/logs/{LOG_ID}",
+            json={"flow_level": "heavy"},
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 200
         assert response.json()["flow_level"] == "heavy"
 
-    def test_update_log_requires_auth(self):
+    def test_update_log_requires_auth(self, client):
         mock_service = MagicMock()
         auth_client = MagicMock()
         auth_client.auth.get_user = AsyncMock(side_effect=Exception("No token"))
         override_service(mock_service)
         override_auth(auth_client)
 
-        try:
-            with TestClient(app) as client:
-                response = client.patch(
-                    f"/api/period/logs/{LOG_ID}",
-                    json={"flow_level": "light"},
-                )
-        finally:
-            clear_overrides()
+        response = client.patch(
+            f"/api/period/logs/{LOG_ID}",
+            json={"flow_level": "light"},
+        )
 
         assert response.status_code == 401
 
@@ -331,35 +277,25 @@ class TestUpdatePeriodLog:
 
 
 class TestDeletePeriodLog:
-    def test_delete_log_success(self):
+    def test_delete_log_success(self, client):
         mock_service = MagicMock()
         mock_service.delete_log = AsyncMock(return_value=None)
         auth_client = make_auth_client()
         override_service(mock_service)
         override_auth(auth_client)
 
-        try:
-            with TestClient(app) as client:
-                response = client.delete(
-                    f"/api/period/logs/{LOG_ID}", headers=AUTH_HEADER
-                )
-        finally:
-            clear_overrides()
+        response = client.delete(f"/api/period/logs/{LOG_ID}", headers=AUTH_HEADER)
 
         assert response.status_code == 204
 
-    def test_delete_log_requires_auth(self):
+    def test_delete_log_requires_auth(self, client):
         mock_service = MagicMock()
         auth_client = MagicMock()
         auth_client.auth.get_user = AsyncMock(side_effect=Exception("No token"))
         override_service(mock_service)
         override_auth(auth_client)
 
-        try:
-            with TestClient(app) as client:
-                response = client.delete(f"/api/period/logs/{LOG_ID}")
-        finally:
-            clear_overrides()
+        response = client.delete(f"/api/period/logs/{LOG_ID}")
 
         assert response.status_code == 401
 
@@ -370,25 +306,21 @@ class TestDeletePeriodLog:
 
 
 class TestGetCycleAnalysis:
-    def test_get_analysis_success(self):
+    def test_get_analysis_success(self, client):
         mock_service = MagicMock()
         mock_service.get_analysis = AsyncMock(return_value=CYCLE_ANALYSIS)
         auth_client = make_auth_client()
         override_service(mock_service)
         override_auth(auth_client)
 
-        try:
-            with TestClient(app) as client:
-                response = client.get("/api/period/analysis", headers=AUTH_HEADER)
-        finally:
-            clear_overrides()
+        response = client.get("/api/period/analysis", headers=AUTH_HEADER)
 
         assert response.status_code == 200
         body = response.json()
         assert body["average_cycle_length"] == 28.0
         assert body["has_sufficient_data"] is True
 
-    def test_get_analysis_empty_when_no_logs(self):
+    def test_get_analysis_empty_when_no_logs(self, client):
         mock_service = MagicMock()
         mock_service.get_analysis = AsyncMock(
             return_value=CycleAnalysisResponse(has_sufficient_data=False)
@@ -397,27 +329,19 @@ class TestGetCycleAnalysis:
         override_service(mock_service)
         override_auth(auth_client)
 
-        try:
-            with TestClient(app) as client:
-                response = client.get("/api/period/analysis", headers=AUTH_HEADER)
-        finally:
-            clear_overrides()
+        response = client.get("/api/period/analysis", headers=AUTH_HEADER)
 
         assert response.status_code == 200
         assert response.json()["has_sufficient_data"] is False
         assert response.json()["average_cycle_length"] is None
 
-    def test_get_analysis_requires_auth(self):
+    def test_get_analysis_requires_auth(self, client):
         mock_service = MagicMock()
         auth_client = MagicMock()
         auth_client.auth.get_user = AsyncMock(side_effect=Exception("No token"))
         override_service(mock_service)
         override_auth(auth_client)
 
-        try:
-            with TestClient(app) as client:
-                response = client.get("/api/period/analysis")
-        finally:
-            clear_overrides()
+        response = client.get("/api/period/analysis")
 
         assert response.status_code == 401
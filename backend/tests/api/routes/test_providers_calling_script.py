@@ -0,0 +1,120 @@
+"""Tests for POST /api/providers/calling-script.
+
+Requires auth; auth and the LLM service are mocked via dependency_overrides.
+Requests go through the async ASGI client (aclient) rather than TestClient.
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.api.dependencies import get_llm_service
+from app.main import app
+from app.services.llm import LLMService
+from tests.fixtures.providers import override_both
+
+_MOCK_SCRIPT = (
+    "Hi, I'm calling to inquire about a new patient appointment with Dr. Smith."
+)
+
+_BASE_PAYLOAD = {
+    "provider_id": "uuid-1",
+    "provider_name": "Dr. Jane Smith",
+    "insurance_type": "private",
+    "insurance_plan_name": "Aetna PPO",
+    "insurance_plan_unknown": False,
+    "interested_in_telehealth": False,
+}
+
+# Every successful calling-script response in this module has this exact body
+_EXPECTED_SCRIPT_RESPONSE = {"script": _MOCK_SCRIPT, "provider_name": "Dr. Jane Smith"}
+
+
+@pytest.fixture
+def mock_llm_service():
+    """Override auth and the LLM service; the mock returns _MOCK_SCRIPT.
+
+    Tests needing a failure set generate_calling_script.side_effect instead of
+    installing their own override.
+    """
+    mock_llm_service = AsyncMock(spec=LLMService)
+    mock_llm_service.generate_calling_script = AsyncMock(return_value=_MOCK_SCRIPT)
+
+    override_both()
+    app.dependency_overrides[get_llm_service] = lambda: mock_llm_service
+    return mock_llm_service
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestGenerateCallingScript:
+    async def _post(self, aclient, payload):
+        return await aclient.post("/api/providers/calling-script", json=payload)
+
+    async def test_private_insurance_with_plan_returns_script(
+        self, aclient, mock_llm_service
+    ):
+        response = await self._post(aclient, _BASE_PAYLOAD)
+
+        assert response.status_code == 200
+        assert response.json() == _EXPECTED_SCRIPT_RESPONSE
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            pytest.param({"insurance_plan_name": None}, id="private_no_plan"),
+            pytest.param(
+                {"insurance_type": "medicaid", "insurance_plan_name": "UCare"},
+                id="medicaid_with_plan",
+            ),
+            pytest.param(
+                {
+                    "insurance_type": "medicaid",
+                    "insurance_plan_name": None,
+                    "insurance_plan_unknown": True,
+                },
+                id="medicaid_plan_unknown",
+            ),
+            pytest.param(
+                {"insurance_type": "medicare", "insurance_plan_name": "Humana Gold"},
+                id="medicare_advantage_plan",
+            ),
+            pytest.param(
+                {"insurance_type": "medicare", "insurance_plan_name": None},
+                id="medicare_original_no_plan",
+            ),
+            pytest.param(
+                {"insurance_type": "self_pay", "insurance_plan_name": None},
+                id="self_pay",
+            ),
+            pytest.param({"insurance_type": "other"}, id="other_insurance"),
+            pytest.param({"interested_in_telehealth": True}, id="telehealth"),
+        ],
+    )
+    async def test_insurance_variant_returns_script(
+        self, aclient, mock_llm_service, overrides
+    ):
+        response = await self._post(aclient, {**_BASE_PAYLOAD, **overrides})
+
+        assert response.status_code == 200
+        assert response.json() == _EXPECTED_SCRIPT_RESPONSE
+
+    async def test_blank_provider_name_returns_400(self, aclient, mock_llm_service):
+        payload = {**_BASE_PAYLOAD, "provider_name": "   "}
+        response = await self._post(aclient, payload)
+
+        assert response.status_code == 400
+        assert "provider_name" in response.json()["detail"]
+
+    async def test_invalid_insurance_type_returns_422(self, aclient, mock_llm_service):
+        payload = {**_BASE_PAYLOAD, "insurance_type": "not_valid"}
+        response = await self._post(aclient, payload)
+
+        assert response.status_code == 422
+
+    async def test_llm_failure_returns_500(self, aclient, mock_llm_service):
+        mock_llm_service.generate_calling_script.side_effect = RuntimeError("LLM down")
+
+        response = await self._post(aclient, _BASE_PAYLOAD)
+
+        assert response.status_code == 500
+        assert "calling script" in response.json()["detail"].lower()
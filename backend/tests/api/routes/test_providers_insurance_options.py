@@ -0,0 +1,85 @@
+"""Tests for GET /api/providers/insurance-options (public, Supabase mocked)."""
+
+from tests.fixtures.providers import send
+
+
+class TestListInsuranceOptions:
+    def test_returns_sorted_deduplicated_options(self, client):
+        data = [
+            {"insurance_accepted": ["Cigna", "Aetna"]},
+            {"insurance_accepted": ["Aetna", "Blue Cross"]},  # Aetna is a duplicate
+        ]
+        response = send(
+            client,
+            "GET",
+            "/api/providers/insurance-options",
+            tables={"providers": data},
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body == sorted({"Cigna", "Aetna", "Blue Cross"})
+        assert len(body) == 3
+
+    def test_returns_empty_list_when_no_insurance_data(self, client):
+        response = send(
+            client,
+            "GET",
+            "/api/providers/insurance-options",
+            tables={"providers": [{"insurance_accepted": None}]},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+    def test_returns_empty_list_when_no_providers(self, client):
+        response = send(
+            client, "GET", "/api/providers/insurance-options", tables={"providers": []}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+    def test_alphabetical_ordering(self, client):
+        data = [
+            {"insurance_accepted": ["Zetra Health", "Aetna", "Medicare"]},
+        ]
+        response = send(
+            client,
+            "GET",
+            "/api/providers/insurance-options",
+            tables={"providers": data},
+        )
+
+        body = response.json()
+        assert body == sorted(body)
+
+    def test_commercial_insurance_normalized_to_private_insurance(self, client):
+        data = [{"insurance_accepted": ["Commercial Insurance", "Medicare"]}]
+        response = send(
+            client,
+            "GET",
+            "/api/providers/insurance-options",
+            tables={"providers": data},
+        )
+
+        body = response.json()
+        assert "Private Insurance" in body
+        assert "Commercial Insurance" not in body
+
+    def test_deduplicates_after_normalization(self, client):
+        """Both raw and canonical forms in the DB collapse to one entry."""
+        data = [
+            {"insurance_accepted": ["Commercial Insurance"]},
+            {"insurance_accepted": ["Private Insurance"]},  # canonical already present
+        ]
+        response = send(
+            client,
+            "GET",
+            "/api/providers/insurance-options",
+            tables={"providers": data},
+        )
+
+        body = response.json()
+        assert body.count("Private Insurance") == 1
+        assert "Commercial Insurance" not in body
@@ -0,0 +1,228 @@
+"""Tests for GET /api/providers/search.
+
+All Supabase calls are mocked via FastAPI's dependency_overrides.
+Provider endpoints are public — no auth required.
+"""
+
+from app.models.providers import ProviderSearchResponse
+from tests.fixtures.providers import (
+    PROVIDER_MN,
+    PROVIDER_MN_2,
+    make_providers,
+    make_zip_mock_client,
+    override,
+    send,
+)
+
+
+class TestSearchProviders:
+    def test_returns_paginated_results_for_state(self, client):
+        response = send(
+            client,
+            "GET",
+            "/api/providers/search?state=MN",
+            tables={"providers": [PROVIDER_MN, PROVIDER_MN_2]},
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total"] == 2
+        assert body["page"] == 1
+        assert body["page_size"] == 20
+        assert body["total_pages"] == 1
+        assert len(body["providers"]) == 2
+        # Every provider card must match the response model, not just one
+        ProviderSearchResponse.model_validate_json(response.content)
+
+    def test_returns_400_when_no_state_or_zip(self, client):
+        response = send(
+            client, "GET", "/api/providers/search", tables={"providers": []}
+        )
+
+        assert response.status_code == 400
+        detail = response.json()["detail"].lower()
+        assert "state" in detail or "zip" in detail
+
+    def test_returns_422_when_page_size_exceeds_50(self, client):
+        response = send(
+            client,
+            "GET",
+            "/api/providers/search?state=MN&page_size=51",
+            tables={"providers": []},
+        )
+
+        assert response.status_code == 422
+
+    def test_city_exact_match_filters_results(self, client):
+        response = send(
+            client,
+            "GET",
+            "/api/providers/search?state=MN&city=Minneapolis",
+            tables={"providers": [PROVIDER_MN, PROVIDER_MN_2]},
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total"] == 1
+        assert body["providers"][0]["city"] == "Minneapolis"
+
+    def test_city_case_insensitive_exact_match(self, client):
+        response = send(
+            client,
+            "GET",
+            "/api/providers/search?state=MN&city=minneapolis",
+            tables={"providers": [PROVIDER_MN, PROVIDER_MN_2]},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 1
+
+    def test_city_partial_match_fallback_when_no_exact_match(self, client):
+        # "chester" is a substring of "Rochester" but not an exact match
+        response = send(
+            client,
+            "GET",
+            "/api/providers/search?state=MN&city=chester",
+            tables={"providers": [PROVIDER_MN, PROVIDER_MN_2]},
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total"] == 1
+        assert body["providers"][0]["city"] == "Rochester"
+
+    def test_city_no_results_when_no_match(self, client):
+        response = send(
+            client,
+            "GET",
+            "/api/providers/search?state=MN&city=Duluth",
+            tables={"providers": [PROVIDER_MN, PROVIDER_MN_2]},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 0
+
+    def test_insurance_filter_case_insensitive(self, client):
+        # "aetna" should match PROVIDER_MN which has "Aetna"
+        response = send(
+            client,
+            "GET",
+            "/api/providers/search?state=MN&insurance=aetna",
+            tables={"providers": [PROVIDER_MN, PROVIDER_MN_2]},
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total"] == 1
+        assert body["providers"][0]["id"] == "uuid-1"
+
+    def test_insurance_filter_no_match_returns_empty(self, client):
+        response = send(
+            client,
+            "GET",
+            "/api/providers/search?state=MN&insurance=NonExistentInsurance",
+            tables={"providers": [PROVIDER_MN, PROVIDER_MN_2]},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 0
+
+    def test_state_code_normalized_to_uppercase(self, client):
+        """Lowercase state code should produce the same results as uppercase."""
+        response = send(
+            client,
+            "GET",
+            "/api/providers/search?state=mn",
+            tables={"providers": [PROVIDER_MN]},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 1
+
+    def test_pagination_page_2_returns_correct_slice(self, client):
+        response = send(
+            client,
+            "GET",
+            "/api/providers/search?state=MN&page=2&page_size=2",
+            tables={"providers": make_providers(3)},
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total"] == 3
+        assert body["page"] == 2
+        assert body["total_pages"] == 2
+        assert len(body["providers"]) == 1
+
+    def test_nams_certified_providers_sorted_first(self, client):
+        non_nams = {
+            **PROVIDER_MN,
+            "id": "uuid-non",
+            "name": "Dr. AAA NonNams",
+            "nams_certified": False,
+        }
+        nams = {
+            **PROVIDER_MN,
+            "id": "uuid-nams",
+            "name": "Dr. ZZZ Nams",
+            "nams_certified": True,
+        }
+        response = send(
+            client,
+            "GET",
+            "/api/providers/search?state=MN&nams_only=false",
+            tables={"providers": [non_nams, nams]},
+        )
+
+        assert response.status_code == 200
+        providers = response.json()["providers"]
+        # NAMS certified should appear before non-NAMS regardless of name order
+        assert providers[0]["nams_certified"] is True
+        assert providers[1]["nams_certified"] is False
+
+    def test_zip_code_infers_state(self, client):
+        """When zip_code is provided without state, state is looked up from providers."""
+        mock = make_zip_mock_client(
+            zip_data=[{"state": "MN"}],
+            provider_data=[PROVIDER_MN],
+        )
+        override(mock)
+        response = client.get("/api/providers/search?zip_code=55401")
+
+        assert response.status_code == 200
+        assert response.json()["total"] == 1
+
+    def test_zip_code_not_found_returns_400(self, client):
+        mock = make_zip_mock_client(zip_data=[], provider_data=[])
+        override(mock)
+        response = client.get("/api/providers/search?zip_code=99999")
+
+        assert response.status_code == 404
+
+    def test_empty_results_returns_valid_response_shape(self, client):
+        response = send(
+            client, "GET", "/api/providers/search?state=WY", tables={"providers": []}
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total"] == 0
+        assert body["providers"] == []
+        assert body["total_pages"] == 1
+
+    def test_search_results_normalize_commercial_insurance(self, client):
+        provider = {
+            **PROVIDER_MN,
+            "insurance_accepted": ["Commercial Insurance", "Medicare"],
+        }
+        response = send(
+            client,
+            "GET",
+            "/api/providers/search?state=MN",
+            tables={"providers": [provider]},
+        )
+
+        assert response.status_code == 200
+        result_insurance = response.json()["providers"][0]["insurance_accepted"]
+        assert "Private Insurance" in result_insurance
+        assert "Commercial Insurance" not in result_insurance
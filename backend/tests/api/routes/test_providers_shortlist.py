@@ -0,0 +1,255 @@
+"""Tests for the shortlist / call tracker endpoints under /api/providers/shortlist.
+
+All require auth; auth and Supabase are mocked via dependency_overrides.
+"""
+
+import pytest
+from pydantic import TypeAdapter
+
+from app.models.providers import ShortlistEntryWithProvider, ShortlistStatus
+from tests.fixtures.providers import (
+    PROVIDER_MN,
+    PROVIDER_MN_2,
+    make_mock_client,
+    make_sequential_client,
+    override_both,
+    send,
+)
+
+# Sample shortlist fixture data
+_SHORTLIST_ENTRY = {
+    "id": "entry-uuid-1",
+    "user_id": "test-user-uuid",
+    "provider_id": "uuid-1",
+    "status": "to_call",
+    "notes": None,
+    "added_at": "2026-02-25T10:00:00+00:00",
+    "updated_at": "2026-02-25T10:00:00+00:00",
+}
+
+_SHORTLIST_ENTRY_WITH_NOTES = {
+    **_SHORTLIST_ENTRY,
+    "id": "entry-uuid-2",
+    "provider_id": "uuid-2",
+    "status": "left_voicemail",
+    "notes": "Said to call back in March",
+}
+
+# Rows the update query returns, one per payload in test_patch_returns_entry
+_SHORTLIST_CALLED = {**_SHORTLIST_ENTRY, "status": "called"}
+_SHORTLIST_WITH_CALLBACK_NOTE = {**_SHORTLIST_ENTRY, "notes": "Call back in March"}
+_SHORTLIST_BOOKING = {
+    **_SHORTLIST_ENTRY,
+    "status": "booking",
+    "notes": "Appointment next week",
+}
+
+_SHORTLIST_WITH_PROVIDERS = TypeAdapter(list[ShortlistEntryWithProvider])
+
+
+# ---------------------------------------------------------------------------
+# GET /api/providers/shortlist/ids
+# ---------------------------------------------------------------------------
+
+
+def test_ids_returns_provider_ids(client):
+    data = [{"provider_id": "uuid-1"}, {"provider_id": "uuid-2"}]
+    response = send(
+        client,
+        "GET",
+        "/api/providers/shortlist/ids",
+        tables={"provider_shortlist": data},
+        auth=True,
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body == ["uuid-1", "uuid-2"]
+
+
+def test_ids_returns_empty_list_when_no_entries(client):
+    response = send(client, "GET", "/api/providers/shortlist/ids", auth=True)
+
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_ids_requires_auth(client):
+    # DB override only — no auth override
+    response = send(client, "GET", "/api/providers/shortlist/ids")
+
+    assert response.status_code == 401
+
+
+# ---------------------------------------------------------------------------
+# GET /api/providers/shortlist
+# ---------------------------------------------------------------------------
+
+
+def test_get_returns_entries_with_provider_data(client):
+    # Sequence: shortlist entries → provider rows
+    mock = make_mock_client(
+        tables={
+            "provider_shortlist": [_SHORTLIST_ENTRY],
+            "providers": [PROVIDER_MN],
+        }
+    )
+    override_both(mock)
+    response = client.get("/api/providers/shortlist")
+
+    assert response.status_code == 200
+    [entry] = _SHORTLIST_WITH_PROVIDERS.validate_json(response.content)
+    assert entry.provider_id == "uuid-1"
+    assert entry.status == ShortlistStatus.to_call
+    assert entry.provider.name == "Dr. Jane Smith"
+    assert entry.provider.city == "Minneapolis"
+
+
+def test_get_returns_empty_list_when_shortlist_is_empty(client):
+    response = send(client, "GET", "/api/providers/shortlist", auth=True)
+
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_get_includes_entry_with_notes(client):
+    mock = make_mock_client(
+        tables={
+            "provider_shortlist": [_SHORTLIST_ENTRY_WITH_NOTES],
+            "providers": [PROVIDER_MN_2],
+        }
+    )
+    override_both(mock)
+    response = client.get("/api/providers/shortlist")
+
+    assert response.status_code == 200
+    entry = response.json()[0]
+    assert entry["notes"] == "Said to call back in March"
+    assert entry["status"] == "left_voicemail"
+
+
+def test_get_requires_auth(client):
+    response = send(client, "GET", "/api/providers/shortlist")
+
+    assert response.status_code == 401
+
+
+# ---------------------------------------------------------------------------
+# POST /api/providers/shortlist
+# ---------------------------------------------------------------------------
+
+
+def test_add_creates_entry_and_returns_201(client):
+    # Sequence: check existing (empty) → insert result
+    mock = make_sequential_client([], [_SHORTLIST_ENTRY])
+    override_both(mock)
+    response = client.post("/api/providers/shortlist", json={"provider_id": "uuid-1"})
+
+    assert response.status_code == 201
+    body = response.json()
+    assert body["provider_id"] == "uuid-1"
+    assert body["status"] == "to_call"
+
+
+def test_add_returns_409_when_already_in_shortlist(client):
+    # Sequence: check existing → found → returns 409 with existing entry
+    response = send(
+        client,
+        "POST",
+        "/api/providers/shortlist",
+        json={"provider_id": "uuid-1"},
+        tables={"provider_shortlist": [_SHORTLIST_ENTRY]},
+        auth=True,
+    )
+
+    assert response.status_code == 409
+    body = response.json()
+    assert "already in shortlist" in body["detail"]
+
+
+def test_add_requires_auth(client):
+    response = send(
+        client, "POST", "/api/providers/shortlist", json={"provider_id": "uuid-1"}
+    )
+
+    assert response.status_code == 401
+
+
+# ---------------------------------------------------------------------------
+# DELETE /api/providers/shortlist/{provider_id}
+# ---------------------------------------------------------------------------
+
+
+def test_remove_deletes_entry_and_returns_204(client):
+    # Sequence: check existing (found) → delete
+    mock = make_sequential_client([_SHORTLIST_ENTRY], [])
+    override_both(mock)
+    response = client.delete("/api/providers/shortlist/uuid-1")
+
+    assert response.status_code == 204
+
+
+def test_remove_returns_404_when_not_in_shortlist(client):
+    response = send(client, "DELETE", "/api/providers/shortlist/uuid-99", auth=True)
+
+    assert response.status_code == 404
+
+
+def test_remove_requires_auth(client):
+    response = send(client, "DELETE", "/api/providers/shortlist/uuid-1")
+
+    assert response.status_code == 401
+
+
+# ---------------------------------------------------------------------------
+# PATCH /api/providers/shortlist/{provider_id}
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "payload, updated_entry",
+    [
+        pytest.param({"status": "called"}, _SHORTLIST_CALLED, id="status"),
+        pytest.param(
+            {"notes": "Call back in March"},
+            _SHORTLIST_WITH_CALLBACK_NOTE,
+            id="notes",
+        ),
+        pytest.param(
+            {"status": "booking", "notes": "Appointment next week"},
+            _SHORTLIST_BOOKING,
+            id="status_and_notes",
+        ),
+    ],
+)
+def test_patch_returns_entry(client, payload, updated_entry):
+    # Sequence: check existing (found) → update result
+    mock = make_sequential_client([_SHORTLIST_ENTRY], [updated_entry])
+    override_both(mock)
+    response = client.patch("/api/providers/shortlist/uuid-1", json=payload)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert {key: body[key] for key in payload} == payload
+
+
+@pytest.mark.parametrize(
+    "provider_id, payload, auth, expected_status",
+    [
+        pytest.param("uuid-99", {"status": "called"}, True, 404, id="not_in_shortlist"),
+        pytest.param(
+            "uuid-1", {"status": "not_a_status"}, True, 422, id="invalid_status"
+        ),
+        pytest.param("uuid-1", {"status": "called"}, False, 401, id="requires_auth"),
+    ],
+)
+def test_patch_rejected(client, provider_id, payload, auth, expected_status):
+    response = send(
+        client,
+        "PATCH",
+        f"/api/providers/shortlist/{provider_id}",
+        json=payload,
+        auth=auth,
+    )
+
+    assert response.status_code == expected_status
@@ -0,0 +1,51 @@
+"""Tests for GET /api/providers/states (public, Supabase mocked)."""
+
+from pydantic import TypeAdapter
+
+from app.models.providers import StateCount
+from tests.fixtures.providers import send
+
+_STATE_COUNTS = TypeAdapter(list[StateCount])
+
+
+class TestListStates:
+    def test_returns_states_with_counts_sorted_alphabetically(self, client):
+        data = [
+            {"state": "MN"},
+            {"state": "MN"},
+            {"state": "CA"},
+            {"state": "TX"},
+        ]
+        response = send(
+            client, "GET", "/api/providers/states", tables={"providers": data}
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        states = [item["state"] for item in body]
+        assert states == sorted(states), "States should be alphabetically sorted"
+        counts = {item["state"]: item["count"] for item in body}
+        assert counts["CA"] == 1
+        assert counts["MN"] == 2
+        assert counts["TX"] == 1
+
+    def test_returns_empty_list_when_no_providers(self, client):
+        response = send(
+            client, "GET", "/api/providers/states", tables={"providers": []}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == []
+
+    def test_response_shape_has_state_and_count_fields(self, client):
+        response = send(
+            client,
+            "GET",
+            "/api/providers/states",
+            tables={"providers": [{"state": "MN"}]},
+        )
+
+        assert response.status_code == 200
+        assert _STATE_COUNTS.validate_json(response.content) == [
+            StateCount(state="MN", count=1)
+        ]
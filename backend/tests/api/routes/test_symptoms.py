@@ -4,20 +4,35 @@ All Supabase calls are mocked via FastAPI's dependency_overrides so no
 real network connections are made.
 """
 
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Any
 
-from fastapi.testclient import TestClient
+import pytest
 
 from app.core.supabase import get_client
 from app.main import app
 
+# Requests go through the async ASGI client (aclient) rather than TestClient.
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
 
 # ---------------------------------------------------------------------------
 # Mock helpers
 # ---------------------------------------------------------------------------
 
 
+@dataclass(slots=True)
+class FakeResult:
+    """What execute() resolves to; the app only reads .data and .error."""
+
+    data: list
+    error: Any = None
+
+
 class MockQueryBuilder:
     """Fluent builder mock that supports arbitrary method chaining + async execute().
 
@@ -25,9 +40,10 @@ class MockQueryBuilder:
     .select("*").eq(...).order(...).limit(...) all resolve to one object.
     """
 
+    __slots__ = ("_result",)
+
     def __init__(self, data=None, error=None):
-        self._data = data if data is not None else []
-        self._error = error
+        self._result = FakeResult(data if data is not None else [], error)
 
     def insert(self, *_, **__):
         return self
@@ -54,18 +70,69 @@ class MockQueryBuilder:
         return self
 
     async def execute(self):
-        result = MagicMock()
-        result.data = self._data
-        result.error = self._error
-        return result
+        return self._result
 
 
-def make_ref_data(symptom_ids: list[str]) -> list[dict]:
-    """Build mock symptoms_reference rows matching the given IDs (all valid)."""
-    return [
+@lru_cache(maxsize=64)
+def _ref_rows(symptom_ids: tuple[str, ...]) -> tuple[dict, ...]:
+    return tuple(
         {"id": sid, "name": f"Symptom {sid}", "category": "general"}
-        for sid in set(symptom_ids)
-    ]
+        for sid in dict.fromkeys(symptom_ids)
+    )
+
+
+def make_ref_data(symptom_ids: Iterable[str]) -> list[dict]:
+    """Build mock symptoms_reference rows matching the given IDs (all valid).
+
+    Rows come back in first-seen order, one per distinct ID. They are built
+    once per ID sequence and shared between tests, so don't mutate them.
+    """
+    return list(_ref_rows(tuple(symptom_ids)))
+
+
+@lru_cache
+def _user_response(user_id: str) -> SimpleNamespace:
+    return SimpleNamespace(user=SimpleNamespace(id=user_id))
+
+
+class FakeAuth:
+    """Stand-in for client.auth: get_user() returns a user or raises auth_error.
+
+    The user response is built once per user ID and shared across clients.
+    """
+
+    __slots__ = ("_error", "_user")
+
+    def __init__(self, user_id: str, auth_error: Exception | None = None):
+        self._user = _user_response(user_id)
+        self._error = auth_error
+
+    async def get_user(self, *_, **__):
+        if self._error:
+            raise self._error
+        return self._user
+
+
+class FakeClient:
+    """Plain Supabase client stand-in; cheaper per attribute than a MagicMock.
+
+    table() looks up a builder per table name so validation and insert
+    queries can return independent data; every table other than
+    symptoms_reference shares the data builder. Builders hold no per-query
+    state, so each table reuses one for every query the route makes.
+    """
+
+    __slots__ = ("_data_builder", "_tables", "auth")
+
+    def __init__(self, user_id, data, symptoms_ref_data, auth_error):
+        self.auth = FakeAuth(user_id, auth_error)
+        self._tables = {
+            "symptoms_reference": MockQueryBuilder(data=symptoms_ref_data or [])
+        }
+        self._data_builder = MockQueryBuilder(data=data or [])
+
+    def table(self, table_name):
+        return self._tables.get(table_name, self._data_builder)
 
 
 def make_mock_client(
@@ -73,25 +140,8 @@ def make_mock_client(
     data=None,
     symptoms_ref_data=None,
     auth_error: Exception | None = None,
-) -> MagicMock:
-    mock = MagicMock()
-
-    if auth_error:
-        mock.auth.get_user = AsyncMock(side_effect=auth_error)
-    else:
-        mock.auth.get_user = AsyncMock(
-            return_value=MagicMock(user=MagicMock(id=user_id))
-        )
-
-    # Dispatch different builders per table so validation and insert
-    # queries can return independent data.
-    def table_side_effect(table_name):
-        if table_name == "symptoms_reference":
-            return MockQueryBuilder(data=symptoms_ref_data or [])
-        return MockQueryBuilder(data=data or [])
-
-    mock.table.side_effect = table_side_effect
-    return mock
+) -> FakeClient:
+    return FakeClient(user_id, data, symptoms_ref_data, auth_error)
 
 
 # ---------------------------------------------------------------------------
@@ -127,10 +177,27 @@ BOTH_PAYLOAD = {
     "free_text_entry": "Worse than usual this morning",
 }
 
+LOGGED_AT = "2024-01-01T08:00:00+00:00"
+LOGGED_AT_PAYLOAD = {**CARDS_PAYLOAD, "logged_at": LOGGED_AT}
+
+STORED_LOG_TEXT = {
+    **STORED_LOG,
+    "symptoms": [],
+    "source": "text",
+    "free_text_entry": TEXT_PAYLOAD["free_text_entry"],
+}
+
+STORED_LOG_BOTH = {**STORED_LOG, **BOTH_PAYLOAD}
+
+STORED_LOG_LOGGED_AT = {**STORED_LOG, "logged_at": LOGGED_AT}
+
 
 def override(mock_client):
+    """Serve mock_client as the Supabase client for the rest of the test.
+
+    The autouse clear_dependency_overrides fixture removes it afterwards.
+    """
     app.dependency_overrides[get_client] = lambda: mock_client
-    return lambda: app.dependency_overrides.clear()
 
 
 # ---------------------------------------------------------------------------
@@ -139,22 +206,18 @@ def override(mock_client):
 
 
 class TestCreateSymptomLog:
-    def test_returns_201_when_source_is_cards(self):
+    async def test_returns_201_when_source_is_cards(self, aclient):
         mock = make_mock_client(
             user_id=USER_ID,
             data=[STORED_LOG],
             symptoms_ref_data=make_ref_data(CARDS_PAYLOAD["symptoms"]),
         )
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/symptoms/logs",
-                    json=CARDS_PAYLOAD,
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.post(
+            "/api/symptoms/logs",
+            json=CARDS_PAYLOAD,
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 201
         body = response.json()
@@ -166,213 +229,134 @@ class TestCreateSymptomLog:
         assert body["source"] == "cards"
         assert body["free_text_entry"] is None
 
-    def test_returns_201_when_source_is_text(self):
-        stored = {
-            **STORED_LOG,
-            "symptoms": [],
-            "source": "text",
-            "free_text_entry": TEXT_PAYLOAD["free_text_entry"],
-        }
-        mock = make_mock_client(user_id=USER_ID, data=[stored])
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/symptoms/logs",
-                    json=TEXT_PAYLOAD,
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
-
-        assert response.status_code == 201
-        assert response.json()["source"] == "text"
-        assert response.json()["free_text_entry"] == TEXT_PAYLOAD["free_text_entry"]
-
-    def test_returns_201_when_source_is_both(self):
-        stored = {**STORED_LOG, **BOTH_PAYLOAD}
+    @pytest.mark.parametrize(
+        "payload, stored, expected",
+        [
+            pytest.param(
+                TEXT_PAYLOAD,
+                STORED_LOG_TEXT,
+                {
+                    "source": "text",
+                    "free_text_entry": TEXT_PAYLOAD["free_text_entry"],
+                },
+                id="source_text",
+            ),
+            pytest.param(
+                BOTH_PAYLOAD, STORED_LOG_BOTH, {"source": "both"}, id="source_both"
+            ),
+            pytest.param(
+                LOGGED_AT_PAYLOAD,
+                STORED_LOG_LOGGED_AT,
+                {"source": "cards"},
+                id="logged_at_provided",
+            ),
+        ],
+    )
+    async def test_returns_201_for_payload_variant(
+        self, aclient, payload, stored, expected
+    ):
         mock = make_mock_client(
             user_id=USER_ID,
             data=[stored],
-            symptoms_ref_data=make_ref_data(BOTH_PAYLOAD["symptoms"]),
+            symptoms_ref_data=make_ref_data(stored["symptoms"]),
         )
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/symptoms/logs",
-                    json=BOTH_PAYLOAD,
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
-
-        assert response.status_code == 201
-        assert response.json()["source"] == "both"
-
-    def test_returns_201_when_logged_at_is_provided(self):
-        logged_at = "2024-01-01T08:00:00+00:00"
-        payload = {**CARDS_PAYLOAD, "logged_at": logged_at}
-        stored = {**STORED_LOG, "logged_at": logged_at}
-        mock = make_mock_client(
-            user_id=USER_ID,
-            data=[stored],
-            symptoms_ref_data=make_ref_data(CARDS_PAYLOAD["symptoms"]),
+        override(mock)
+        response = await aclient.post(
+            "/api/symptoms/logs",
+            json=payload,
+            headers=AUTH_HEADER,
         )
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/symptoms/logs",
-                    json=payload,
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
 
         assert response.status_code == 201
+        response_body = response.json()
+        assert {key: response_body[key] for key in expected} == expected
 
-    def test_missing_auth_header_returns_401(self):
+    async def test_missing_auth_header_returns_401(self, aclient):
         mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/symptoms/logs",
-                    json=CARDS_PAYLOAD,
-                    # No Authorization header
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.post(
+            "/api/symptoms/logs",
+            json=CARDS_PAYLOAD,
+            # No Authorization header
+        )
 
         assert response.status_code == 401
         assert "Missing authorization header" in response.json()["detail"]
 
-    def test_malformed_auth_header_returns_401(self):
+    async def test_malformed_auth_header_returns_401(self, aclient):
         mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/symptoms/logs",
-                    json=CARDS_PAYLOAD,
-                    headers={"Authorization": "Token not-bearer-format"},
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.post(
+            "/api/symptoms/logs",
+            json=CARDS_PAYLOAD,
+            headers={"Authorization": "Token not-bearer-format"},
+        )
 
         assert response.status_code == 401
 
-    def test_invalid_token_returns_401(self):
+    async def test_invalid_token_returns_401(self, aclient):
         mock = make_mock_client(auth_error=Exception("JWT expired"))
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/symptoms/logs",
-                    json=CARDS_PAYLOAD,
-                    headers={"Authorization": "Bearer expired-token"},
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.post(
+            "/api/symptoms/logs",
+            json=CARDS_PAYLOAD,
+            headers={"Authorization": "Bearer expired-token"},
+        )
 
         assert response.status_code == 401
         assert "Invalid or expired token" in response.json()["detail"]
 
-    def test_cards_source_with_empty_symptoms_returns_422(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/symptoms/logs",
-                    json={"symptoms": [], "source": "cards"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
-
-        assert response.status_code == 422
-
-    def test_text_source_without_free_text_returns_422(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/symptoms/logs",
-                    json={"symptoms": [], "source": "text"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
-
-        assert response.status_code == 422
-
-    def test_invalid_source_value_returns_422(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/symptoms/logs",
-                    json={"symptoms": ["fatigue"], "source": "unknown"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
-
-        assert response.status_code == 422
-
-    def test_missing_source_field_returns_422(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/symptoms/logs",
-                    json={"symptoms": ["fatigue"]},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            pytest.param(
+                {"symptoms": [], "source": "cards"}, id="cards_without_symptoms"
+            ),
+            pytest.param(
+                {"symptoms": [], "source": "text"}, id="text_without_free_text"
+            ),
+            pytest.param(
+                {"symptoms": ["fatigue"], "source": "unknown"}, id="invalid_source"
+            ),
+            pytest.param({"symptoms": ["fatigue"]}, id="missing_source"),
+        ],
+    )
+    async def test_invalid_payload_returns_422(self, aclient, payload):
+        override(make_mock_client())
+        response = await aclient.post(
+            "/api/symptoms/logs",
+            json=payload,
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 422
 
     # Symptom ID validation tests
 
-    def test_returns_400_when_symptom_ids_not_in_reference(self):
+    async def test_returns_400_when_symptom_ids_not_in_reference(self, aclient):
         # symptoms_ref_data returns 0 rows → all IDs invalid
         mock = make_mock_client(symptoms_ref_data=[])
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/symptoms/logs",
-                    json=CARDS_PAYLOAD,
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.post(
+            "/api/symptoms/logs",
+            json=CARDS_PAYLOAD,
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 400
         assert "Invalid symptom IDs" in response.json()["detail"]
 
-    def test_returns_400_when_some_symptom_ids_not_in_reference(self):
+    async def test_returns_400_when_some_symptom_ids_not_in_reference(self, aclient):
         # Only one of the two IDs exists in the reference table
         mock = make_mock_client(
             symptoms_ref_data=[{"id": CARDS_PAYLOAD["symptoms"][0]}]
         )
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/symptoms/logs",
-                    json=CARDS_PAYLOAD,
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.post(
+            "/api/symptoms/logs",
+            json=CARDS_PAYLOAD,
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 400
         detail = response.json()["detail"]
@@ -387,21 +371,17 @@ class TestCreateSymptomLog:
 
 
 class TestGetSymptomLogs:
-    def test_returns_200_with_logs_list(self):
+    async def test_returns_200_with_logs_list(self, aclient):
         mock = make_mock_client(
             user_id=USER_ID,
             data=[STORED_LOG],
             symptoms_ref_data=make_ref_data(STORED_LOG["symptoms"]),
         )
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/logs",
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get(
+            "/api/symptoms/logs",
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 200
         body = response.json()
@@ -417,169 +397,75 @@ class TestGetSymptomLogs:
             "id" in s and "name" in s and "category" in s for s in log["symptoms"]
         )
 
-    def test_returns_empty_list_when_user_has_no_logs(self):
+    async def test_returns_empty_list_when_user_has_no_logs(self, aclient):
         mock = make_mock_client(user_id=USER_ID, data=[])
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get("/api/symptoms/logs", headers=AUTH_HEADER)
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get("/api/symptoms/logs", headers=AUTH_HEADER)
 
         assert response.status_code == 200
         body = response.json()
         assert body["count"] == 0
         assert body["logs"] == []
 
-    def test_accepts_start_date_query_param(self):
+    async def test_accepts_start_date_query_param(self, aclient):
         mock = make_mock_client(user_id=USER_ID, data=[STORED_LOG])
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/logs",
-                    params={"start_date": "2024-03-01"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get(
+            "/api/symptoms/logs",
+            params={"start_date": "2024-03-01"},
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 200
         assert response.json()["count"] == 1
 
-    def test_accepts_end_date_query_param(self):
+    async def test_accepts_end_date_query_param(self, aclient):
         mock = make_mock_client(user_id=USER_ID, data=[STORED_LOG])
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/logs",
-                    params={"end_date": "2024-03-31"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get(
+            "/api/symptoms/logs",
+            params={"end_date": "2024-03-31"},
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 200
         assert response.json()["count"] == 1
 
-    def test_accepts_start_and_end_date_query_params(self):
+    async def test_accepts_start_and_end_date_query_params(self, aclient):
         mock = make_mock_client(user_id=USER_ID, data=[STORED_LOG])
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/logs",
-                    params={"start_date": "2024-03-01", "end_date": "2024-03-31"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get(
+            "/api/symptoms/logs",
+            params={"start_date": "2024-03-01", "end_date": "2024-03-31"},
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 200
         assert response.json()["count"] == 1
 
-    def test_custom_limit_reflected_in_response(self):
+    async def test_custom_limit_reflected_in_response(self, aclient):
         logs = [{**STORED_LOG, "id": f"log-{i}"} for i in range(3)]
         mock = make_mock_client(user_id=USER_ID, data=logs)
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/logs",
-                    params={"limit": 10},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get(
+            "/api/symptoms/logs",
+            params={"limit": 10},
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 200
         assert response.json()["limit"] == 10
         assert response.json()["count"] == 3
 
-    def test_limit_above_max_returns_422(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/logs",
-                    params={"limit": 101},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
-
-        assert response.status_code == 422
-
-    def test_limit_zero_returns_422(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/logs",
-                    params={"limit": 0},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
-
-        assert response.status_code == 422
-
-    def test_missing_auth_header_returns_401(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get("/api/symptoms/logs")
-        finally:
-            cleanup()
-
-        assert response.status_code == 401
-
-    def test_invalid_token_returns_401(self):
-        mock = make_mock_client(auth_error=Exception("Token revoked"))
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/logs",
-                    headers={"Authorization": "Bearer bad-token"},
-                )
-        finally:
-            cleanup()
-
-        assert response.status_code == 401
-
-    def test_invalid_date_format_returns_422(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/logs",
-                    params={"start_date": "not-a-date"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
-
-        assert response.status_code == 422
-
-    def test_returns_all_logs_ordered_newest_first(self):
+    async def test_returns_all_logs_ordered_newest_first(self, aclient):
         logs = [
             {**STORED_LOG, "id": "log-1", "logged_at": "2024-03-15T10:00:00+00:00"},
             {**STORED_LOG, "id": "log-2", "logged_at": "2024-03-14T09:00:00+00:00"},
             {**STORED_LOG, "id": "log-3", "logged_at": "2024-03-13T08:00:00+00:00"},
         ]
         mock = make_mock_client(user_id=USER_ID, data=logs)
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get("/api/symptoms/logs", headers=AUTH_HEADER)
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get("/api/symptoms/logs", headers=AUTH_HEADER)
 
         assert response.status_code == 200
         body = response.json()
@@ -588,7 +474,7 @@ class TestGetSymptomLogs:
         # First log in response should be the most recent
         assert body["logs"][0]["id"] == "log-1"
 
-    def test_get_logs_enriches_symptom_data(self):
+    async def test_get_logs_enriches_symptom_data(self, aclient):
         """Verify symptom IDs are resolved to name+category objects via symptoms_reference."""
         symptom_ids = ["symptom-uuid-1", "symptom-uuid-2"]
         log = {**STORED_LOG, "symptoms": symptom_ids}
@@ -597,12 +483,8 @@ class TestGetSymptomLogs:
             {"id": "symptom-uuid-2", "name": "Brain fog", "category": "cognitive"},
         ]
         mock = make_mock_client(user_id=USER_ID, data=[log], symptoms_ref_data=ref_data)
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get("/api/symptoms/logs", headers=AUTH_HEADER)
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get("/api/symptoms/logs", headers=AUTH_HEADER)
 
         assert response.status_code == 200
         symptoms = response.json()["logs"][0]["symptoms"]
@@ -618,16 +500,12 @@ class TestGetSymptomLogs:
             "category": "cognitive",
         }
 
-    def test_get_logs_uses_fallback_for_unknown_symptom_id(self):
+    async def test_get_logs_uses_fallback_for_unknown_symptom_id(self, aclient):
         """An ID absent from symptoms_reference falls back to id/unknown rather than failing."""
         log = {**STORED_LOG, "symptoms": ["orphan-id"]}
         mock = make_mock_client(user_id=USER_ID, data=[log], symptoms_ref_data=[])
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get("/api/symptoms/logs", headers=AUTH_HEADER)
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get("/api/symptoms/logs", headers=AUTH_HEADER)
 
         assert response.status_code == 200
         symptoms = response.json()["logs"][0]["symptoms"]
@@ -658,20 +536,16 @@ SYMPTOMS_REF_DATA = [
 
 
 class TestGetFrequencyStats:
-    def test_frequency_stats_success(self):
+    async def test_frequency_stats_success(self, aclient):
         mock = make_mock_client(
             user_id=USER_ID,
             data=SYMPTOM_LOGS_DATA,
             symptoms_ref_data=SYMPTOMS_REF_DATA,
         )
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/stats/frequency", headers=AUTH_HEADER
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get(
+            "/api/symptoms/stats/frequency", headers=AUTH_HEADER
+        )
 
         assert response.status_code == 200
         body = response.json()
@@ -690,101 +564,37 @@ class TestGetFrequencyStats:
         assert counts["Brain fog"] == 1
         assert counts["Fatigue"] == 1
 
-    def test_frequency_stats_with_date_range(self):
+    async def test_frequency_stats_with_date_range(self, aclient):
         mock = make_mock_client(
             user_id=USER_ID,
             data=SYMPTOM_LOGS_DATA,
             symptoms_ref_data=SYMPTOMS_REF_DATA,
         )
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/stats/frequency",
-                    params={"start_date": "2024-01-01", "end_date": "2024-01-31"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get(
+            "/api/symptoms/stats/frequency",
+            params={"start_date": "2024-01-01", "end_date": "2024-01-31"},
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 200
         body = response.json()
         assert body["date_range_start"] == "2024-01-01"
         assert body["date_range_end"] == "2024-01-31"
 
-    def test_frequency_stats_requires_auth(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get("/api/symptoms/stats/frequency")
-        finally:
-            cleanup()
-
-        assert response.status_code == 401
-
-    def test_frequency_stats_invalid_token_returns_401(self):
-        mock = make_mock_client(auth_error=Exception("Token invalid"))
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/stats/frequency",
-                    headers={"Authorization": "Bearer bad-token"},
-                )
-        finally:
-            cleanup()
-
-        assert response.status_code == 401
-
-    def test_frequency_stats_invalid_date_format_returns_422(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/stats/frequency",
-                    params={"start_date": "not-a-date"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
-
-        assert response.status_code == 422
-
-    def test_frequency_stats_start_after_end_returns_400(self):
-        mock = make_mock_client(user_id=USER_ID, data=[])
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/stats/frequency",
-                    params={"start_date": "2024-02-01", "end_date": "2024-01-01"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
-
-        assert response.status_code == 400
-        assert "start_date" in response.json()["detail"]
-
-    def test_frequency_stats_empty_result(self):
+    async def test_frequency_stats_empty_result(self, aclient):
         mock = make_mock_client(user_id=USER_ID, data=[], symptoms_ref_data=[])
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/stats/frequency", headers=AUTH_HEADER
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get(
+            "/api/symptoms/stats/frequency", headers=AUTH_HEADER
+        )
 
         assert response.status_code == 200
         body = response.json()
         assert body["stats"] == []
         assert body["total_logs"] == 0
 
-    def test_frequency_stats_sorted_by_count_descending(self):
+    async def test_frequency_stats_sorted_by_count_descending(self, aclient):
         # Three logs: fatigue appears twice, brain_fog once
         logs = [
             {"symptoms": [SID_FATIGUE]},
@@ -795,14 +605,10 @@ class TestGetFrequencyStats:
             {"id": SID_BRAIN_FOG, "name": "Brain fog", "category": "cognitive"},
         ]
         mock = make_mock_client(user_id=USER_ID, data=logs, symptoms_ref_data=ref)
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/stats/frequency", headers=AUTH_HEADER
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get(
+            "/api/symptoms/stats/frequency", headers=AUTH_HEADER
+        )
 
         assert response.status_code == 200
         stats = response.json()["stats"]
@@ -811,20 +617,16 @@ class TestGetFrequencyStats:
         assert stats[1]["symptom_name"] == "Brain fog"
         assert stats[1]["count"] == 1
 
-    def test_frequency_stats_omits_unknown_symptom_ids(self):
+    async def test_frequency_stats_omits_unknown_symptom_ids(self, aclient):
         # Symptom ID in logs but absent from reference — should not appear in output
         orphan_id = "orphan-uuid-not-in-ref"
         logs = [{"symptoms": [SID_HOT_FLASH, orphan_id]}]
         ref = [{"id": SID_HOT_FLASH, "name": "Hot flashes", "category": "vasomotor"}]
         mock = make_mock_client(user_id=USER_ID, data=logs, symptoms_ref_data=ref)
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/stats/frequency", headers=AUTH_HEADER
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get(
+            "/api/symptoms/stats/frequency", headers=AUTH_HEADER
+        )
 
         assert response.status_code == 200
         stats = response.json()["stats"]
@@ -859,18 +661,14 @@ COOCC_REF = [
 
 
 class TestGetCooccurrenceStats:
-    def test_cooccurrence_stats_success(self):
+    async def test_cooccurrence_stats_success(self, aclient):
         mock = make_mock_client(
             user_id=USER_ID, data=COOCC_LOGS, symptoms_ref_data=COOCC_REF
         )
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/stats/cooccurrence", headers=AUTH_HEADER
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get(
+            "/api/symptoms/stats/cooccurrence", headers=AUTH_HEADER
+        )
 
         assert response.status_code == 200
         body = response.json()
@@ -889,21 +687,17 @@ class TestGetCooccurrenceStats:
             for p in pairs
         ), "(B,C) pair should be excluded at threshold=2"
 
-    def test_cooccurrence_stats_calculates_rate_correctly(self):
+    async def test_cooccurrence_stats_calculates_rate_correctly(self, aclient):
         # A appears in all 5 logs, co-occurs with B in 3 → rate = 3/5 = 0.6
         mock = make_mock_client(
             user_id=USER_ID, data=COOCC_LOGS, symptoms_ref_data=COOCC_REF
         )
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/stats/cooccurrence",
-                    params={"min_threshold": "1"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get(
+            "/api/symptoms/stats/cooccurrence",
+            params={"min_threshold": "1"},
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 200
         pairs = response.json()["pairs"]
@@ -916,21 +710,17 @@ class TestGetCooccurrenceStats:
         assert ab["total_occurrences_symptom1"] == 5
         assert abs(ab["cooccurrence_rate"] - 0.6) < 1e-3
 
-    def test_cooccurrence_stats_with_threshold(self):
+    async def test_cooccurrence_stats_with_threshold(self, aclient):
         # Raise threshold to 3 — only (A,B) qualifies
         mock = make_mock_client(
             user_id=USER_ID, data=COOCC_LOGS, symptoms_ref_data=COOCC_REF
         )
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/stats/cooccurrence",
-                    params={"min_threshold": "3"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get(
+            "/api/symptoms/stats/cooccurrence",
+            params={"min_threshold": "3"},
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 200
         pairs = response.json()["pairs"]
@@ -939,7 +729,7 @@ class TestGetCooccurrenceStats:
         assert pairs[0]["symptom2_name"] == "Brain fog"
         assert pairs[0]["cooccurrence_count"] == 3
 
-    def test_cooccurrence_stats_filters_single_symptom_logs(self):
+    async def test_cooccurrence_stats_filters_single_symptom_logs(self, aclient):
         # Logs with only one symptom contribute nothing to pair counts
         logs = [
             {"symptoms": [SID_A]},
@@ -947,87 +737,22 @@ class TestGetCooccurrenceStats:
             {"symptoms": [SID_A]},
         ]
         mock = make_mock_client(user_id=USER_ID, data=logs, symptoms_ref_data=COOCC_REF)
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/stats/cooccurrence",
-                    params={"min_threshold": "1"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get(
+            "/api/symptoms/stats/cooccurrence",
+            params={"min_threshold": "1"},
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 200
         assert response.json()["pairs"] == []
 
-    def test_cooccurrence_stats_requires_auth(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get("/api/symptoms/stats/cooccurrence")
-        finally:
-            cleanup()
-
-        assert response.status_code == 401
-
-    def test_cooccurrence_stats_invalid_token_returns_401(self):
-        mock = make_mock_client(auth_error=Exception("Token invalid"))
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/stats/cooccurrence",
-                    headers={"Authorization": "Bearer bad-token"},
-                )
-        finally:
-            cleanup()
-
-        assert response.status_code == 401
-
-    def test_cooccurrence_stats_start_after_end_returns_400(self):
-        mock = make_mock_client(user_id=USER_ID, data=[])
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/stats/cooccurrence",
-                    params={"start_date": "2024-02-01", "end_date": "2024-01-01"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
-
-        assert response.status_code == 400
-        assert "start_date" in response.json()["detail"]
-
-    def test_cooccurrence_stats_threshold_zero_returns_422(self):
-        # ge=1 constraint on min_threshold
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/stats/cooccurrence",
-                    params={"min_threshold": "0"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
-
-        assert response.status_code == 422
-
-    def test_cooccurrence_stats_empty_result(self):
+    async def test_cooccurrence_stats_empty_result(self, aclient):
         mock = make_mock_client(user_id=USER_ID, data=[], symptoms_ref_data=[])
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/stats/cooccurrence", headers=AUTH_HEADER
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get(
+            "/api/symptoms/stats/cooccurrence", headers=AUTH_HEADER
+        )
 
         assert response.status_code == 200
         body = response.json()
@@ -1035,7 +760,7 @@ class TestGetCooccurrenceStats:
         assert body["total_logs"] == 0
         assert body["min_threshold"] == 2
 
-    def test_cooccurrence_stats_sorted_by_rate_descending(self):
+    async def test_cooccurrence_stats_sorted_by_rate_descending(self, aclient):
         # (A,C): A appears 2×, co-occurs with C 2× → rate 1.0
         # (A,B): A appears 2×, co-occurs with B 1× → rate 0.5
         logs = [
@@ -1043,23 +768,21 @@ class TestGetCooccurrenceStats:
             {"symptoms": [SID_A, SID_C]},
         ]
         mock = make_mock_client(user_id=USER_ID, data=logs, symptoms_ref_data=COOCC_REF)
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/stats/cooccurrence",
-                    params={"min_threshold": "1"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get(
+            "/api/symptoms/stats/cooccurrence",
+            params={"min_threshold": "1"},
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 200
         pairs = response.json()["pairs"]
         rates = [p["cooccurrence_rate"] for p in pairs]
         assert rates == sorted(rates, reverse=True)
 
-    def test_cooccurrence_stats_omits_pairs_with_unknown_symptom_ids(self):
+    async def test_cooccurrence_stats_omits_pairs_with_unknown_symptom_ids(
+        self, aclient
+    ):
         # One symptom in logs but absent from reference → pair silently dropped
         logs = [
             {"symptoms": [SID_A, "unknown-uuid"]},
@@ -1067,16 +790,82 @@ class TestGetCooccurrenceStats:
         ]
         ref = [{"id": SID_A, "name": "Hot flashes", "category": "vasomotor"}]
         mock = make_mock_client(user_id=USER_ID, data=logs, symptoms_ref_data=ref)
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/symptoms/stats/cooccurrence",
-                    params={"min_threshold": "1"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get(
+            "/api/symptoms/stats/cooccurrence",
+            params={"min_threshold": "1"},
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 200
         assert response.json()["pairs"] == []
+
+
+# ---------------------------------------------------------------------------
+# Error responses shared by the GET endpoints
+# ---------------------------------------------------------------------------
+
+GET_PATHS = [
+    "/api/symptoms/logs",
+    "/api/symptoms/stats/frequency",
+    "/api/symptoms/stats/cooccurrence",
+]
+
+
+@pytest.mark.parametrize("path", GET_PATHS)
+async def test_get_without_auth_header_returns_401(aclient, path):
+    override(make_mock_client())
+    response = await aclient.get(path)
+
+    assert response.status_code == 401
+
+
+@pytest.mark.parametrize("path", GET_PATHS)
+async def test_get_with_invalid_token_returns_401(aclient, path):
+    override(make_mock_client(auth_error=Exception("Token revoked")))
+    response = await aclient.get(path, headers={"Authorization": "Bearer bad-token"})
+
+    assert response.status_code == 401
+
+
+@pytest.mark.parametrize(
+    "path, params",
+    [
+        pytest.param("/api/symptoms/logs", {"limit": 101}, id="logs_limit_above_max"),
+        pytest.param("/api/symptoms/logs", {"limit": 0}, id="logs_limit_zero"),
+        pytest.param(
+            "/api/symptoms/logs", {"start_date": "not-a-date"}, id="logs_bad_date"
+        ),
+        pytest.param(
+            "/api/symptoms/stats/frequency",
+            {"start_date": "not-a-date"},
+            id="frequency_bad_date",
+        ),
+        # ge=1 constraint on min_threshold
+        pytest.param(
+            "/api/symptoms/stats/cooccurrence",
+            {"min_threshold": "0"},
+            id="cooccurrence_threshold_zero",
+        ),
+    ],
+)
+async def test_get_invalid_query_params_returns_422(aclient, path, params):
+    override(make_mock_client())
+    response = await aclient.get(path, params=params, headers=AUTH_HEADER)
+
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize(
+    "path", ["/api/symptoms/stats/frequency", "/api/symptoms/stats/cooccurrence"]
+)
+async def test_stats_start_after_end_returns_400(aclient, path):
+    override(make_mock_client(user_id=USER_ID, data=[]))
+    response = await aclient.get(
+        path,
+        params={"start_date": "2024-02-01", "end_date": "2024-01-01"},
+        headers=AUTH_HEADER,
+    )
+
+    assert response.status_code == 400
+    assert "start_date" in response.json()["detail"]
@@ -4,14 +4,17 @@ All Supabase calls are mocked via FastAPI's dependency_overrides so no
 real network connections are made.
 """
 
-from datetime import date
-from unittest.mock import AsyncMock, MagicMock
+from datetime import date, timedelta
+from types import SimpleNamespace
 
-from fastapi.testclient import TestClient
+import pytest
 
 from app.core.supabase import get_client
 from app.main import app
 
+# Requests go through the async ASGI client (aclient) rather than TestClient.
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
 
 # ---------------------------------------------------------------------------
 # Mock helpers
@@ -21,7 +24,8 @@ from app.main import app
 class MockQueryBuilder:
     """Fluent builder mock supporting select, insert, and update on the users table.
 
-    Tracks the last mutating operation so execute() returns the right data.
+    Tracks the last mutating operation so execute() returns the right data,
+    then resets it so one builder can serve every query a request makes.
     """
 
     def __init__(
@@ -48,16 +52,61 @@ class MockQueryBuilder:
         return self
 
     async def execute(self):
-        if self._op == "insert" and self._insert_error:
+        op, self._op = self._op, "select"
+        if op == "insert" and self._insert_error:
             raise self._insert_error
-        result = MagicMock()
-        if self._op == "insert":
-            result.data = self._insert_data
-        elif self._op == "update":
-            result.data = self._update_data
-        else:
-            result.data = self._select_data
-        return result
+        if op == "insert":
+            return SimpleNamespace(data=self._insert_data)
+        if op == "update":
+            return SimpleNamespace(data=self._update_data)
+        return SimpleNamespace(data=self._select_data)
+
+
+class FakeAdmin:
+    """Stand-in for client.auth.admin: get_user_by_id() returns the user's email."""
+
+    def __init__(self, email: str, admin_error: Exception | None = None):
+        self._user = SimpleNamespace(user=SimpleNamespace(email=email))
+        self._error = admin_error
+
+    async def get_user_by_id(self, *_, **__):
+        if self._error:
+            raise self._error
+        return self._user
+
+
+class FakeAuth:
+    """Stand-in for client.auth: get_user() returns a user or raises auth_error."""
+
+    def __init__(
+        self,
+        user_id: str,
+        email: str,
+        auth_error: Exception | None = None,
+        admin_error: Exception | None = None,
+    ):
+        self._user = SimpleNamespace(user=SimpleNamespace(id=user_id))
+        self._error = auth_error
+        self.admin = FakeAdmin(email, admin_error)
+
+    async def get_user(self, *_, **__):
+        if self._error:
+            raise self._error
+        return self._user
+
+
+class FakeClient:
+    """Plain Supabase client stand-in; every query hits the users table."""
+
+    def __init__(self, auth: FakeAuth, builder: MockQueryBuilder, table_error=None):
+        self.auth = auth
+        self._builder = builder
+        self._table_error = table_error
+
+    def table(self, _table_name):
+        if self._table_error:
+            raise self._table_error
+        return self._builder
 
 
 def make_mock_client(
@@ -69,8 +118,9 @@ def make_mock_client(
     auth_error: Exception | None = None,
     admin_error: Exception | None = None,
     insert_error: Exception | None = None,
-) -> MagicMock:
-    """Build a mock Supabase client for user endpoint tests.
+    table_error: Exception | None = None,
+) -> FakeClient:
+    """Build a fake Supabase client for user endpoint tests.
 
     Args:
         existing_user_data: Rows returned by select queries.
@@ -80,33 +130,18 @@ def make_mock_client(
         auth_error: If set, client.auth.get_user raises this exception.
         admin_error: If set, client.auth.admin.get_user_by_id raises this.
         insert_error: If set, insert().execute() raises this exception.
+        table_error: If set, client.table() itself raises this exception.
     """
-    mock = MagicMock()
-
-    if auth_error:
-        mock.auth.get_user = AsyncMock(side_effect=auth_error)
-    else:
-        mock.auth.get_user = AsyncMock(
-            return_value=MagicMock(user=MagicMock(id=user_id))
-        )
-
-    if admin_error:
-        mock.auth.admin.get_user_by_id = AsyncMock(side_effect=admin_error)
-    else:
-        mock.auth.admin.get_user_by_id = AsyncMock(
-            return_value=MagicMock(user=MagicMock(email=email))
-        )
-
-    def table_side_effect(table_name):
-        return MockQueryBuilder(
-            select_data=existing_user_data if existing_user_data is not None else [],
-            insert_data=insert_data if insert_data is not None else [],
-            update_data=update_data if update_data is not None else [],
+    return FakeClient(
+        FakeAuth(user_id, email, auth_error, admin_error),
+        MockQueryBuilder(
+            select_data=existing_user_data,
+            insert_data=insert_data,
+            update_data=update_data,
             insert_error=insert_error,
-        )
-
-    mock.table.side_effect = table_side_effect
-    return mock
+        ),
+        table_error,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -126,6 +161,13 @@ STORED_USER = {
     "created_at": "2024-03-15T10:00:00+00:00",
 }
 
+# Dates relative to today, computed once per session
+TODAY = date.today()
+TODAY_DOB = TODAY.isoformat()
+FUTURE_DOB = (TODAY + timedelta(days=1)).isoformat()
+# A person born 17 years ago is always under 18
+UNDERAGE_DOB = date(TODAY.year - 17, 1, 1).isoformat()
+
 VALID_PAYLOAD = {
     "date_of_birth": "1975-06-15",
     "journey_stage": "perimenopause",
@@ -133,8 +175,21 @@ VALID_PAYLOAD = {
 
 
 def override(mock_client):
+    """Serve mock_client as the Supabase client for the rest of the test.
+
+    The autouse clear_dependency_overrides fixture removes it afterwards.
+    """
     app.dependency_overrides[get_client] = lambda: mock_client
-    return lambda: app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="module")
+def noop_mock():
+    """Default fake client for tests rejected before any query runs (401/422/400).
+
+    Built once per module; these tests never reach the database, so sharing
+    it carries no state between them.
+    """
+    return make_mock_client()
 
 
 # ---------------------------------------------------------------------------
@@ -143,18 +198,14 @@ def override(mock_client):
 
 
 class TestOnboarding:
-    def test_onboarding_success(self):
+    async def test_onboarding_success(self, aclient):
         mock = make_mock_client(insert_data=[STORED_USER])
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/users/onboarding",
-                    json=VALID_PAYLOAD,
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.post(
+            "/api/users/onboarding",
+            json=VALID_PAYLOAD,
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 201
         body = response.json()
@@ -164,193 +215,117 @@ class TestOnboarding:
         assert body["onboarding_completed"] is True
         assert body["date_of_birth"] == "1975-06-15"
 
-    def test_onboarding_success_all_journey_stages(self):
-        for stage in ("perimenopause", "menopause", "post-menopause", "unsure"):
-            stored = {**STORED_USER, "journey_stage": stage}
-            mock = make_mock_client(insert_data=[stored])
-            cleanup = override(mock)
-            try:
-                with TestClient(app) as client:
-                    response = client.post(
-                        "/api/users/onboarding",
-                        json={**VALID_PAYLOAD, "journey_stage": stage},
-                        headers=AUTH_HEADER,
-                    )
-            finally:
-                cleanup()
-
-            assert response.status_code == 201, (
-                f"Expected 201 for journey_stage={stage!r}"
-            )
-            assert response.json()["journey_stage"] == stage
-
-    def test_onboarding_requires_auth(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/users/onboarding",
-                    json=VALID_PAYLOAD,
-                    # No Authorization header
-                )
-        finally:
-            cleanup()
+    @pytest.mark.parametrize(
+        "stage", ["perimenopause", "menopause", "post-menopause", "unsure"]
+    )
+    async def test_onboarding_success_all_journey_stages(self, aclient, stage):
+        stored = {**STORED_USER, "journey_stage": stage}
+        mock = make_mock_client(insert_data=[stored])
+        override(mock)
+        response = await aclient.post(
+            "/api/users/onboarding",
+            json={**VALID_PAYLOAD, "journey_stage": stage},
+            headers=AUTH_HEADER,
+        )
+
+        assert response.status_code == 201
+        assert response.json()["journey_stage"] == stage
+
+    async def test_onboarding_requires_auth(self, aclient, noop_mock):
+        override(noop_mock)
+        response = await aclient.post(
+            "/api/users/onboarding",
+            json=VALID_PAYLOAD,
+            # No Authorization header
+        )
 
         assert response.status_code == 401
         assert "Missing authorization header" in response.json()["detail"]
 
-    def test_onboarding_rejects_invalid_token(self):
+    async def test_onboarding_rejects_invalid_token(self, aclient):
         mock = make_mock_client(auth_error=Exception("JWT expired"))
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/users/onboarding",
-                    json=VALID_PAYLOAD,
-                    headers={"Authorization": "Bearer expired-token"},
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.post(
+            "/api/users/onboarding",
+            json=VALID_PAYLOAD,
+            headers={"Authorization": "Bearer expired-token"},
+        )
 
         assert response.status_code == 401
         assert "Invalid or expired token" in response.json()["detail"]
 
-    def test_onboarding_rejects_underage(self):
-        today = date.today()
-        # A person born 17 years ago is always under 18
-        underage_dob = date(today.year - 17, 1, 1).isoformat()
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/users/onboarding",
-                    json={"date_of_birth": underage_dob, "journey_stage": "unsure"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
-
-        assert response.status_code == 400
-        assert "18" in response.json()["detail"]
-
-    def test_onboarding_rejects_future_date(self):
-        from datetime import timedelta
-
-        future_dob = (date.today() + timedelta(days=1)).isoformat()
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/users/onboarding",
-                    json={"date_of_birth": future_dob, "journey_stage": "unsure"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
-
-        assert response.status_code == 400
-        assert "past" in response.json()["detail"]
-
-    def test_onboarding_rejects_today_as_dob(self):
-        today_dob = date.today().isoformat()
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/users/onboarding",
-                    json={"date_of_birth": today_dob, "journey_stage": "unsure"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+    @pytest.mark.parametrize(
+        "dob, detail",
+        [
+            pytest.param(UNDERAGE_DOB, "18", id="underage"),
+            pytest.param(FUTURE_DOB, "past", id="future_date"),
+            pytest.param(TODAY_DOB, None, id="today"),
+        ],
+    )
+    async def test_onboarding_rejects_invalid_date_of_birth(
+        self, aclient, noop_mock, dob, detail
+    ):
+        override(noop_mock)
+        response = await aclient.post(
+            "/api/users/onboarding",
+            json={"date_of_birth": dob, "journey_stage": "unsure"},
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 400
-
-    def test_onboarding_rejects_invalid_journey_stage(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/users/onboarding",
-                    json={
-                        "date_of_birth": "1975-06-15",
-                        "journey_stage": "early-menopause",
-                    },
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        if detail is not None:
+            assert detail in response.json()["detail"]
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            pytest.param(
+                {"date_of_birth": "1975-06-15", "journey_stage": "early-menopause"},
+                id="invalid_journey_stage",
+            ),
+            pytest.param(
+                {"journey_stage": "perimenopause"}, id="missing_date_of_birth"
+            ),
+            pytest.param({"date_of_birth": "1975-06-15"}, id="missing_journey_stage"),
+        ],
+    )
+    async def test_onboarding_invalid_payload_returns_422(
+        self, aclient, noop_mock, payload
+    ):
+        override(noop_mock)
+        response = await aclient.post(
+            "/api/users/onboarding",
+            json=payload,
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 422
 
-    def test_onboarding_prevents_duplicate(self):
+    async def test_onboarding_prevents_duplicate(self, aclient):
         # When trying to create a duplicate user, Supabase raises a unique constraint violation
         insert_error = Exception("duplicate key value violates unique constraint")
         mock = make_mock_client(insert_error=insert_error)
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/users/onboarding",
-                    json=VALID_PAYLOAD,
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.post(
+            "/api/users/onboarding",
+            json=VALID_PAYLOAD,
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 409
         assert "already exists" in response.json()["detail"]
 
-    def test_onboarding_returns_500_when_admin_auth_fails(self):
+    async def test_onboarding_returns_500_when_admin_auth_fails(self, aclient):
         mock = make_mock_client(admin_error=Exception("Auth service unavailable"))
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/users/onboarding",
-                    json=VALID_PAYLOAD,
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.post(
+            "/api/users/onboarding",
+            json=VALID_PAYLOAD,
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 500
 
-    def test_onboarding_missing_date_of_birth_returns_422(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/users/onboarding",
-                    json={"journey_stage": "perimenopause"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
-
-        assert response.status_code == 422
-
-    def test_onboarding_missing_journey_stage_returns_422(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.post(
-                    "/api/users/onboarding",
-                    json={"date_of_birth": "1975-06-15"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
-
-        assert response.status_code == 422
-
 
 # ---------------------------------------------------------------------------
 # GET /api/users/insurance-preference
@@ -365,23 +340,19 @@ _PREF_ROW = {
 
 
 class TestGetInsurancePreference:
-    def test_returns_saved_preference(self):
+    async def test_returns_saved_preference(self, aclient):
         mock = make_mock_client(existing_user_data=[_PREF_ROW])
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/users/insurance-preference", headers=AUTH_HEADER
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get(
+            "/api/users/insurance-preference", headers=AUTH_HEADER
+        )
 
         assert response.status_code == 200
         body = response.json()
         assert body["insurance_type"] == "private"
         assert body["insurance_plan_name"] == "Aetna PPO"
 
-    def test_returns_nulls_when_columns_not_set(self):
+    async def test_returns_nulls_when_columns_not_set(self, aclient):
         mock = make_mock_client(
             existing_user_data=[
                 {
@@ -392,61 +363,40 @@ class TestGetInsurancePreference:
                 }
             ]
         )
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/users/insurance-preference", headers=AUTH_HEADER
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get(
+            "/api/users/insurance-preference", headers=AUTH_HEADER
+        )
 
         assert response.status_code == 200
         body = response.json()
         assert body["insurance_type"] is None
         assert body["insurance_plan_name"] is None
 
-    def test_returns_nulls_when_no_profile_row(self):
+    async def test_returns_nulls_when_no_profile_row(self, aclient):
         mock = make_mock_client(existing_user_data=[])
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/users/insurance-preference", headers=AUTH_HEADER
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get(
+            "/api/users/insurance-preference", headers=AUTH_HEADER
+        )
 
         assert response.status_code == 200
         body = response.json()
         assert body["insurance_type"] is None
         assert body["insurance_plan_name"] is None
 
-    def test_requires_auth(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get("/api/users/insurance-preference")
-        finally:
-            cleanup()
+    async def test_requires_auth(self, aclient, noop_mock):
+        override(noop_mock)
+        response = await aclient.get("/api/users/insurance-preference")
 
         assert response.status_code == 401
 
-    def test_returns_500_on_db_error(self):
-        mock = MagicMock()
-        mock.auth.get_user = AsyncMock(
-            return_value=MagicMock(user=MagicMock(id=USER_ID))
+    async def test_returns_500_on_db_error(self, aclient):
+        mock = make_mock_client(table_error=Exception("DB connection lost"))
+        override(mock)
+        response = await aclient.get(
+            "/api/users/insurance-preference", headers=AUTH_HEADER
         )
-        mock.table.side_effect = Exception("DB connection lost")
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get(
-                    "/api/users/insurance-preference", headers=AUTH_HEADER
-                )
-        finally:
-            cleanup()
 
         assert response.status_code == 500
 
@@ -457,7 +407,7 @@ class TestGetInsurancePreference:
 
 
 class TestUpdateInsurancePreference:
-    def test_updates_successfully(self):
+    async def test_updates_successfully(self, aclient):
         updated_row = {
             "id": USER_ID,
             "email": EMAIL,
@@ -465,23 +415,19 @@ class TestUpdateInsurancePreference:
             "insurance_plan_name": "UCare",
         }
         mock = make_mock_client(update_data=[updated_row])
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.patch(
-                    "/api/users/insurance-preference",
-                    json={"insurance_type": "medicaid", "insurance_plan_name": "UCare"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.patch(
+            "/api/users/insurance-preference",
+            json={"insurance_type": "medicaid", "insurance_plan_name": "UCare"},
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 200
         body = response.json()
         assert body["insurance_type"] == "medicaid"
         assert body["insurance_plan_name"] == "UCare"
 
-    def test_updates_with_null_plan_name(self):
+    async def test_updates_with_null_plan_name(self, aclient):
         updated_row = {
             "id": USER_ID,
             "email": EMAIL,
@@ -489,81 +435,55 @@ class TestUpdateInsurancePreference:
             "insurance_plan_name": None,
         }
         mock = make_mock_client(update_data=[updated_row])
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.patch(
-                    "/api/users/insurance-preference",
-                    json={"insurance_type": "self_pay"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.patch(
+            "/api/users/insurance-preference",
+            json={"insurance_type": "self_pay"},
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 200
         assert response.json()["insurance_type"] == "self_pay"
         assert response.json()["insurance_plan_name"] is None
 
-    def test_returns_404_when_no_user_profile(self):
+    async def test_returns_404_when_no_user_profile(self, aclient):
         mock = make_mock_client(update_data=[])  # empty = no rows updated
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.patch(
-                    "/api/users/insurance-preference",
-                    json={"insurance_type": "private"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.patch(
+            "/api/users/insurance-preference",
+            json={"insurance_type": "private"},
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 404
 
-    def test_invalid_insurance_type_returns_422(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.patch(
-                    "/api/users/insurance-preference",
-                    json={"insurance_type": "not_a_real_type"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+    async def test_invalid_insurance_type_returns_422(self, aclient, noop_mock):
+        override(noop_mock)
+        response = await aclient.patch(
+            "/api/users/insurance-preference",
+            json={"insurance_type": "not_a_real_type"},
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 422
 
-    def test_requires_auth(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.patch(
-                    "/api/users/insurance-preference",
-                    json={"insurance_type": "private"},
-                )
-        finally:
-            cleanup()
+    async def test_requires_auth(self, aclient, noop_mock):
+        override(noop_mock)
+        response = await aclient.patch(
+            "/api/users/insurance-preference",
+            json={"insurance_type": "private"},
+        )
 
         assert response.status_code == 401
 
-    def test_returns_500_on_db_error(self):
-        mock = MagicMock()
-        mock.auth.get_user = AsyncMock(
-            return_value=MagicMock(user=MagicMock(id=USER_ID))
+    async def test_returns_500_on_db_error(self, aclient):
+        mock = make_mock_client(table_error=Exception("DB unavailable"))
+        override(mock)
+        response = await aclient.patch(
+            "/api/users/insurance-preference",
+            json={"insurance_type": "medicare"},
+            headers=AUTH_HEADER,
         )
-        mock.table.side_effect = Exception("DB unavailable")
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.patch(
-                    "/api/users/insurance-preference",
-                    json={"insurance_type": "medicare"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
 
         assert response.status_code == 500
 
@@ -583,14 +503,10 @@ _SETTINGS_ROW = {
 
 
 class TestGetSettings:
-    def test_get_settings_returns_current_values(self):
+    async def test_get_settings_returns_current_values(self, aclient):
         mock = make_mock_client(existing_user_data=[_SETTINGS_ROW])
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get("/api/users/settings", headers=AUTH_HEADER)
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get("/api/users/settings", headers=AUTH_HEADER)
 
         assert response.status_code == 200
         body = response.json()
@@ -598,25 +514,16 @@ class TestGetSettings:
         assert body["has_uterus"] is None
         assert body["journey_stage"] == "perimenopause"
 
-    def test_get_settings_requires_auth(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get("/api/users/settings")
-        finally:
-            cleanup()
+    async def test_get_settings_requires_auth(self, aclient, noop_mock):
+        override(noop_mock)
+        response = await aclient.get("/api/users/settings")
 
         assert response.status_code == 401
 
-    def test_get_settings_returns_404_when_no_user(self):
+    async def test_get_settings_returns_404_when_no_user(self, aclient):
         mock = make_mock_client(existing_user_data=[])
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.get("/api/users/settings", headers=AUTH_HEADER)
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.get("/api/users/settings", headers=AUTH_HEADER)
 
         assert response.status_code == 404
 
@@ -627,103 +534,79 @@ class TestGetSettings:
 
 
 class TestUpdateSettings:
-    def test_update_journey_stage(self):
+    async def test_update_journey_stage(self, aclient):
         updated_row = {**_SETTINGS_ROW, "journey_stage": "menopause"}
         mock = make_mock_client(update_data=[updated_row])
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.patch(
-                    "/api/users/settings",
-                    json={"journey_stage": "menopause"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.patch(
+            "/api/users/settings",
+            json={"journey_stage": "menopause"},
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 200
         assert response.json()["journey_stage"] == "menopause"
 
-    def test_update_period_tracking_disabled(self):
+    async def test_update_period_tracking_disabled(self, aclient):
         updated_row = {**_SETTINGS_ROW, "period_tracking_enabled": False}
         mock = make_mock_client(update_data=[updated_row])
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.patch(
-                    "/api/users/settings",
-                    json={"period_tracking_enabled": False},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.patch(
+            "/api/users/settings",
+            json={"period_tracking_enabled": False},
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 200
         assert response.json()["period_tracking_enabled"] is False
 
-    def test_update_has_uterus_false_disables_period_tracking(self):
+    async def test_update_has_uterus_false_disables_period_tracking(self, aclient):
         updated_row = {
             **_SETTINGS_ROW,
             "has_uterus": False,
             "period_tracking_enabled": False,
         }
         mock = make_mock_client(update_data=[updated_row])
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.patch(
-                    "/api/users/settings",
-                    json={"has_uterus": False},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.patch(
+            "/api/users/settings",
+            json={"has_uterus": False},
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 200
         body = response.json()
         assert body["has_uterus"] is False
         assert body["period_tracking_enabled"] is False
 
-    def test_update_settings_invalid_journey_stage_returns_422(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.patch(
-                    "/api/users/settings",
-                    json={"journey_stage": "not-a-real-stage"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+    async def test_update_settings_invalid_journey_stage_returns_422(
+        self, aclient, noop_mock
+    ):
+        override(noop_mock)
+        response = await aclient.patch(
+            "/api/users/settings",
+            json={"journey_stage": "not-a-real-stage"},
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 422
 
-    def test_update_settings_requires_auth(self):
-        mock = make_mock_client()
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.patch(
-                    "/api/users/settings",
-                    json={"journey_stage": "menopause"},
-                )
-        finally:
-            cleanup()
+    async def test_update_settings_requires_auth(self, aclient, noop_mock):
+        override(noop_mock)
+        response = await aclient.patch(
+            "/api/users/settings",
+            json={"journey_stage": "menopause"},
+        )
 
         assert response.status_code == 401
 
-    def test_update_settings_returns_404_when_no_user(self):
+    async def test_update_settings_returns_404_when_no_user(self, aclient):
         mock = make_mock_client(update_data=[])
-        cleanup = override(mock)
-        try:
-            with TestClient(app) as client:
-                response = client.patch(
-                    "/api/users/settings",
-                    json={"journey_stage": "menopause"},
-                    headers=AUTH_HEADER,
-                )
-        finally:
-            cleanup()
+        override(mock)
+        response = await aclient.patch(
+            "/api/users/settings",
+            json={"journey_stage": "menopause"},
+            headers=AUTH_HEADER,
+        )
 
         assert response.status_code == 404
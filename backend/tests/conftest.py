@@ -6,10 +6,19 @@ be set here — at the module level, before any `from app.*` import.
 
 import os
 
-os.environ.setdefault("SUPABASE_URL", "https://test.supabase.co")
-os.environ.setdefault("SUPABASE_SERVICE_KEY", "test-service-key")
-os.environ.setdefault("ANTHROPIC_API_KEY", "sk-ant-test")
-os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+_TEST_ENV = (
+    ("SUPABASE_URL", "https://test.supabase.co"),
+    ("SUPABASE_SERVICE_KEY", "test-service-key"),
+    ("ANTHROPIC_API_KEY", "sk-ant-test"),
+    ("OPENAI_API_KEY", "sk-test"),
+    # Overrides a developer's .env opting into the dev-only local backend
+    ("EMBEDDING_BACKEND", "openai"),
+    # Any outbound call a test forgets to mock fails within a second, not minutes
+    ("HTTP_TIMEOUT_SECONDS", "1"),
+)
+
+for _name, _value in _TEST_ENV:
+    os.environ.setdefault(_name, _value)
 
 # Import fixtures after env vars are set
 from tests.fixtures.supabase import (  # noqa: E402, F401
@@ -18,3 +27,28 @@ from tests.fixtures.supabase import (  # noqa: E402, F401
     setup_supabase_error,
     setup_supabase_not_found,
 )
+
+
+# Route tests run in-process against mocks; one slower than this is doing real
+# work somewhere (an unmocked client, a sleep, a retry) and is worth a look.
+SLOW_ROUTE_TEST_SECONDS = 0.5
+
+
+def pytest_terminal_summary(terminalreporter):
+    """List passed route tests whose call phase exceeded SLOW_ROUTE_TEST_SECONDS.
+
+    A warning only; it never fails the run. Lives in the root conftest so the
+    xdist controller, which collects nothing, still loads it.
+    """
+    slow = [
+        report
+        for report in terminalreporter.stats.get("passed", [])
+        if report.when == "call"
+        and report.nodeid.startswith("tests/api/routes/")
+        and report.duration > SLOW_ROUTE_TEST_SECONDS
+    ]
+    if not slow:
+        return
+    terminalreporter.section("slow route tests", yellow=True)
+    for report in sorted(slow, key=lambda r: r.duration, reverse=True):
+        terminalreporter.write_line(f"{report.duration:.2f}s {report.nodeid}")
@@ -0,0 +1,162 @@
+"""Mock Supabase client helpers and sample rows for provider route tests.
+
+The route tests are split per endpoint (tests/api/routes/test_providers_*.py);
+the helpers and sample data they share live here.
+"""
+
+from collections.abc import Callable, Mapping
+from itertools import chain, repeat
+from types import MappingProxyType, SimpleNamespace
+
+from app.api.dependencies import get_current_user_id
+from app.core.supabase import get_client
+from app.main import app
+
+# ---------------------------------------------------------------------------
+# Mock helpers
+# ---------------------------------------------------------------------------
+
+
+class MockQueryBuilder:
+    """Fluent builder mock: any chained query method returns self; execute() is async.
+
+    Unknown attributes resolve to a chainable no-op, so new Supabase chain
+    methods (.or_, .match, ...) need no stub here.
+    """
+
+    def __init__(self, data=None):
+        self._data = data if data is not None else []
+
+    def __getattr__(self, _name):
+        return lambda *_, **__: self
+
+    async def execute(self):
+        return SimpleNamespace(data=self._data)
+
+
+class StubClient:
+    """Supabase client stand-in exposing only table().
+
+    Each table(name) call returns a MockQueryBuilder over rows_for(name). A
+    plain class rather than a MagicMock, so building the mock for every test
+    and every table() call records nothing.
+    """
+
+    def __init__(self, rows_for: Callable[[str], list[dict]]):
+        self._rows_for = rows_for
+
+    def table(self, name: str) -> MockQueryBuilder:
+        return MockQueryBuilder(data=self._rows_for(name))
+
+
+def make_mock_client(
+    data=None, tables: dict[str, list[dict]] | None = None
+) -> StubClient:
+    """Build a mock client whose table queries return canned rows.
+
+    With tables, each table(name) call returns that table's rows, and querying
+    a table not listed fails the request, so wrong-table bugs surface. Without
+    it, every table query returns data.
+    """
+    if tables is None:
+        return StubClient(lambda _: data or [])
+    return StubClient(tables.__getitem__)
+
+
+def make_zip_mock_client(zip_data: list[dict], provider_data: list[dict]) -> StubClient:
+    """Build a mock client whose first table() call returns zip_data and subsequent
+    calls return provider_data. Used for testing zip_code lookup + main query."""
+    results = chain([zip_data], repeat(provider_data))
+    return StubClient(lambda _: next(results))
+
+
+def make_sequential_client(*responses: list[dict]) -> StubClient:
+    """Build a mock client where successive table() calls return successive responses.
+
+    Used for endpoints that make multiple DB queries (e.g., check-then-insert,
+    or fetch-shortlist-entries then fetch-provider-rows).
+    """
+    results = chain(responses, repeat([]))
+    return StubClient(lambda _: next(results))
+
+
+TEST_USER_ID = "test-user-uuid"
+
+
+def override(mock_client):
+    """Override the DB client only (public endpoints, or auth-rejection tests)."""
+    app.dependency_overrides[get_client] = lambda: mock_client
+
+
+def override_both(mock_client=None, user_id: str = TEST_USER_ID):
+    """Override auth as user_id and, when given, the DB client.
+
+    The single place route tests authenticate; keyed by the canonical
+    app.api.dependencies.get_current_user_id that CurrentUser depends on.
+    """
+    if mock_client is not None:
+        override(mock_client)
+    app.dependency_overrides[get_current_user_id] = lambda: user_id
+
+
+def send(
+    client, method: str, url: str, *, tables=None, data=None, auth=False, **kwargs
+):
+    """Install a mock DB client (plus auth when auth=True), then send one request.
+
+    tables/data are passed to make_mock_client; extra kwargs (json=...) go to
+    client.request.
+    """
+    mock_client = make_mock_client(data=data, tables=tables)
+    if auth:
+        override_both(mock_client)
+    else:
+        override(mock_client)
+    return client.request(method, url, **kwargs)
+
+
+# ---------------------------------------------------------------------------
+# Sample provider fixtures
+# ---------------------------------------------------------------------------
+
+# Read-only prototypes (nested values are tuples) so no test can mutate a base
+# that every other test spreads from with {**PROVIDER_MN, ...}.
+PROVIDER_MN = MappingProxyType(
+    {
+        "id": "uuid-1",
+        "name": "Dr. Jane Smith",
+        "credentials": "MD",
+        "practice_name": "Women's Health Clinic",
+        "city": "Minneapolis",
+        "state": "MN",
+        "zip_code": "55401",
+        "phone": "612-555-0100",
+        "website": "https://example.com",
+        "nams_certified": True,
+        "provider_type": "ob_gyn",
+        "specialties": ("menopause", "perimenopause"),
+        "insurance_accepted": ("Aetna", "Blue Cross"),
+        "data_source": "nams_directory",
+        "last_verified": "2026-01-15",
+    }
+)
+
+PROVIDER_MN_2 = MappingProxyType(
+    {
+        **PROVIDER_MN,
+        "id": "uuid-2",
+        "name": "Dr. Alice Johnson",
+        "city": "Rochester",
+        "insurance_accepted": ("Cigna", "United"),
+    }
+)
+
+
+def make_providers(n: int, base: Mapping = PROVIDER_MN) -> list[dict]:
+    """Build n distinct providers from base, for pagination/bulk tests.
+
+    Each copy is shallow; the nested tuples it shares with base are immutable.
+    """
+    return [
+        {**base, "id": f"uuid-{i}", "name": f"Dr. Provider {i:02d}"} for i in range(n)
+    ]
@@ -0,0 +1,22 @@
+"""Shared fixtures for RAG tests."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def reset_openai_client(monkeypatch):
+    """Drop the AsyncOpenAI client retrieval caches across calls.
+
+    Without this, a client cached by one test would shadow the AsyncOpenAI
+    patch applied by the next.
+    """
+    monkeypatch.setattr("app.rag.retrieval._openai", None)
+
+
+@pytest.fixture(autouse=True)
+def pin_openai_embedding_backend(monkeypatch):
+    """Run RAG tests on the OpenAI backend even if the shell exports EMBEDDING_BACKEND.
+
+    Tests covering the local backend opt in by setting it back to "local".
+    """
+    monkeypatch.setattr("app.core.config.settings.EMBEDDING_BACKEND", "openai")
@@ -0,0 +1,82 @@
+"""Tests for RAG ingestion chunking and storage."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.rag.ingest import chunk_document, iter_chunks, store_chunks
+
+# Three 39-char sentences; chunk_size=20 tokens (80 chars) fits two per chunk
+SENTENCES = [
+    "Hot flashes are a vasomotor symptom ok.",
+    "Night sweats often disrupt sleep badly.",
+    "Brain fog is reported by many women ok.",
+]
+TEXT = " ".join(SENTENCES)
+
+
+# ============================================================================
+# TestChunkDocument
+# ============================================================================
+
+
+class TestChunkDocument:
+    def test_when_overlap_fits_one_sentence_then_it_is_carried_over(self):
+        chunks = chunk_document(TEXT, "Title", "https://x", chunk_size=20, overlap=10)
+
+        assert [c["content"] for c in chunks] == [
+            " ".join(SENTENCES[:2]),
+            " ".join(SENTENCES[1:]),
+        ]
+        assert [c["chunk_index"] for c in chunks] == [0, 1]
+
+    def test_when_overlap_zero_then_no_sentence_repeated(self):
+        chunks = chunk_document(TEXT, "Title", "https://x", chunk_size=20, overlap=0)
+
+        assert [c["content"] for c in chunks] == [
+            " ".join(SENTENCES[:2]),
+            SENTENCES[2],
+        ]
+
+    def test_when_chunked_then_metadata_copied_to_every_chunk(self):
+        chunks = chunk_document(
+            TEXT, "Title", "https://x", chunk_size=20, section_name="Symptoms"
+        )
+
+        for chunk in chunks:
+            assert chunk["title"] == "Title"
+            assert chunk["source_url"] == "https://x"
+            assert chunk["section_name"] == "Symptoms"
+
+    def test_when_text_empty_then_no_chunks(self):
+        assert list(iter_chunks("   ", "Title", "https://x")) == []
+
+
+# ============================================================================
+# TestStoreChunks
+# ============================================================================
+
+
+class TestStoreChunks:
+    @pytest.fixture
+    def supabase(self, monkeypatch) -> MagicMock:
+        """Point ingest's get_client() at a mock and return the mock."""
+        mock_supabase = MagicMock()
+        mock_supabase.from_.return_value.insert.return_value.execute = AsyncMock()
+        monkeypatch.setattr(
+            "app.rag.ingest.get_client", AsyncMock(return_value=mock_supabase)
+        )
+        monkeypatch.setattr("app.rag.ingest.use_local_embeddings", lambda: False)
+        return mock_supabase
+
+    @pytest.mark.asyncio
+    async def test_when_stored_then_embedding_literal_keeps_five_significant_digits(
+        self, supabase
+    ):
+        chunk = chunk_document(TEXT, "Title", "https://x")[0]
+
+        await store_chunks([chunk], [[0.123456789, -0.5, 1.5e-7, 12.0]], "wiki")
+
+        supabase.from_.assert_called_once_with("rag_documents")
+        (rows,), _ = supabase.from_.return_value.insert.call_args
+        assert rows[0]["embedding"] == "[0.12346,-0.5,1.5e-07,12]"
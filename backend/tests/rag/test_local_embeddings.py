@@ -0,0 +1,45 @@
+"""Tests for the local sentence-transformers embedding backend."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.rag.local_embeddings import LOCAL_EMBEDDING_DIMENSIONS, embed_local
+
+
+def _use_model(monkeypatch, dimensions: int) -> MagicMock:
+    """Replace the lazily loaded model with one returning fixed-size vectors."""
+    model = MagicMock()
+    model.encode.side_effect = lambda texts, **_: MagicMock(
+        tolist=lambda: [[0.1] * dimensions for _ in texts]
+    )
+    monkeypatch.setattr("app.rag.local_embeddings._get_model", lambda: model)
+    return model
+
+
+@pytest.mark.asyncio
+async def test_embed_local_returns_one_vector_per_text(monkeypatch):
+    _use_model(monkeypatch, LOCAL_EMBEDDING_DIMENSIONS)
+
+    embeddings = await embed_local(["hot flashes", "night sweats"])
+
+    assert len(embeddings) == 2
+    assert all(len(v) == LOCAL_EMBEDDING_DIMENSIONS for v in embeddings)
+
+
+@pytest.mark.asyncio
+async def test_embed_local_rejects_unexpected_dimensions(monkeypatch):
+    # CATCHES: a swapped model writes vectors rag_documents_local cannot store,
+    # failing later at insert time with an opaque database error.
+    _use_model(monkeypatch, 768)
+
+    with pytest.raises(ValueError, match="768-dim"):
+        await embed_local(["hot flashes"])
+
+
+@pytest.mark.asyncio
+async def test_embed_local_skips_model_for_empty_input(monkeypatch):
+    model = _use_model(monkeypatch, LOCAL_EMBEDDING_DIMENSIONS)
+
+    assert await embed_local([]) == []
+    model.encode.assert_not_called()
@@ -1,9 +1,10 @@
 """Tests for RAG retrieval module."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
-from app.rag.retrieval import retrieve_relevant_chunks
+from app.rag.local_embeddings import LOCAL_EMBEDDING_DIMENSIONS
+from app.rag.retrieval import _openai_client, retrieve_relevant_chunks
 
 
 # ---------------------------------------------------------------------------
@@ -29,6 +30,27 @@ def _make_openai_mock() -> AsyncMock:
     return mock_openai
 
 
+@pytest.fixture
+def openai_factory(monkeypatch) -> MagicMock:
+    """Patch retrieval's _openai_client(); the factory returns _make_openai_mock()."""
+    factory = MagicMock(return_value=_make_openai_mock())
+    monkeypatch.setattr("app.rag.retrieval._openai_client", factory)
+    return factory
+
+
+@pytest.fixture
+def use_supabase(monkeypatch):
+    """Return a function that points retrieval's get_client() at a given mock."""
+
+    def _use(mock_supabase: MagicMock) -> MagicMock:
+        monkeypatch.setattr(
+            "app.rag.retrieval.get_client", AsyncMock(return_value=mock_supabase)
+        )
+        return mock_supabase
+
+    return _use
+
+
 # ---------------------------------------------------------------------------
 # Sample data: RPC returns similarity (not embedding)
 # ---------------------------------------------------------------------------
@@ -69,153 +91,179 @@ SAMPLE_DOCS = [
 # ============================================================================
 
 
+@pytest.mark.usefixtures("openai_factory")
 class TestRetrieveRelevantChunks:
     @pytest.mark.asyncio
-    async def test_when_rpc_returns_docs_then_returns_them(self):
-        with patch("app.rag.retrieval._openai_client") as mock_openai_class:
-            with patch(
-                "app.rag.retrieval.get_client", new_callable=AsyncMock
-            ) as mock_get_client:
-                mock_openai_class.return_value = _make_openai_mock()
-                mock_get_client.return_value = _make_supabase_mock(SAMPLE_DOCS)
+    async def test_when_rpc_returns_docs_then_returns_them(self, use_supabase):
+        use_supabase(_make_supabase_mock(SAMPLE_DOCS))
 
-                results = await retrieve_relevant_chunks("hot flashes")
+        results = await retrieve_relevant_chunks("hot flashes")
 
-                assert len(results) == 3
+        assert len(results) == 3
 
     @pytest.mark.asyncio
-    async def test_when_rpc_returns_no_docs_then_returns_empty_list(self):
-        with patch("app.rag.retrieval._openai_client") as mock_openai_class:
-            with patch(
-                "app.rag.retrieval.get_client", new_callable=AsyncMock
-            ) as mock_get_client:
-                mock_openai_class.return_value = _make_openai_mock()
-                mock_get_client.return_value = _make_supabase_mock([])
+    async def test_when_rpc_returns_no_docs_then_returns_empty_list(self, use_supabase):
+        use_supabase(_make_supabase_mock([]))
 
-                results = await retrieve_relevant_chunks("test query")
+        results = await retrieve_relevant_chunks("test query")
 
-                assert results == []
+        assert results == []
 
     @pytest.mark.asyncio
-    async def test_when_all_docs_below_min_similarity_then_returns_empty_list(self):
+    async def test_when_all_docs_below_min_similarity_then_returns_empty_list(
+        self, use_supabase
+    ):
         low_similarity_docs = [{**doc, "similarity": 0.10} for doc in SAMPLE_DOCS]
-        with patch("app.rag.retrieval._openai_client") as mock_openai_class:
-            with patch(
-                "app.rag.retrieval.get_client", new_callable=AsyncMock
-            ) as mock_get_client:
-                mock_openai_class.return_value = _make_openai_mock()
-                mock_get_client.return_value = _make_supabase_mock(low_similarity_docs)
+        use_supabase(_make_supabase_mock(low_similarity_docs))
 
-                results = await retrieve_relevant_chunks("test query")
+        results = await retrieve_relevant_chunks("test query")
 
-                assert results == []
+        assert results == []
 
     @pytest.mark.asyncio
-    async def test_when_mixed_similarity_then_only_above_threshold_returned(self):
+    async def test_when_mixed_similarity_then_only_above_threshold_returned(
+        self, use_supabase
+    ):
         mixed_docs = [
             {**SAMPLE_DOCS[0], "similarity": 0.80},  # above threshold
             {**SAMPLE_DOCS[1], "similarity": 0.20},  # below threshold (0.25)
             {**SAMPLE_DOCS[2], "similarity": 0.40},  # above threshold
         ]
-        with patch("app.rag.retrieval._openai_client") as mock_openai_class:
-            with patch(
-                "app.rag.retrieval.get_client", new_callable=AsyncMock
-            ) as mock_get_client:
-                mock_openai_class.return_value = _make_openai_mock()
-                mock_get_client.return_value = _make_supabase_mock(mixed_docs)
+        use_supabase(_make_supabase_mock(mixed_docs))
 
-                results = await retrieve_relevant_chunks("test query")
+        results = await retrieve_relevant_chunks("test query")
 
-                assert len(results) == 2
-                result_ids = {doc["id"] for doc in results}
-                assert "doc-1" in result_ids
-                assert "doc-3" in result_ids
-                assert "doc-2" not in result_ids
+        assert len(results) == 2
+        result_ids = {doc["id"] for doc in results}
+        assert "doc-1" in result_ids
+        assert "doc-3" in result_ids
+        assert "doc-2" not in result_ids
 
     @pytest.mark.asyncio
-    async def test_when_top_k_specified_then_rpc_called_with_match_count(self):
-        with patch("app.rag.retrieval._openai_client") as mock_openai_class:
-            with patch(
-                "app.rag.retrieval.get_client", new_callable=AsyncMock
-            ) as mock_get_client:
-                mock_openai_class.return_value = _make_openai_mock()
-                mock_supabase = _make_supabase_mock(SAMPLE_DOCS[:2])
-                mock_get_client.return_value = mock_supabase
-
-                await retrieve_relevant_chunks("hot flashes", top_k=2)
-
-                mock_supabase.rpc.assert_called_once_with(
-                    "match_rag_documents",
-                    {"query_embedding": "[0.1, 0.2, 0.3]", "match_count": 2},
-                )
+    async def test_when_top_k_specified_then_rpc_called_with_match_count(
+        self, use_supabase
+    ):
+        mock_supabase = use_supabase(_make_supabase_mock(SAMPLE_DOCS[:2]))
+
+        await retrieve_relevant_chunks("hot flashes", top_k=2)
+
+        mock_supabase.rpc.assert_called_once_with(
+            "match_rag_documents",
+            {"query_embedding": "[0.1, 0.2, 0.3]", "match_count": 2},
+        )
 
     @pytest.mark.asyncio
-    async def test_when_docs_returned_then_response_structure_complete(self):
-        with patch("app.rag.retrieval._openai_client") as mock_openai_class:
-            with patch(
-                "app.rag.retrieval.get_client", new_callable=AsyncMock
-            ) as mock_get_client:
-                mock_openai_class.return_value = _make_openai_mock()
-                mock_get_client.return_value = _make_supabase_mock(SAMPLE_DOCS[:1])
-
-                results = await retrieve_relevant_chunks("test query")
-
-                assert len(results) == 1
-                doc = results[0]
-                assert "id" in doc
-                assert "content" in doc
-                assert "title" in doc
-                assert "source_url" in doc
-                assert "source_type" in doc
-                assert "section_name" in doc
-                assert "similarity" in doc
+    async def test_when_docs_returned_then_response_structure_complete(
+        self, use_supabase
+    ):
+        use_supabase(_make_supabase_mock(SAMPLE_DOCS[:1]))
+
+        results = await retrieve_relevant_chunks("test query")
+
+        assert len(results) == 1
+        doc = results[0]
+        assert "id" in doc
+        assert "content" in doc
+        assert "title" in doc
+        assert "source_url" in doc
+        assert "source_type" in doc
+        assert "section_name" in doc
+        assert "similarity" in doc
 
     @pytest.mark.asyncio
-    async def test_when_openai_fails_then_raises(self):
-        with patch("app.rag.retrieval._openai_client") as mock_openai_class:
-            mock_openai = AsyncMock()
-            mock_openai_class.return_value = mock_openai
-            mock_openai.embeddings.create.side_effect = Exception("OpenAI API error")
+    async def test_when_openai_fails_then_raises(self, openai_factory):
+        mock_openai = openai_factory.return_value
+        mock_openai.embeddings.create.side_effect = Exception("OpenAI API error")
 
-            with pytest.raises(Exception, match="OpenAI API error"):
-                await retrieve_relevant_chunks("test query")
+        with pytest.raises(Exception, match="OpenAI API error"):
+            await retrieve_relevant_chunks("test query")
 
     @pytest.mark.asyncio
-    async def test_when_supabase_rpc_fails_then_raises(self):
-        with patch("app.rag.retrieval._openai_client") as mock_openai_class:
-            with patch(
-                "app.rag.retrieval.get_client", new_callable=AsyncMock
-            ) as mock_get_client:
-                mock_openai_class.return_value = _make_openai_mock()
-
-                mock_supabase = MagicMock()
-                mock_rpc = MagicMock()
-                mock_rpc.execute = AsyncMock(
-                    side_effect=Exception("Supabase RPC error")
-                )
-                mock_supabase.rpc.return_value = mock_rpc
-                mock_get_client.return_value = mock_supabase
-
-                with pytest.raises(Exception, match="Supabase RPC error"):
-                    await retrieve_relevant_chunks("test query")
+    async def test_when_supabase_rpc_fails_then_raises(self, use_supabase):
+        mock_supabase = MagicMock()
+        mock_rpc = MagicMock()
+        mock_rpc.execute = AsyncMock(side_effect=Exception("Supabase RPC error"))
+        mock_supabase.rpc.return_value = mock_rpc
+        use_supabase(mock_supabase)
+
+        with pytest.raises(Exception, match="Supabase RPC error"):
+            await retrieve_relevant_chunks("test query")
 
     @pytest.mark.asyncio
-    async def test_when_custom_min_similarity_then_threshold_applied(self):
+    async def test_when_custom_min_similarity_then_threshold_applied(
+        self, use_supabase
+    ):
         docs = [
             {**SAMPLE_DOCS[0], "similarity": 0.60},
             {**SAMPLE_DOCS[1], "similarity": 0.45},
         ]
-        with patch("app.rag.retrieval._openai_client") as mock_openai_class:
-            with patch(
-                "app.rag.retrieval.get_client", new_callable=AsyncMock
-            ) as mock_get_client:
-                mock_openai_class.return_value = _make_openai_mock()
-                mock_get_client.return_value = _make_supabase_mock(docs)
-
-                # With a high threshold, only doc-1 (0.60) should pass
-                results = await retrieve_relevant_chunks(
-                    "test query", min_similarity=0.55
-                )
-
-                assert len(results) == 1
-                assert results[0]["id"] == "doc-1"
+        use_supabase(_make_supabase_mock(docs))
+
+        # With a high threshold, only doc-1 (0.60) should pass
+        results = await retrieve_relevant_chunks("test query", min_similarity=0.55)
+
+        assert len(results) == 1
+        assert results[0]["id"] == "doc-1"
+
+
+# ============================================================================
+# TestOpenAIClient
+# ============================================================================
+
+
+class TestOpenAIClient:
+    def test_when_called_twice_then_same_client_reused(self, monkeypatch):
+        mock_openai_class = MagicMock()
+        monkeypatch.setattr("app.rag.retrieval.AsyncOpenAI", mock_openai_class)
+
+        first = _openai_client()
+        second = _openai_client()
+
+        assert first is second
+        mock_openai_class.assert_called_once()
+
+
+# ============================================================================
+# TestLocalEmbeddingBackend
+# ============================================================================
+
+
+class TestLocalEmbeddingBackend:
+    @pytest.mark.asyncio
+    async def test_when_backend_local_then_embeds_locally_and_queries_local_table(
+        self, monkeypatch, openai_factory, use_supabase
+    ):
+        monkeypatch.setattr("app.core.config.settings.EMBEDDING_BACKEND", "local")
+        mock_embed_local = AsyncMock(return_value=[[0.1, 0.2, 0.3]])
+        monkeypatch.setattr("app.rag.retrieval.embed_local", mock_embed_local)
+        mock_supabase = use_supabase(_make_supabase_mock(SAMPLE_DOCS))
+
+        results = await retrieve_relevant_chunks("hot flashes")
+
+        assert len(results) == 3
+        mock_embed_local.assert_awaited_once_with(["hot flashes"])
+        openai_factory.assert_not_called()
+        assert mock_supabase.rpc.call_args[0][0] == "match_rag_documents_local"
+
+    @pytest.mark.asyncio
+    async def test_when_backend_local_then_query_embedded_by_local_model(
+        self, monkeypatch, openai_factory, use_supabase
+    ):
+        monkeypatch.setattr("app.core.config.settings.EMBEDDING_BACKEND", "local")
+        model = MagicMock()
+        model.encode.return_value = MagicMock(
+            tolist=lambda: [[0.1] * LOCAL_EMBEDDING_DIMENSIONS]
+        )
+        monkeypatch.setattr("app.rag.local_embeddings._get_model", lambda: model)
+        mock_supabase = use_supabase(_make_supabase_mock(SAMPLE_DOCS))
+
+        results = await retrieve_relevant_chunks("hot flashes")
+
+        assert len(results) == 3
+        model.encode.assert_called_once_with(["hot flashes"], normalize_embeddings=True)
+        openai_factory.assert_not_called()
+        rpc_name, rpc_params = mock_supabase.rpc.call_args[0]
+        assert rpc_name == "match_rag_documents_local"
+        assert (
+            rpc_params["query_embedding"].count(",") == LOCAL_EMBEDDING_DIMENSIONS - 1
+        )
@@ -4,6 +4,7 @@ Tests ask(), get_suggested_prompts(), list_conversations(), get_conversation(),
 and delete_conversation() in isolation — all dependencies are mocked.
 """
 
+import asyncio
 import json
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
@@ -213,6 +214,56 @@ async def test_ask_deduplicates_chunks(
     assert len(call_args[1]) == 2
 
 
+@pytest.mark.asyncio
+async def test_ask_retrieves_chunks_concurrently_with_user_context(
+    service, mock_user_repo, mock_rag_retriever
+):
+    # CATCHES: RAG retrieval is serialized behind the user-context DB read, adding
+    # the embedding + pgvector round-trips to every request's latency.
+    retrieval_started = asyncio.Event()
+
+    async def get_context(user_id):
+        await asyncio.wait_for(retrieval_started.wait(), timeout=1)
+        return ("perimenopause", 48)
+
+    async def retrieve(query, top_k):
+        retrieval_started.set()
+        return SAMPLE_CHUNKS
+
+    mock_user_repo.get_context.side_effect = get_context
+    mock_rag_retriever.side_effect = retrieve
+
+    result = await service.ask(USER_ID, "What causes hot flashes?")
+
+    assert result.message == LLM_RESPONSE
+
+
+@pytest.mark.asyncio
+async def test_ask_retrieves_chunks_concurrently_with_conversation_load(
+    service, mock_conversation_repo, mock_rag_retriever, mock_citation_service
+):
+    # CATCHES: retrieval is awaited before the conversation load starts, so the
+    # load's round-trip is added on top of the embedding + pgvector latency.
+    load_started = asyncio.Event()
+
+    async def load(conversation_id, user_id):
+        load_started.set()
+        return []
+
+    async def retrieve(query, top_k):
+        await asyncio.wait_for(load_started.wait(), timeout=1)
+        return SAMPLE_CHUNKS
+
+    mock_conversation_repo.load.side_effect = load
+    mock_rag_retriever.side_effect = retrieve
+
+    await service.ask(USER_ID, "What causes hot flashes?", CONVERSATION_UUID)
+
+    # Retrieval fails over to [] if it times out waiting for the load
+    rendered_chunks = mock_citation_service.render_structured_response.call_args[0][1]
+    assert len(rendered_chunks) == len(SAMPLE_CHUNKS)
+
+
 # ---------------------------------------------------------------------------
 # ask() — error handling
 # ---------------------------------------------------------------------------
@@ -230,6 +281,54 @@ async def test_ask_raises_database_error_when_user_context_fails(
         await service.ask(USER_ID, "What causes hot flashes?")
 
 
+@pytest.mark.asyncio
+async def test_ask_cancels_retrieval_when_user_context_fails(
+    service, mock_user_repo, mock_rag_retriever
+):
+    # CATCHES: a failed required fetch leaves the RAG embedding call running in
+    # the background after the request has already errored.
+    retrieval_cancelled = asyncio.Event()
+
+    async def retrieve(query, top_k):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            retrieval_cancelled.set()
+            raise
+
+    mock_user_repo.get_context.side_effect = Exception("DB connection error")
+    mock_rag_retriever.side_effect = retrieve
+
+    with pytest.raises(DatabaseError, match="Failed to fetch user context"):
+        await service.ask(USER_ID, "What causes hot flashes?")
+
+    await asyncio.wait_for(retrieval_cancelled.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_ask_cancels_retrieval_when_conversation_not_found(
+    service, mock_conversation_repo, mock_rag_retriever
+):
+    # CATCHES: an unknown conversation_id waits out the full embedding + RPC
+    # round-trip before its 404 instead of abandoning retrieval.
+    retrieval_cancelled = asyncio.Event()
+
+    async def retrieve(query, top_k):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            retrieval_cancelled.set()
+            raise
+
+    mock_conversation_repo.load.side_effect = EntityNotFoundError("Not found")
+    mock_rag_retriever.side_effect = retrieve
+
+    with pytest.raises(EntityNotFoundError):
+        await service.ask(USER_ID, "What causes hot flashes?", CONVERSATION_UUID)
+
+    await asyncio.wait_for(retrieval_cancelled.wait(), timeout=1)
+
+
 @pytest.mark.asyncio
 async def test_ask_raises_database_error_when_symptom_summary_fails(
     service, mock_symptoms_repo
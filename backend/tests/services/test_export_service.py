@@ -1,5 +1,6 @@
 """Tests for ExportService."""
 
+import asyncio
 from datetime import date
 from unittest.mock import AsyncMock, MagicMock
 
@@ -15,6 +16,7 @@ START = date(2026, 1, 1)
 END = date(2026, 1, 31)
 USER_ID = "user-test-123"
 SIGNED_URL = "https://storage.example.com/export.pdf"
+_CSV_HEADER = "date,symptoms,free_text_notes"
 
 
 def _make_request(start=START, end=END):
@@ -163,6 +165,38 @@ class TestExportAsPdf:
         mock_llm_service.generate_symptom_summary.assert_called_once()
         mock_llm_service.generate_provider_questions.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_llm_calls_run_concurrently(self, service, mock_llm_service):
+        # Summary waits for the questions call to start; if the two were awaited
+        # in sequence this would time out instead of completing.
+        questions_started = asyncio.Event()
+
+        async def generate_summary(*args):
+            await asyncio.wait_for(questions_started.wait(), timeout=1)
+            return "AI-generated summary of symptoms."
+
+        async def generate_questions(*args):
+            questions_started.set()
+            return ["Ask about HRT"]
+
+        mock_llm_service.generate_symptom_summary.side_effect = generate_summary
+        mock_llm_service.generate_provider_questions.side_effect = generate_questions
+
+        result = await service.export_as_pdf(USER_ID, _make_request())
+
+        assert isinstance(result, ExportResponse)
+
+    @pytest.mark.asyncio
+    async def test_raises_database_error_when_questions_llm_fails(
+        self, service, mock_llm_service
+    ):
+        mock_llm_service.generate_provider_questions.side_effect = Exception(
+            "LLM unavailable"
+        )
+
+        with pytest.raises(DatabaseError, match="AI content"):
+            await service.export_as_pdf(USER_ID, _make_request())
+
     @pytest.mark.asyncio
     async def test_calls_pdf_service(self, service, mock_pdf_service):
         await service.export_as_pdf(USER_ID, _make_request())
@@ -266,10 +300,7 @@ class TestExportAsCsv:
         await service.export_as_csv(USER_ID, _make_request())
 
         uploaded_bytes = mock_storage_service.upload_file.call_args[1]["content"]
-        csv_text = uploaded_bytes.decode()
-        assert "date" in csv_text
-        assert "symptoms" in csv_text
-        assert "free_text_notes" in csv_text
+        assert uploaded_bytes.decode().splitlines()[0] == _CSV_HEADER
 
     @pytest.mark.asyncio
     async def test_csv_contains_log_rows(self, service, mock_storage_service):
@@ -6,6 +6,7 @@ Covers success paths, error handling, and edge cases.
 
 import pytest
 from unittest.mock import AsyncMock, MagicMock
+from openai import NOT_GIVEN
 
 from app.services.openai_provider import OpenAIProvider
 
@@ -314,8 +315,22 @@ class TestOpenAIProviderChatCompletion:
 
         OpenAIProvider(api_key="sk-secret-key-123")
 
-        # Verify AsyncOpenAI was initialized with the key
-        mock_openai_class.assert_called_once_with(api_key="sk-secret-key-123")
+        # Verify AsyncOpenAI was initialized with the key and the SDK's default timeout
+        mock_openai_class.assert_called_once_with(
+            api_key="sk-secret-key-123", timeout=NOT_GIVEN
+        )
+
+    def test_timeout_is_passed_to_client(self, mock_openai_client, monkeypatch):
+        """An explicit timeout is forwarded to AsyncOpenAI."""
+        mock_openai_class = MagicMock(return_value=mock_openai_client)
+        monkeypatch.setattr(
+            "app.services.openai_provider.AsyncOpenAI",
+            mock_openai_class,
+        )
+
+        OpenAIProvider(api_key="sk-test", timeout=1.0)
+
+        mock_openai_class.assert_called_once_with(api_key="sk-test", timeout=1.0)
 
     @pytest.mark.asyncio
     async def test_chat_completion_model_field_is_set(self, provider):
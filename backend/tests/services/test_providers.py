@@ -0,0 +1,168 @@
+"""Unit tests for app.services.providers — pure search/filter functions.
+
+Called directly, with no TestClient or mocked Supabase in between; the route
+tests in tests/api/routes/test_providers_*.py cover the HTTP contract.
+"""
+
+from app.models.providers import CallingScriptRequest, InsuranceType
+from app.services.providers import (
+    aggregate_states,
+    assemble_calling_script_prompts,
+    collect_insurance_options,
+    filter_and_paginate,
+)
+
+# ---------------------------------------------------------------------------
+# Shared fixtures
+# ---------------------------------------------------------------------------
+
+BASE_ROW = {
+    "id": "uuid-1",
+    "name": "Dr. Jane Smith",
+    "city": "Minneapolis",
+    "state": "MN",
+    "nams_certified": True,
+    "insurance_accepted": ["Aetna", "Blue Cross"],
+}
+
+
+def row(**overrides) -> dict:
+    return {**BASE_ROW, **overrides}
+
+
+def search(providers, *, city=None, insurance=None, page=1, page_size=20):
+    return filter_and_paginate(
+        providers, city=city, insurance=insurance, page=page, page_size=page_size
+    )
+
+
+# ---------------------------------------------------------------------------
+# filter_and_paginate
+# ---------------------------------------------------------------------------
+
+
+class TestFilterAndPaginate:
+    def test_city_exact_match_wins_over_substring(self):
+        providers = [
+            row(id="uuid-1", city="Minneapolis"),
+            row(id="uuid-2", city="North Minneapolis"),
+        ]
+
+        result = search(providers, city="  minneapolis ")
+
+        assert [p.id for p in result.providers] == ["uuid-1"]
+
+    def test_city_falls_back_to_substring_match(self):
+        providers = [
+            row(id="uuid-1", city="Minneapolis"),
+            row(id="uuid-2", city="Duluth"),
+        ]
+
+        result = search(providers, city="minnea")
+
+        assert [p.id for p in result.providers] == ["uuid-1"]
+
+    def test_insurance_is_case_insensitive_substring(self):
+        providers = [
+            row(id="uuid-1", insurance_accepted=["Aetna"]),
+            row(id="uuid-2", insurance_accepted=["Cigna"]),
+            row(id="uuid-3", insurance_accepted=None),
+        ]
+
+        result = search(providers, insurance="AET")
+
+        assert [p.id for p in result.providers] == ["uuid-1"]
+
+    def test_nams_certified_first_then_alphabetical(self):
+        providers = [
+            row(id="uuid-1", name="dr. zed", nams_certified=False),
+            row(id="uuid-2", name="Dr. Young", nams_certified=True),
+            row(id="uuid-3", name="Dr. Adams", nams_certified=False),
+        ]
+
+        result = search(providers)
+
+        assert [p.id for p in result.providers] == ["uuid-2", "uuid-3", "uuid-1"]
+
+    def test_page_slice_and_counts(self):
+        providers = [row(id=f"uuid-{i}", name=f"Dr. {i:02d}") for i in range(5)]
+
+        result = search(providers, page=3, page_size=2)
+
+        assert [p.id for p in result.providers] == ["uuid-4"]
+        assert result.total == 5
+        assert result.total_pages == 3
+
+    def test_empty_input_reports_one_page(self):
+        result = search([])
+
+        assert result.providers == []
+        assert result.total == 0
+        assert result.total_pages == 1
+
+
+# ---------------------------------------------------------------------------
+# aggregate_states / collect_insurance_options
+# ---------------------------------------------------------------------------
+
+
+class TestAggregateStates:
+    def test_counts_sorted_by_state_and_skips_missing(self):
+        rows = [{"state": "MN"}, {"state": "CA"}, {"state": "MN"}, {"state": None}]
+
+        assert aggregate_states(rows) == [
+            {"state": "CA", "count": 1},
+            {"state": "MN", "count": 2},
+        ]
+
+
+class TestCollectInsuranceOptions:
+    def test_flattens_deduplicates_and_sorts(self):
+        rows = [
+            {"insurance_accepted": ["Cigna", "Aetna"]},
+            {"insurance_accepted": ["Aetna", ""]},
+            {"insurance_accepted": None},
+        ]
+
+        assert collect_insurance_options(rows) == ["Aetna", "Cigna"]
+
+
+# ---------------------------------------------------------------------------
+# assemble_calling_script_prompts
+# ---------------------------------------------------------------------------
+
+
+class TestAssembleCallingScriptPrompts:
+    def _request(self, **overrides) -> CallingScriptRequest:
+        fields = {
+            "provider_id": "uuid-1",
+            "provider_name": "Dr. Jane Smith",
+            "insurance_type": InsuranceType.private,
+            "insurance_plan_name": "Blue Cross",
+            "insurance_plan_unknown": False,
+            "interested_in_telehealth": False,
+        }
+        return CallingScriptRequest(**{**fields, **overrides})
+
+    def test_known_private_plan_is_named(self):
+        _, user_prompt = assemble_calling_script_prompts(self._request())
+
+        assert "Does the provider accept Blue Cross insurance?" in user_prompt
+        assert "Dr. Jane Smith's office" in user_prompt
+
+    def test_unknown_plan_asks_which_plans_are_accepted(self):
+        _, user_prompt = assemble_calling_script_prompts(
+            self._request(insurance_plan_unknown=True)
+        )
+
+        assert "Blue Cross" not in user_prompt
+        assert "What insurance plans does the provider accept?" in user_prompt
+
+    def test_telehealth_question_only_when_interested(self):
+        _, without = assemble_calling_script_prompts(self._request())
+        _, with_telehealth = assemble_calling_script_prompts(
+            self._request(interested_in_telehealth=True)
+        )
+
+        assert "telehealth" not in without
+        assert "4. Does the provider offer telehealth appointments?" in with_telehealth